@@ -1,7 +1,7 @@
 from pydantic_settings import BaseSettings
 from pydantic import Field
 from functools import lru_cache
-from typing import List
+from typing import Dict, List, Literal
 import os
 
 
@@ -22,12 +22,59 @@ class Settings(BaseSettings):
     # MongoDB
     MONGO_URI: str = Field(..., description="MongoDB connection string")
     MONGO_DB_NAME: str = "job_portal"
+    MONGO_EXECUTOR_WORKERS: int = 32  # Threads for blocking pymongo calls from async handlers
+
+    # Expiry (0 = keep forever)
+    APPROVED_JOB_TTL_DAYS: int = 0  # Approved jobs are unpublished and deleted this long after approval
+    REJECTED_JOB_TTL_DAYS: int = 0  # Rejected jobs expire (TTL index) this long after rejection
+    JOB_EXPIRY_SWEEP_MINUTES: int = 60  # How often expired approved jobs are swept
+
+    # Read preferences (replica sets): primary, primaryPreferred, secondary,
+    # secondaryPreferred or nearest. Max staleness must be 0 (unbounded) or >= 90.
+    PUBLIC_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "secondaryPreferred"
+    PUBLIC_MAX_STALENESS_SECONDS: int = 120
+    ADMIN_READ_PREFERENCE: Literal[
+        "primary", "primaryPreferred", "secondary", "secondaryPreferred", "nearest"
+    ] = "primary"
+    ADMIN_MAX_STALENESS_SECONDS: int = 0
+
+    # Moderation
+    MODERATION_CHUNK_SIZE: int = 1000  # Jobs per server-side chunk in approve/reject-by-filter
+    AUDIT_QUEUE_SIZE: int = 10000  # Entries buffered per worker before new ones are dropped
+    AUDIT_BATCH_SIZE: int = 500  # Entries per insert_many (a full batch flushes early)
+    AUDIT_FLUSH_SECONDS: float = 2.0
+    AUDIT_RETENTION_DAYS: int = 0  # Audit entries expire after this long (0 = keep)
+    REVIEW_LEASE_SECONDS: int = 900  # How long /admin/queue/next reserves jobs for a reviewer
+    # Source part of review_priority (0-100, with freshness, salary and repost signals)
+    REVIEW_SOURCE_WEIGHTS: Dict[str, int] = {
+        "amazon": 40, "adobe": 40, "flipkart": 30, "swiggy": 30, "zoho": 30, "indeed": 10,
+    }
+    REVIEW_DEFAULT_SOURCE_WEIGHT: int = 20
+    STATS_RECONCILE_MINUTES: int = 60  # Recount /admin/stats counters (corrects drift, e.g. TTL expiry)
+    JOB_METRICS_RETENTION_DAYS: int = 0  # Hourly volume buckets expire after this long (0 = keep)
+    TIMESERIES_MAX_POINTS: int = 5000  # Largest /admin/stats/timeseries response
+
+    # Auto-moderation
+    AUTOMOD_ENABLED: bool = False  # Scheduled runs; /admin/automod/run works regardless
+    AUTOMOD_INTERVAL_MINUTES: int = 5
+    AUTOMOD_BATCH_SIZE: int = 500
+    AUTOMOD_MAX_BATCHES: int = 20  # Per scheduled run
+    AUTOMOD_TRUSTED_SOURCES: List[str] = ["amazon", "adobe"]
+    AUTOMOD_APPROVE_SCORE: int = 50  # Approve at or above
+    AUTOMOD_REJECT_SCORE: int = -50  # Reject at or below; in between waits for a human
 
     # JWT Authentication
     JWT_SECRET_KEY: str = Field(..., description="Secret key for JWT signing")
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    # Authenticated users cached per worker; other workers see revocations within the TTL
+    USER_CACHE_TTL_SECONDS: int = 60
+    USER_CACHE_MAX_ENTRIES: int = 10000
+    PASSWORD_HASH_WORKERS: int = 4  # bcrypt threads, separate from the database pool
+    PASSWORD_HASH_MAX_PENDING: int = 64  # Queued or running bcrypt calls before 503
 
     # MinIO Storage (optional)
     MINIO_ENDPOINT: str = "localhost:9000"
@@ -39,6 +86,44 @@ class Settings(BaseSettings):
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = 60
 
+    # Responses
+    FAST_JSON_RESPONSES: bool = False  # orjson serialization without response re-validation
+
+    # Search Facets
+    FACET_CACHE_TTL_SECONDS: int = 300
+    FACET_CACHE_MAX_ENTRIES: int = 256
+    FACET_CACHE_POPULAR_THRESHOLD: int = 3  # Cache filtered facets after this many requests
+    FACET_LIMIT: int = 20  # Max buckets returned per facet
+
+    # Job Detail Cache
+    JOB_CACHE_TTL_SECONDS: int = 120
+    JOB_CACHE_MAX_ENTRIES: int = 2000
+    JOB_CACHE_MAX_BYTES: int = 32 * 1024 * 1024  # Serialized size budget for cached documents
+    JOB_NEGATIVE_CACHE_TTL_SECONDS: int = 30  # Remember unknown job IDs this long
+    JOB_NEGATIVE_CACHE_MAX_ENTRIES: int = 10000
+
+    # Similar Jobs
+    SIMILAR_DIMENSIONS: int = 512  # Hashed TF-IDF vector width (float32, 2 KB per job)
+    SIMILAR_REBUILD_MINUTES: int = 60  # Re-weights all vectors with current IDF
+    SIMILAR_CACHE_TTL_SECONDS: int = 600
+    SIMILAR_CACHE_MAX_ENTRIES: int = 1000
+
+    # Bulk Export
+    EXPORT_BATCH_SIZE: int = 1000  # Documents per cursor batch for /jobs/export
+
+    # Change Feed
+    CHANGE_FEED_SETTLE_SECONDS: int = 5  # Hold back entries this recent (in-flight writers)
+    CHANGE_FEED_RETENTION_DAYS: int = 30  # Delete tombstones kept this long
+    CHANGE_FEED_COMPACT_MINUTES: int = 60
+
+    # Typeahead Suggestions
+    SUGGEST_REBUILD_MINUTES: int = 30  # Full rebuild picks up approvals from other workers
+
+    # Saved Searches
+    SAVED_SEARCH_MAX_PER_USER: int = 25
+    SAVED_SEARCH_MATCH_BATCH_SIZE: int = 500  # Matches per insert_many
+    SAVED_SEARCH_REBUILD_MINUTES: int = 30  # Full reload picks up deletions from other workers
+
     # Scraper Configuration
     BACKEND_URL: str = "http://127.0.0.1:8000"
 
@@ -1,38 +1,80 @@
 """
 Database connection and collection management.
 """
-from pymongo import MongoClient, ASCENDING, TEXT
+from pymongo import MongoClient, ASCENDING, DESCENDING, TEXT, GEOSPHERE
+from pymongo.client_session import ClientSession
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.read_preferences import (
+    Nearest,
+    Primary,
+    PrimaryPreferred,
+    Secondary,
+    SecondaryPreferred,
+)
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, Literal, Optional, TypeVar
+import asyncio
 import certifi
+import functools
 import logging
-from typing import Optional
+import threading
 
 from app.config import get_settings
+from app.utils.cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 # Module-level connection instances (lazy initialization)
 _client: Optional[MongoClient] = None
 _db: Optional[Database] = None
+_lock = threading.Lock()
+
+# Dedicated pool for blocking pymongo calls made from async handlers
+_executor: Optional[ThreadPoolExecutor] = None
+
+# Who is reading: "primary" for writes/strong reads, "public" for anonymous
+# browsing, "admin" for moderation dashboards (see PUBLIC_/ADMIN_READ_PREFERENCE)
+ReadTarget = Literal["primary", "public", "admin"]
+
+_READ_MODES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+_read_preferences: Dict[str, Any] = {}
+
+# Last (cluster_time, operation_time) observed per admin, so reads in later
+# requests see that admin's own writes even when served by a secondary
+_causal_tokens = TTLCache(maxsize=1024, ttl=3600)
 
 
 def get_client() -> MongoClient:
-    """Get or create MongoDB client instance."""
+    """Get or create MongoDB client instance (thread-safe)."""
     global _client
     if _client is None:
-        settings = get_settings()
-        logger.info("Initializing MongoDB connection...")
-        _client = MongoClient(
-            settings.MONGO_URI,
-            tlsCAFile=certifi.where(),
-            serverSelectionTimeoutMS=5000,
-            connectTimeoutMS=5000,
-            socketTimeoutMS=30000,
-        )
-        # Verify connection
-        _client.admin.command("ping")
-        logger.info("MongoDB connection established successfully")
+        with _lock:
+            if _client is None:
+                settings = get_settings()
+                logger.info("Initializing MongoDB connection...")
+                client = MongoClient(
+                    settings.MONGO_URI,
+                    tlsCAFile=certifi.where(),
+                    serverSelectionTimeoutMS=5000,
+                    connectTimeoutMS=5000,
+                    socketTimeoutMS=30000,
+                    maxPoolSize=max(100, settings.MONGO_EXECUTOR_WORKERS),
+                    tz_aware=True,  # Timestamps are stored as UTC BSON dates
+                )
+                # Verify connection
+                client.admin.command("ping")
+                _client = client
+                logger.info("MongoDB connection established successfully")
     return _client
 
 
@@ -45,9 +87,48 @@ def get_db() -> Database:
     return _db
 
 
+def get_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for database calls."""
+    global _executor
+    if _executor is None:
+        with _lock:
+            if _executor is None:
+                settings = get_settings()
+                _executor = ThreadPoolExecutor(
+                    max_workers=settings.MONGO_EXECUTOR_WORKERS,
+                    thread_name_prefix="mongo",
+                )
+    return _executor
+
+
+async def run_db(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """
+    Run a blocking database call without blocking the event loop.
+
+    pymongo is synchronous; every call made from an async route handler
+    goes through this bounded pool so one slow query no longer stalls all
+    other requests served by the worker.
+
+    Usage:
+        total = await run_db(collection.count_documents, filter_q)
+        docs = await run_db(lambda: list(collection.find(filter_q).limit(20)))
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(get_executor(), functools.partial(fn, *args, **kwargs))
+
+
+async def disconnect_db() -> None:
+    """Drain in-flight database calls and close the client off the event loop."""
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, close_db)
+
+
 def close_db() -> None:
-    """Close database connection."""
-    global _client, _db
+    """Close database connection and shut down the database thread pool."""
+    global _client, _db, _executor
+    if _executor is not None:
+        _executor.shutdown(wait=True)
+        _executor = None
     if _client is not None:
         logger.info("Closing MongoDB connection...")
         _client.close()
@@ -55,28 +136,143 @@ def close_db() -> None:
         _db = None
 
 
+# ===========================================
+# Read Preferences
+# ===========================================
+
+def _build_read_preference(mode: str, max_staleness_seconds: int):
+    """Build a pymongo read preference; max staleness applies to non-primary modes."""
+    if mode == "primary":
+        return Primary()
+    return _READ_MODES[mode](max_staleness=max_staleness_seconds if max_staleness_seconds > 0 else -1)
+
+
+def get_read_preference(read: ReadTarget):
+    """Get the configured read preference for a kind of reader."""
+    pref = _read_preferences.get(read)
+    if pref is None:
+        settings = get_settings()
+        if read == "public":
+            pref = _build_read_preference(
+                settings.PUBLIC_READ_PREFERENCE, settings.PUBLIC_MAX_STALENESS_SECONDS
+            )
+        elif read == "admin":
+            pref = _build_read_preference(
+                settings.ADMIN_READ_PREFERENCE, settings.ADMIN_MAX_STALENESS_SECONDS
+            )
+        else:
+            pref = Primary()
+        _read_preferences[read] = pref
+    return pref
+
+
+def _collection(name: str, read: ReadTarget) -> Collection:
+    if read == "primary":
+        return get_db()[name]
+    return get_db().get_collection(name, read_preference=get_read_preference(read))
+
+
+@contextmanager
+def causal_session(actor: str) -> Iterator[ClientSession]:
+    """
+    Causally consistent session for an admin's requests.
+
+    The session is advanced to the cluster/operation time of the actor's
+    previous writes (from earlier requests handled by this process), so
+    admin reads routed to secondaries still reflect the jobs that admin
+    just approved or rejected. Pass the session to every operation.
+
+    Usage:
+        with causal_session(current_user.username) as session:
+            await run_db(pending.find_one, {"_id": oid}, session=session)
+    """
+    with get_client().start_session(causal_consistency=True) as session:
+        token = _causal_tokens.get(actor)
+        if token is not None:
+            cluster_time, operation_time = token
+            if cluster_time is not None:
+                session.advance_cluster_time(cluster_time)
+            if operation_time is not None:
+                session.advance_operation_time(operation_time)
+
+        yield session
+
+        if session.operation_time is not None:
+            _causal_tokens.set(actor, (session.cluster_time, session.operation_time))
+
+
 # ===========================================
 # Collection Accessors
 # ===========================================
 
-def get_raw_jobs() -> Collection:
+def get_raw_jobs(read: ReadTarget = "primary") -> Collection:
     """Get raw_jobs collection (archive of all ingested jobs)."""
-    return get_db()["raw_jobs"]
+    return _collection("raw_jobs", read)
 
 
-def get_pending_jobs() -> Collection:
+def get_pending_jobs(read: ReadTarget = "primary") -> Collection:
     """Get pending_jobs collection (jobs awaiting approval)."""
-    return get_db()["pending_jobs"]
+    return _collection("pending_jobs", read)
 
 
-def get_approved_jobs() -> Collection:
+def get_approved_jobs(read: ReadTarget = "primary") -> Collection:
     """Get approved_jobs collection (published jobs)."""
-    return get_db()["approved_jobs"]
+    return _collection("approved_jobs", read)
 
 
-def get_rejected_jobs() -> Collection:
+def get_rejected_jobs(read: ReadTarget = "primary") -> Collection:
     """Get rejected_jobs collection (rejected jobs with reasons)."""
-    return get_db()["rejected_jobs"]
+    return _collection("rejected_jobs", read)
+
+
+def get_public_jobs(read: ReadTarget = "primary") -> Collection:
+    """Get public_jobs collection (public read model of approved jobs)."""
+    return _collection("public_jobs", read)
+
+
+def get_job_changes() -> Collection:
+    """Get job_changes collection (change log of the public job set)."""
+    return get_db()["job_changes"]
+
+
+def get_counters() -> Collection:
+    """Get counters collection (named sequence counters)."""
+    return get_db()["counters"]
+
+
+def get_job_stats() -> Collection:
+    """Get job_stats collection (incrementally maintained /admin/stats counters)."""
+    return get_db()["job_stats"]
+
+
+def get_job_metrics() -> Collection:
+    """Get job_metrics collection (hourly ingest/moderation volumes per source)."""
+    return get_db()["job_metrics"]
+
+
+def get_automod_runs() -> Collection:
+    """Get automod_runs collection (auto-moderation run history)."""
+    return get_db()["automod_runs"]
+
+
+def get_audit_log() -> Collection:
+    """Get audit_log collection (moderation audit trail)."""
+    return get_db()["audit_log"]
+
+
+def get_saved_searches() -> Collection:
+    """Get saved_searches collection (user job alerts)."""
+    return get_db()["saved_searches"]
+
+
+def get_search_matches() -> Collection:
+    """Get search_matches collection (jobs matched by saved searches)."""
+    return get_db()["search_matches"]
+
+
+def get_moderation_tasks() -> Collection:
+    """Get moderation_tasks collection (progress of filter-based moves)."""
+    return get_db()["moderation_tasks"]
 
 
 def get_users() -> Collection:
@@ -88,12 +284,43 @@ def get_users() -> Collection:
 # Index Management
 # ===========================================
 
+def ensure_ttl_index(collection: Collection, field: str, direction: int, ttl_days: int) -> None:
+    """
+    Create the single-field index on field, expiring documents after ttl_days.
+
+    ttl_days=0 keeps documents forever. Changing the expiry of an existing
+    TTL index uses collMod; switching an index between TTL and plain
+    requires rebuilding it.
+    """
+    name = f"{field}_{direction}"
+    expire_seconds = ttl_days * 86400
+    existing = collection.index_information().get(name)
+    current = existing.get("expireAfterSeconds") if existing else None
+
+    if existing and current is not None and expire_seconds and current != expire_seconds:
+        collection.database.command(
+            "collMod",
+            collection.name,
+            index={"keyPattern": {field: direction}, "expireAfterSeconds": expire_seconds},
+        )
+        logger.info(f"Changed TTL of {collection.name}.{name} to {ttl_days} days")
+        return
+
+    if existing and (current is None) != (not expire_seconds):
+        collection.drop_index(name)
+        logger.info(f"Rebuilding {collection.name}.{name} ({'TTL' if expire_seconds else 'no TTL'})")
+
+    options = {"expireAfterSeconds": expire_seconds} if expire_seconds else {}
+    collection.create_index([(field, direction)], background=True, **options)
+
+
 def create_indexes() -> None:
     """
     Create all required database indexes.
     Should be called once on application startup.
     """
     logger.info("Creating database indexes...")
+    settings = get_settings()
 
     try:
         # Raw jobs indexes
@@ -101,6 +328,7 @@ def create_indexes() -> None:
         raw.create_index([("dedupe_hash", ASCENDING)], unique=True, sparse=True, background=True)
         raw.create_index([("ingested_at", ASCENDING)], background=True)
         raw.create_index([("source", ASCENDING)], background=True)
+        raw.create_index([("title_company_key", ASCENDING)], background=True)
         logger.debug("Created indexes for raw_jobs collection")
 
         # Pending jobs indexes
@@ -113,30 +341,116 @@ def create_indexes() -> None:
         )
         pending.create_index([("ingested_at", ASCENDING)], background=True)
         pending.create_index([("source", ASCENDING)], background=True)
+        pending.create_index([("tags", ASCENDING)], background=True)
+        pending.create_index([("_claim", ASCENDING)], sparse=True, background=True)
+        # Auto-moderation picks unscored jobs oldest first
+        pending.create_index([("automod.decision", ASCENDING), ("ingested_at", ASCENDING)], background=True)
+        # Review queue: next available batch (newest or highest priority first; see _queue_filter)
+        pending.create_index(
+            [("automod.decision", ASCENDING), ("ingested_at", DESCENDING), ("lease_expires_at", ASCENDING)],
+            background=True,
+        )
+        pending.create_index(
+            [
+                ("automod.decision", ASCENDING),
+                ("review_priority", DESCENDING),
+                ("ingested_at", DESCENDING),
+                ("lease_expires_at", ASCENDING),
+            ],
+            background=True,
+        )
+        # Pending listing sorted by priority, and each reviewer's leases
+        pending.create_index(
+            [("review_priority", DESCENDING), ("ingested_at", DESCENDING), ("lease_expires_at", ASCENDING)],
+            background=True,
+        )
+        pending.create_index(
+            [("source", ASCENDING), ("review_priority", DESCENDING), ("ingested_at", DESCENDING)], background=True
+        )
+        pending.create_index(
+            [("lease_owner", ASCENDING), ("lease_expires_at", ASCENDING)], sparse=True, background=True
+        )
         logger.debug("Created indexes for pending_jobs collection")
 
-        # Approved jobs indexes
+        # Approved jobs indexes (moderation system of record)
         approved = get_approved_jobs()
         approved.create_index([("dedupe_hash", ASCENDING)], unique=True, sparse=True, background=True)
-        approved.create_index(
+        # Plain index: expiry is a scheduled sweep (see expire_approved_jobs), not TTL
+        ensure_ttl_index(approved, "approved_at", ASCENDING, 0)
+        approved.create_index([("source", ASCENDING)], background=True)
+        approved.create_index([("moderation_batch", ASCENDING)], sparse=True, background=True)
+        logger.debug("Created indexes for approved_jobs collection")
+
+        # Public jobs indexes - one per public query shape (see routers/jobs.py)
+        public = get_public_jobs()
+        public.create_index(
             [("title", TEXT), ("company", TEXT), ("location", TEXT)],
             default_language="english",
             background=True
         )
-        approved.create_index([("posted_date_parsed", ASCENDING)], background=True)
-        approved.create_index([("approved_at", ASCENDING)], background=True)
-        approved.create_index([("source", ASCENDING)], background=True)
-        # Geospatial index for location-based searches
-        approved.create_index([
-            ("location_normalized.lat", ASCENDING),
-            ("location_normalized.lon", ASCENDING)
+        # Default listing order and /jobs/source/{source}
+        ensure_ttl_index(public, "approved_at", DESCENDING, 0)
+        public.create_index([("source", ASCENDING), ("approved_at", DESCENDING)], background=True)
+        # Salary/posted-date range filters, laid out equality -> sort -> range so
+        # the approved_at sort needs no in-memory stage and range bounds are
+        # checked on index keys before any document is fetched.
+        public.create_index([
+            ("approved_at", DESCENDING),
+            ("salary_parsed.max", ASCENDING),
+            ("salary_parsed.min", ASCENDING),
+            ("posted_date_parsed", ASCENDING),
         ], background=True)
-        logger.debug("Created indexes for approved_jobs collection")
+        public.create_index([
+            ("source", ASCENDING),
+            ("approved_at", DESCENDING),
+            ("salary_parsed.max", ASCENDING),
+            ("salary_parsed.min", ASCENDING),
+            ("posted_date_parsed", ASCENDING),
+        ], background=True)
+        # Geospatial index for radius searches (GeoJSON point, see /jobs/nearby)
+        public.create_index(
+            [("location_normalized.geo", GEOSPHERE), ("source", ASCENDING)],
+            background=True
+        )
+        logger.debug("Created indexes for public_jobs collection")
+
+        # Change log indexes
+        changes = get_job_changes()
+        changes.create_index([("seq", ASCENDING)], unique=True, background=True)
+        changes.create_index([("job_id", ASCENDING), ("seq", ASCENDING)], background=True)
+        changes.create_index([("op", ASCENDING), ("changed_at", ASCENDING)], background=True)
+        logger.debug("Created indexes for job_changes collection")
+
+        # Saved search indexes
+        get_saved_searches().create_index(
+            [("user_id", ASCENDING), ("created_at", DESCENDING)], background=True
+        )
+        matches = get_search_matches()
+        matches.create_index([("search_id", ASCENDING), ("job_id", ASCENDING)], unique=True, background=True)
+        matches.create_index([("user_id", ASCENDING), ("matched_at", DESCENDING)], background=True)
+        logger.debug("Created indexes for saved search collections")
+
+        # Statistics counters (per-day documents are read by date)
+        get_job_stats().create_index([("kind", ASCENDING), ("day", ASCENDING)], background=True)
+        metrics = get_job_metrics()
+        metrics.create_index([("source", ASCENDING), ("hour", ASCENDING)], background=True)
+        ensure_ttl_index(metrics, "hour", ASCENDING, settings.JOB_METRICS_RETENTION_DAYS)
+
+        # Moderation task indexes
+        get_moderation_tasks().create_index([("created_at", DESCENDING)], background=True)
+        get_automod_runs().create_index([("started_at", DESCENDING)], background=True)
+
+        # Audit log indexes (by time, actor, job and action)
+        audit = get_audit_log()
+        ensure_ttl_index(audit, "at", DESCENDING, settings.AUDIT_RETENTION_DAYS)
+        audit.create_index([("actor", ASCENDING), ("at", DESCENDING)], background=True)
+        audit.create_index([("job_ids", ASCENDING), ("at", DESCENDING)], background=True)
+        audit.create_index([("action", ASCENDING), ("at", DESCENDING)], background=True)
 
         # Rejected jobs indexes
         rejected = get_rejected_jobs()
         rejected.create_index([("dedupe_hash", ASCENDING)], background=True)
-        rejected.create_index([("rejected_at", ASCENDING)], background=True)
+        ensure_ttl_index(rejected, "rejected_at", ASCENDING, settings.REJECTED_JOB_TTL_DAYS)
         logger.debug("Created indexes for rejected_jobs collection")
 
         # Users indexes
@@ -159,6 +473,15 @@ def drop_indexes() -> None:
         get_raw_jobs(),
         get_pending_jobs(),
         get_approved_jobs(),
+        get_public_jobs(),
+        get_job_changes(),
+        get_saved_searches(),
+        get_search_matches(),
+        get_job_stats(),
+        get_job_metrics(),
+        get_moderation_tasks(),
+        get_automod_runs(),
+        get_audit_log(),
         get_rejected_jobs(),
         get_users()
     ]
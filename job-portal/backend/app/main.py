@@ -15,11 +15,13 @@ import logging
 import sys
 
 from app.config import get_settings
-from app.db import create_indexes, close_db
+from app.db import create_indexes, run_db, disconnect_db
 from app.scheduler import start_scheduler, stop_scheduler
+from app.utils.audit import start_audit_writer, stop_audit_writer
+from app.utils.auth import shutdown_password_executor
 
 # Import routers
-from app.routers import ingest, admin, auth, jobs, health
+from app.routers import ingest, admin, auth, jobs, health, searches
 
 # ===========================================
 # Logging Configuration
@@ -58,24 +60,30 @@ async def lifespan(app: FastAPI):
 
     Startup:
     - Create database indexes
+    - Start the audit log writer
     - Start background scheduler
 
     Shutdown:
     - Stop scheduler
-    - Close database connection
+    - Flush the audit log
+    - Shut down the password hashing thread pool
+    - Drain the database thread pool and close the connection
     """
     # Startup
     logger.info(f"Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"Environment: {settings.ENVIRONMENT}")
     logger.info(f"Debug mode: {settings.DEBUG}")
 
-    # Create database indexes
+    # Create database indexes (connects to MongoDB off the event loop)
     try:
-        create_indexes()
+        await run_db(create_indexes)
     except Exception as e:
         logger.error(f"Failed to create database indexes: {e}")
         # Don't fail startup - indexes might already exist
 
+    # Start the audit log writer
+    start_audit_writer(settings.AUDIT_QUEUE_SIZE, settings.AUDIT_BATCH_SIZE, settings.AUDIT_FLUSH_SECONDS)
+
     # Start background scheduler
     try:
         start_scheduler()
@@ -89,7 +97,9 @@ async def lifespan(app: FastAPI):
     # Shutdown
     logger.info("Shutting down application...")
     stop_scheduler()
-    close_db()
+    await run_db(stop_audit_writer)
+    await run_db(shutdown_password_executor)
+    await disconnect_db()
     logger.info("Application shutdown complete")
 
 
@@ -188,6 +198,9 @@ app.include_router(ingest.router)
 # Public job listings
 app.include_router(jobs.router)
 
+# Saved searches and alerts
+app.include_router(searches.router)
+
 # Admin routes
 app.include_router(admin.router)
 
@@ -1,29 +1,53 @@
 """
 Admin router for job approval, rejection, and management.
 """
-from fastapi import APIRouter, HTTPException, status, Depends, Query
+from fastapi import APIRouter, HTTPException, status, Depends, Query, BackgroundTasks
 from datetime import datetime, timezone, timedelta
 from bson import ObjectId
-from typing import Optional
+from pymongo.errors import DuplicateKeyError
+from typing import List, Literal, Optional
 import logging
 
+from app.config import get_settings
 from app.db import (
+    get_audit_log,
+    get_automod_runs,
+    get_moderation_tasks,
     get_pending_jobs,
     get_approved_jobs,
     get_rejected_jobs,
-    get_raw_jobs
+    run_db,
+    causal_session
 )
 from app.schemas.job import (
     JobApproval,
     JobRejection,
+    JobUnpublish,
     BulkJobApproval,
     BulkJobRejection,
-    JobStats
+    JobFilterAction,
+    JobFilterRejection,
+    ModerationTask,
+    QueueRelease,
+    AuditEntry,
+    JobStats,
+    JobTimeSeries,
+    AutomodRun,
+    TimeSeriesPoint
 )
-from app.schemas.responses import SuccessResponse, PaginatedResponse, BulkOperationResult
+from app.schemas.responses import SuccessResponse, PaginatedResponse, BulkOperationResult, LeasedJobsResponse
 from app.schemas.user import UserInDB
+from app.utils import audit
 from app.utils.auth import require_admin, require_viewer_or_admin
+from app.utils.automod import get_automod_config, run_automod
+from app.utils.cache import cache_stats
+from app.utils.events import emit, JOBS_PUBLISHED, JOBS_UNPUBLISHED
+from app.utils.moderation import create_task, move_by_filter, move_job, move_jobs
+from app.utils.public_jobs import publish_jobs, unpublish_jobs
+from app.utils.review_queue import QUEUE_SORTS, QueueOrder, lease_next, release_leases
 from app.utils.sanitize import sanitize_search_query
+from app.utils.serialization import model_response
+from app.utils.stats import read_stats, read_timeseries
 
 router = APIRouter(prefix="/admin", tags=["Admin"])
 logger = logging.getLogger(__name__)
@@ -36,12 +60,42 @@ def convert_objectid(doc: dict) -> dict:
     return doc
 
 
+def _publish_batch(batch: str) -> None:
+    """Publish the jobs approved by one chunk of a filter move."""
+    jobs = list(get_approved_jobs().find({"moderation_batch": batch}))
+    publish_jobs([job["_id"] for job in jobs])
+    emit(JOBS_PUBLISHED, jobs=jobs)
+
+
+def build_pending_filter(
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    tag: Optional[str] = None,
+) -> dict:
+    """Build the MongoDB filter for pending jobs (listing and filter-based moderation)."""
+    filter_q = {}
+    if q:
+        # Sanitize search query to prevent regex injection
+        safe_q = sanitize_search_query(q)
+        filter_q["$or"] = [
+            {"title": {"$regex": safe_q, "$options": "i"}},
+            {"company": {"$regex": safe_q, "$options": "i"}}
+        ]
+    if source:
+        filter_q["source"] = source
+    if tag:
+        filter_q["tags"] = tag
+    return filter_q
+
+
 @router.get("/pending", response_model=PaginatedResponse)
 async def get_pending_jobs_list(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     q: Optional[str] = Query(None, max_length=200, description="Search query (title/company)"),
     source: Optional[str] = Query(None, max_length=50, description="Filter by source"),
+    tag: Optional[str] = Query(None, max_length=100, description="Filter by tag (e.g. skill:python)"),
+    sort: QueueOrder = Query("newest", description="newest or priority (review_priority, then newest)"),
     current_user: UserInDB = Depends(require_viewer_or_admin)
 ):
     """
@@ -53,36 +107,31 @@ async def get_pending_jobs_list(
     - **per_page**: Items per page (default 20, max 100)
     - **q**: Optional search query for title/company
     - **source**: Optional filter by source (indeed, zoho, etc.)
+    - **tag**: Optional filter by tag (e.g. skill:python)
+    - **sort**: newest (default) or priority
     """
-    pending = get_pending_jobs()
+    pending = get_pending_jobs("admin")
     skip = (page - 1) * per_page
 
-    # Build filter
-    filter_q = {}
-    if q:
-        # Sanitize search query to prevent regex injection
-        safe_q = sanitize_search_query(q)
-        filter_q["$or"] = [
-            {"title": {"$regex": safe_q, "$options": "i"}},
-            {"company": {"$regex": safe_q, "$options": "i"}}
-        ]
-    if source:
-        filter_q["source"] = source
-
-    total = pending.count_documents(filter_q)
+    filter_q = build_pending_filter(q=q, source=source, tag=tag)
+
+    with causal_session(current_user.username) as session:
+        total = await run_db(pending.count_documents, filter_q, session=session)
+        docs = await run_db(
+            lambda: list(
+                pending.find(filter_q, session=session)
+                .sort(QUEUE_SORTS[sort])
+                .skip(skip)
+                .limit(per_page)
+            )
+        )
     total_pages = (total + per_page - 1) // per_page if total > 0 else 1
 
-    docs = list(
-        pending.find(filter_q)
-        .sort("ingested_at", -1)
-        .skip(skip)
-        .limit(per_page)
-    )
-
     # Convert ObjectId to string
     docs = [convert_objectid(doc) for doc in docs]
 
-    return PaginatedResponse(
+    return model_response(
+        PaginatedResponse,
         page=page,
         per_page=per_page,
         total=total,
@@ -91,6 +140,72 @@ async def get_pending_jobs_list(
     )
 
 
+def _queue_filter() -> dict:
+    """
+    Pending jobs a reviewer can be handed (only held ones while auto-moderation runs).
+
+    automod.decision is matched by equality or $in, so the queue indexes
+    led by it still return candidates in sort order.
+    """
+    filter_q = {"_claim": {"$exists": False}}
+    if get_settings().AUTOMOD_ENABLED:
+        filter_q["automod.decision"] = "hold"
+    else:
+        filter_q["automod.decision"] = {"$in": [None, "hold", "approve", "reject"]}
+    return filter_q
+
+
+@router.post("/queue/next", response_model=LeasedJobsResponse)
+async def lease_review_batch(
+    n: int = Query(10, ge=1, le=100, description="Batch size"),
+    order: QueueOrder = Query("newest", description="newest or priority"),
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Lease the next batch of pending jobs to the caller.
+
+    Requires admin role.
+
+    Returns the caller's unexpired leases first (renewed, at most **n**),
+    topped up to **n** with jobs nobody else holds, newest or highest priority first. Leased jobs are skipped
+    in other reviewers' batches until approved, rejected, released or
+    expired (REVIEW_LEASE_SECONDS).
+    """
+    jobs, expires = await run_db(
+        lease_next,
+        current_user.username,
+        n,
+        get_settings().REVIEW_LEASE_SECONDS,
+        _queue_filter(),
+        order,
+    )
+    return model_response(
+        LeasedJobsResponse,
+        lease_expires_at=expires,
+        data=[convert_objectid(job) for job in jobs],
+    )
+
+
+@router.post("/queue/release", response_model=SuccessResponse)
+async def release_review_batch(
+    release: QueueRelease,
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Release the caller's leases so other reviewers can take the jobs.
+
+    Requires admin role.
+
+    - **job_ids**: Leases to release (default: all of the caller's)
+    """
+    job_ids = None
+    if release.job_ids is not None:
+        job_ids = [ObjectId(job_id) for job_id in release.job_ids if ObjectId.is_valid(job_id)]
+
+    released = await run_db(release_leases, current_user.username, job_ids)
+    return SuccessResponse(message=f"Released {released} leases", data={"released": released})
+
+
 @router.post("/approve", response_model=SuccessResponse)
 async def approve_job(
     approval: JobApproval,
@@ -102,34 +217,56 @@ async def approve_job(
     Requires admin role.
 
     The job will be:
-    1. Marked with approval metadata (timestamp, approver)
-    2. Moved from pending_jobs to approved_jobs collection
-    3. Deleted from pending_jobs
-    """
-    pending = get_pending_jobs()
-    approved = get_approved_jobs()
+    1. Atomically removed from pending_jobs
+    2. Marked with approval metadata (timestamp, approver)
+    3. Written to approved_jobs (put back into pending_jobs if that fails)
+    4. Published to the public_jobs read model
 
-    try:
-        job = pending.find_one({"_id": ObjectId(approval.job_id)})
-    except Exception:
+    Safe to retry: approving a job that is already approved succeeds
+    without approving it twice.
+    """
+    if not ObjectId.is_valid(approval.job_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid job ID format"
         )
 
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found in pending queue"
-        )
-
-    # Add approval metadata
-    job["approved_at"] = datetime.now(timezone.utc).isoformat()
-    job["approved_by"] = current_user.username
+    stamp = {
+        "approved_at": datetime.now(timezone.utc),
+        "approved_by": current_user.username,
+    }
 
-    # Move to approved collection
-    approved.insert_one(job)
-    pending.delete_one({"_id": ObjectId(approval.job_id)})
+    with causal_session(current_user.username) as session:
+        try:
+            outcome, job = await run_db(
+                move_job,
+                get_pending_jobs(),
+                get_approved_jobs(),
+                ObjectId(approval.job_id),
+                stamp,
+                session=session,
+            )
+        except DuplicateKeyError:
+            # The job was put back; it stays in the pending queue
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Job duplicates an already approved job (dedupe_hash)"
+            )
+
+        if outcome == "not_found":
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found in pending queue"
+            )
+
+        # Also on retries, in case the earlier attempt stopped before publishing
+        await run_db(publish_jobs, [job["_id"]], session=session)
+
+    if outcome == "already_moved":
+        return SuccessResponse(message="Job already approved")
+
+    await run_db(emit, JOBS_PUBLISHED, jobs=[job])
+    audit.record("approve", current_user.username, [job["_id"]])
 
     logger.info(
         f"Job approved by {current_user.username}: "
@@ -150,35 +287,51 @@ async def reject_job(
     Requires admin role.
 
     The job will be:
-    1. Marked with rejection metadata (timestamp, rejector, reason)
-    2. Moved from pending_jobs to rejected_jobs collection
-    3. Deleted from pending_jobs
-    """
-    pending = get_pending_jobs()
-    rejected = get_rejected_jobs()
+    1. Atomically removed from pending_jobs
+    2. Marked with rejection metadata (timestamp, rejector, reason)
+    3. Written to rejected_jobs (put back into pending_jobs if that fails)
 
-    try:
-        job = pending.find_one({"_id": ObjectId(rejection.job_id)})
-    except Exception:
+    Safe to retry: rejecting a job that is already rejected succeeds
+    without rejecting it twice.
+    """
+    if not ObjectId.is_valid(rejection.job_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid job ID format"
         )
 
-    if not job:
+    stamp = {
+        "rejected_at": datetime.now(timezone.utc),
+        "rejected_by": current_user.username,
+        "rejection_reason": rejection.reason,
+    }
+
+    with causal_session(current_user.username) as session:
+        try:
+            outcome, job = await run_db(
+                move_job,
+                get_pending_jobs(),
+                get_rejected_jobs(),
+                ObjectId(rejection.job_id),
+                stamp,
+                session=session,
+            )
+        except DuplicateKeyError:
+            # The job was put back; it stays in the pending queue
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Job duplicates an already rejected job (dedupe_hash)"
+            )
+
+    if outcome == "not_found":
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found in pending queue"
         )
+    if outcome == "already_moved":
+        return SuccessResponse(message="Job already rejected")
 
-    # Add rejection metadata
-    job["rejected_at"] = datetime.now(timezone.utc).isoformat()
-    job["rejected_by"] = current_user.username
-    job["rejection_reason"] = rejection.reason
-
-    # Move to rejected collection
-    rejected.insert_one(job)
-    pending.delete_one({"_id": ObjectId(rejection.job_id)})
+    audit.record("reject", current_user.username, [job["_id"]], reason=rejection.reason)
 
     logger.info(
         f"Job rejected by {current_user.username}: "
@@ -188,6 +341,68 @@ async def reject_job(
     return SuccessResponse(message="Job rejected successfully")
 
 
+@router.post("/unpublish", response_model=SuccessResponse)
+async def unpublish_job(
+    unpublish: JobUnpublish,
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Take an approved job off the public site.
+
+    Requires admin role.
+
+    The job will be:
+    1. Atomically removed from approved_jobs
+    2. Marked with rejection metadata (timestamp, admin, reason)
+    3. Written to rejected_jobs (put back into approved_jobs if that fails)
+    4. Removed from the public_jobs read model
+    """
+    if not ObjectId.is_valid(unpublish.job_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid job ID format"
+        )
+
+    stamp = {
+        "rejected_at": datetime.now(timezone.utc),
+        "rejected_by": current_user.username,
+        "rejection_reason": unpublish.reason,
+        "unpublished": True,
+    }
+
+    with causal_session(current_user.username) as session:
+        outcome, job = await run_db(
+            move_job,
+            get_approved_jobs(),
+            get_rejected_jobs(),
+            ObjectId(unpublish.job_id),
+            stamp,
+            session=session,
+        )
+
+        # A job rejected straight from the pending queue was never published
+        if outcome == "not_found" or (outcome == "already_moved" and not job.get("unpublished")):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found in approved jobs"
+            )
+
+        await run_db(unpublish_jobs, [job["_id"]], session=session)
+
+    if outcome == "already_moved":
+        return SuccessResponse(message="Job already unpublished")
+
+    await run_db(emit, JOBS_UNPUBLISHED, jobs=[job])
+    audit.record("unpublish", current_user.username, [job["_id"]], reason=unpublish.reason)
+
+    logger.info(
+        f"Job unpublished by {current_user.username}: "
+        f"{job.get('title')} at {job.get('company')} - Reason: {unpublish.reason}"
+    )
+
+    return SuccessResponse(message="Job unpublished successfully")
+
+
 @router.post("/bulk-approve", response_model=SuccessResponse)
 async def bulk_approve_jobs(
     bulk_approval: BulkJobApproval,
@@ -199,31 +414,45 @@ async def bulk_approve_jobs(
     Requires admin role.
 
     - **job_ids**: List of job IDs to approve (max 100)
+    - **transactional**: Approve all or none (requires a replica set)
 
-    Returns summary of results.
+    Returns summary of results with the outcome for each job ID.
     """
     pending = get_pending_jobs()
     approved = get_approved_jobs()
 
-    results = BulkOperationResult()
-
-    for job_id in bulk_approval.job_ids:
-        try:
-            job = pending.find_one({"_id": ObjectId(job_id)})
-            if not job:
-                results.not_found += 1
-                continue
-
-            job["approved_at"] = datetime.now(timezone.utc).isoformat()
-            job["approved_by"] = current_user.username
+    stamp = {
+        "approved_at": datetime.now(timezone.utc),
+        "approved_by": current_user.username,
+    }
 
-            approved.insert_one(job)
-            pending.delete_one({"_id": ObjectId(job_id)})
-            results.success += 1
+    with causal_session(current_user.username) as session:
+        outcomes, published = await run_db(
+            move_jobs,
+            pending,
+            approved,
+            bulk_approval.job_ids,
+            stamp,
+            session,
+            transactional=bulk_approval.transactional,
+        )
 
-        except Exception as e:
-            logger.error(f"Error approving job {job_id}: {e}")
-            results.errors += 1
+        # Outside the move: $merge cannot run inside a transaction
+        if published:
+            await run_db(publish_jobs, [job["_id"] for job in published], session=session)
+
+    if published:
+        await run_db(emit, JOBS_PUBLISHED, jobs=published)
+
+    results = BulkOperationResult.from_outcomes(outcomes)
+    audit.record(
+        "bulk_approve",
+        current_user.username,
+        [job["_id"] for job in published],
+        requested=len(bulk_approval.job_ids),
+        not_found=results.not_found,
+        errors=results.errors,
+    )
 
     logger.info(
         f"Bulk approve by {current_user.username}: "
@@ -249,32 +478,40 @@ async def bulk_reject_jobs(
 
     - **job_ids**: List of job IDs to reject (max 100)
     - **reason**: Rejection reason applied to all jobs
+    - **transactional**: Reject all or none (requires a replica set)
 
-    Returns summary of results.
+    Returns summary of results with the outcome for each job ID.
     """
     pending = get_pending_jobs()
     rejected = get_rejected_jobs()
 
-    results = BulkOperationResult()
-
-    for job_id in bulk_rejection.job_ids:
-        try:
-            job = pending.find_one({"_id": ObjectId(job_id)})
-            if not job:
-                results.not_found += 1
-                continue
-
-            job["rejected_at"] = datetime.now(timezone.utc).isoformat()
-            job["rejected_by"] = current_user.username
-            job["rejection_reason"] = bulk_rejection.reason
+    stamp = {
+        "rejected_at": datetime.now(timezone.utc),
+        "rejected_by": current_user.username,
+        "rejection_reason": bulk_rejection.reason,
+    }
 
-            rejected.insert_one(job)
-            pending.delete_one({"_id": ObjectId(job_id)})
-            results.success += 1
+    with causal_session(current_user.username) as session:
+        outcomes, _ = await run_db(
+            move_jobs,
+            pending,
+            rejected,
+            bulk_rejection.job_ids,
+            stamp,
+            session,
+            transactional=bulk_rejection.transactional,
+        )
 
-        except Exception as e:
-            logger.error(f"Error rejecting job {job_id}: {e}")
-            results.errors += 1
+    results = BulkOperationResult.from_outcomes(outcomes)
+    audit.record(
+        "bulk_reject",
+        current_user.username,
+        [job_id for job_id, outcome in outcomes.items() if outcome == "moved"],
+        reason=bulk_rejection.reason,
+        requested=len(bulk_rejection.job_ids),
+        not_found=results.not_found,
+        errors=results.errors,
+    )
 
     logger.info(
         f"Bulk reject by {current_user.username}: "
@@ -288,6 +525,249 @@ async def bulk_reject_jobs(
     )
 
 
+@router.post("/approve-by-filter", response_model=SuccessResponse, status_code=status.HTTP_202_ACCEPTED)
+async def approve_jobs_by_filter(
+    criteria: JobFilterAction,
+    background_tasks: BackgroundTasks,
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Approve every pending job matching a filter, entirely server-side.
+
+    Requires admin role.
+
+    - **q** / **source** / **tag**: Same filters as the pending listing
+      (at least one is required)
+
+    Jobs are moved in chunks in the background; poll
+    `/admin/tasks/{task_id}` for progress.
+    """
+    return await _start_filter_move(
+        "approve",
+        criteria,
+        get_approved_jobs(),
+        {"approved_at": datetime.now(timezone.utc), "approved_by": current_user.username},
+        background_tasks,
+        current_user,
+    )
+
+
+@router.post("/reject-by-filter", response_model=SuccessResponse, status_code=status.HTTP_202_ACCEPTED)
+async def reject_jobs_by_filter(
+    criteria: JobFilterRejection,
+    background_tasks: BackgroundTasks,
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Reject every pending job matching a filter, entirely server-side.
+
+    Requires admin role.
+
+    - **q** / **source** / **tag**: Same filters as the pending listing
+      (at least one is required)
+    - **reason**: Rejection reason applied to all jobs
+
+    Jobs are moved in chunks in the background; poll
+    `/admin/tasks/{task_id}` for progress.
+    """
+    return await _start_filter_move(
+        "reject",
+        criteria,
+        get_rejected_jobs(),
+        {
+            "rejected_at": datetime.now(timezone.utc),
+            "rejected_by": current_user.username,
+            "rejection_reason": criteria.reason,
+        },
+        background_tasks,
+        current_user,
+    )
+
+
+async def _start_filter_move(
+    action: str,
+    criteria: JobFilterAction,
+    target,
+    stamp: dict,
+    background_tasks: BackgroundTasks,
+    current_user: UserInDB,
+) -> SuccessResponse:
+    pending = get_pending_jobs()
+    filter_q = build_pending_filter(q=criteria.q, source=criteria.source, tag=criteria.tag)
+
+    total = await run_db(pending.count_documents, filter_q)
+    if total == 0:
+        return SuccessResponse(message="No pending jobs match the filter", data={"task_id": None, "total": 0})
+
+    task_id = await run_db(
+        create_task,
+        action,
+        criteria.model_dump(include={"q", "source", "tag"}),
+        total,
+        current_user.username,
+    )
+
+    # Runs after the response is sent, in a worker thread
+    background_tasks.add_task(
+        move_by_filter,
+        task_id,
+        pending,
+        target,
+        filter_q,
+        stamp,
+        chunk_size=get_settings().MODERATION_CHUNK_SIZE,
+        on_chunk=_publish_batch if action == "approve" else None,
+    )
+
+    audit.record(
+        f"{action}_by_filter",
+        current_user.username,
+        task_id=str(task_id),
+        criteria=criteria.model_dump(exclude_none=True),
+        total=total,
+    )
+
+    logger.info(f"{action.capitalize()}-by-filter task {task_id} started by {current_user.username}: {total} jobs")
+
+    return SuccessResponse(
+        message=f"{action.capitalize()} of {total} jobs started",
+        data={"task_id": str(task_id), "total": total}
+    )
+
+
+@router.get("/tasks/{task_id}", response_model=ModerationTask)
+async def get_moderation_task(
+    task_id: str,
+    current_user: UserInDB = Depends(require_viewer_or_admin)
+):
+    """
+    Get the progress of an approve/reject-by-filter task.
+
+    Requires viewer or admin role.
+    """
+    if not ObjectId.is_valid(task_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid task ID format"
+        )
+
+    task = await run_db(get_moderation_tasks().find_one, {"_id": ObjectId(task_id)})
+    if not task:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found"
+        )
+
+    return ModerationTask(**convert_objectid(task))
+
+
+@router.post("/automod/run", response_model=AutomodRun)
+async def run_auto_moderation(
+    dry_run: bool = Query(False, description="Score only, without moving jobs"),
+    rescore: bool = Query(False, description="Also rescore jobs held for human review"),
+    batch_size: Optional[int] = Query(None, ge=1, le=5000, description="Jobs to score (default AUTOMOD_BATCH_SIZE)"),
+    current_user: UserInDB = Depends(require_admin)
+):
+    """
+    Auto-moderate one batch of pending jobs now.
+
+    Requires admin role.
+
+    Jobs scoring at or above AUTOMOD_APPROVE_SCORE are approved and at or
+    below AUTOMOD_REJECT_SCORE rejected (as "auto"); the rest stay pending
+    with their score and reasons. A dry run returns each decision without
+    changing anything, for tuning the thresholds.
+    """
+    summary = await run_db(
+        run_automod,
+        get_automod_config(),
+        batch_size or get_settings().AUTOMOD_BATCH_SIZE,
+        current_user.username,
+        dry_run=dry_run,
+        rescore=rescore,
+    )
+    return AutomodRun(**summary)
+
+
+@router.get("/automod/runs", response_model=List[AutomodRun])
+async def get_auto_moderation_runs(
+    limit: int = Query(20, ge=1, le=200),
+    current_user: UserInDB = Depends(require_viewer_or_admin)
+):
+    """
+    Get recent auto-moderation runs, newest first.
+
+    Requires viewer or admin role.
+
+    Each run reports jobs scanned, approved, rejected and held, with its
+    duration and throughput.
+    """
+    runs = await run_db(
+        lambda: list(get_automod_runs().find().sort("started_at", -1).limit(limit))
+    )
+    return [AutomodRun(**convert_objectid(run)) for run in runs]
+
+
+@router.get("/audit", response_model=PaginatedResponse)
+async def get_audit_entries(
+    page: int = Query(1, ge=1),
+    per_page: int = Query(50, ge=1, le=200),
+    actor: Optional[str] = Query(None, max_length=100, description="Username, or auto"),
+    job_id: Optional[str] = Query(None, description="Entries touching this job"),
+    action: Optional[str] = Query(None, max_length=50, description="e.g. approve, bulk_reject"),
+    start: Optional[datetime] = Query(None, alias="from", description="On or after"),
+    end: Optional[datetime] = Query(None, alias="to", description="Before"),
+    current_user: UserInDB = Depends(require_viewer_or_admin)
+):
+    """
+    Get moderation audit log entries, newest first.
+
+    Requires viewer or admin role.
+
+    Entries are written in the background, so the last few seconds of
+    actions may not be listed yet.
+    """
+    filter_q = {}
+    if actor:
+        filter_q["actor"] = actor
+    if action:
+        filter_q["action"] = action
+    if job_id:
+        if not ObjectId.is_valid(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid job ID format"
+            )
+        filter_q["job_ids"] = ObjectId(job_id)
+    if start or end:
+        filter_q["at"] = {}
+        if start:
+            filter_q["at"]["$gte"] = start
+        if end:
+            filter_q["at"]["$lt"] = end
+
+    audit_log = get_audit_log()
+    skip = (page - 1) * per_page
+    total = await run_db(audit_log.count_documents, filter_q)
+    docs = await run_db(
+        lambda: list(audit_log.find(filter_q).sort("at", -1).skip(skip).limit(per_page))
+    )
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
+
+    entries = []
+    for doc in docs:
+        doc["job_ids"] = [str(job_id) for job_id in doc.get("job_ids", [])]
+        entries.append(AuditEntry(**convert_objectid(doc)).model_dump())
+
+    return PaginatedResponse(
+        page=page,
+        per_page=per_page,
+        total=total,
+        total_pages=total_pages,
+        data=entries
+    )
+
+
 @router.get("/stats", response_model=JobStats)
 async def get_job_statistics(current_user: UserInDB = Depends(require_viewer_or_admin)):
     """
@@ -295,37 +775,77 @@ async def get_job_statistics(current_user: UserInDB = Depends(require_viewer_or_
 
     Requires viewer or admin role.
 
-    Returns counts by collection, source breakdown, and recent activity.
+    Returns counts by collection, source breakdown, and recent activity
+    (the last 7 UTC days for jobs_this_week), read from incrementally
+    maintained counters rather than counted on each request.
     """
-    raw = get_raw_jobs()
-    pending = get_pending_jobs()
-    approved = get_approved_jobs()
-    rejected = get_rejected_jobs()
+    with causal_session(current_user.username) as session:
+        return JobStats(**await run_db(read_stats, session))
 
-    now = datetime.now(timezone.utc)
-    today_start = now.replace(hour=0, minute=0, second=0, microsecond=0).isoformat()
-    week_start = (now - timedelta(days=7)).isoformat()
-
-    # Count by source using aggregation
-    source_pipeline = [
-        {"$group": {"_id": "$source", "count": {"$sum": 1}}}
-    ]
-    source_counts = {
-        doc["_id"] or "unknown": doc["count"]
-        for doc in raw.aggregate(source_pipeline)
-    }
 
-    return JobStats(
-        total_raw=raw.count_documents({}),
-        total_pending=pending.count_documents({}),
-        total_approved=approved.count_documents({}),
-        total_rejected=rejected.count_documents({}),
-        jobs_by_source=source_counts,
-        jobs_today=raw.count_documents({"ingested_at": {"$gte": today_start}}),
-        jobs_this_week=raw.count_documents({"ingested_at": {"$gte": week_start}}),
+# Hours per point, for bounding the response size
+_GRANULARITY_HOURS = {"hour": 1, "day": 24, "week": 24 * 7, "month": 24 * 28}
+
+
+@router.get("/stats/timeseries", response_model=JobTimeSeries)
+async def get_job_timeseries(
+    start: Optional[datetime] = Query(None, alias="from", description="Range start (default: 7 days before end)"),
+    end: Optional[datetime] = Query(None, alias="to", description="Range end, exclusive (default: now)"),
+    granularity: Literal["hour", "day", "week", "month"] = Query("hour", description="Point size"),
+    source: Optional[str] = Query(None, max_length=50, description="Only this source"),
+    current_user: UserInDB = Depends(require_viewer_or_admin)
+):
+    """
+    Get ingest, approve, reject and unpublish volumes over time.
+
+    Requires viewer or admin role.
+
+    Reads only the hourly buckets in range (summed across sources unless
+    source is given). Times without a timezone are UTC; days, weeks
+    (starting Monday) and months are UTC calendar periods.
+    """
+    end = end or datetime.now(timezone.utc)
+    if end.tzinfo is None:
+        end = end.replace(tzinfo=timezone.utc)
+    start = start or end - timedelta(days=7)
+    if start.tzinfo is None:
+        start = start.replace(tzinfo=timezone.utc)
+
+    if start >= end:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="'from' must be before 'to'"
+        )
+    max_points = get_settings().TIMESERIES_MAX_POINTS
+    if (end - start) / timedelta(hours=_GRANULARITY_HOURS[granularity]) > max_points:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range too large for {granularity} granularity (max {max_points} points)"
+        )
+
+    points = await run_db(read_timeseries, start, end, granularity, source)
+    return JobTimeSeries(
+        granularity=granularity,
+        start=start,
+        end=end,
+        source=source,
+        points=[TimeSeriesPoint(**point) for point in points],
     )
 
 
+@router.get("/cache/stats")
+async def get_cache_statistics(current_user: UserInDB = Depends(require_viewer_or_admin)):
+    """
+    Get in-process cache statistics for this worker.
+
+    Requires viewer or admin role.
+
+    Returns entries, hits, misses, evictions and hit rate per cache
+    (plus bytes used for size-bounded caches).
+    """
+    return cache_stats()
+
+
 @router.get("/rejected", response_model=PaginatedResponse)
 async def get_rejected_jobs_list(
     page: int = Query(1, ge=1),
@@ -338,7 +858,7 @@ async def get_rejected_jobs_list(
 
     Requires viewer or admin role.
     """
-    rejected = get_rejected_jobs()
+    rejected = get_rejected_jobs("admin")
     skip = (page - 1) * per_page
 
     filter_q = {}
@@ -349,19 +869,22 @@ async def get_rejected_jobs_list(
             {"company": {"$regex": safe_q, "$options": "i"}}
         ]
 
-    total = rejected.count_documents(filter_q)
+    with causal_session(current_user.username) as session:
+        total = await run_db(rejected.count_documents, filter_q, session=session)
+        docs = await run_db(
+            lambda: list(
+                rejected.find(filter_q, session=session)
+                .sort("rejected_at", -1)
+                .skip(skip)
+                .limit(per_page)
+            )
+        )
     total_pages = (total + per_page - 1) // per_page if total > 0 else 1
 
-    docs = list(
-        rejected.find(filter_q)
-        .sort("rejected_at", -1)
-        .skip(skip)
-        .limit(per_page)
-    )
-
     docs = [convert_objectid(doc) for doc in docs]
 
-    return PaginatedResponse(
+    return model_response(
+        PaginatedResponse,
         page=page,
         per_page=per_page,
         total=total,
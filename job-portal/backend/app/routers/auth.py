@@ -16,18 +16,20 @@ from app.schemas.user import (
     UserInDB,
 )
 from app.utils.auth import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     create_access_token,
     create_refresh_token,
     decode_token,
+    token_claims,
     get_user_by_email,
     get_user_by_username,
-    get_user_by_id,
+    get_token_user,
     get_current_user,
     authenticate_user,
+    update_user_account,
 )
-from app.db import get_users
+from app.db import get_users, run_db
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 logger = logging.getLogger(__name__)
@@ -46,14 +48,14 @@ async def register(user_data: UserCreate):
     users = get_users()
 
     # Check if email already exists
-    if get_user_by_email(user_data.email):
+    if await run_db(get_user_by_email, user_data.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered"
         )
 
     # Check if username already exists
-    if get_user_by_username(user_data.username):
+    if await run_db(get_user_by_username, user_data.username):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Username already taken"
@@ -65,14 +67,15 @@ async def register(user_data: UserCreate):
         "email": user_data.email.lower(),
         "username": user_data.username.lower(),
         "full_name": user_data.full_name,
-        "hashed_password": get_password_hash(user_data.password),
+        "hashed_password": await get_password_hash_async(user_data.password),
         "role": "viewer",  # Default role for new users
         "is_active": True,
         "created_at": now,
         "last_login": None,
+        "token_version": 0,
     }
 
-    result = users.insert_one(user_doc)
+    result = await run_db(users.insert_one, user_doc)
 
     logger.info(f"New user registered: {user_data.username} ({user_data.email})")
 
@@ -99,7 +102,7 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
 
     Returns access and refresh tokens.
     """
-    user = authenticate_user(form_data.username, form_data.password)
+    user = await authenticate_user(form_data.username, form_data.password)
 
     if not user:
         raise HTTPException(
@@ -116,13 +119,14 @@ async def login(form_data: OAuth2PasswordRequestForm = Depends()):
 
     # Update last login timestamp
     users = get_users()
-    users.update_one(
+    await run_db(
+        users.update_one,
         {"_id": ObjectId(user.id)},
         {"$set": {"last_login": datetime.now(timezone.utc)}}
     )
 
     # Create tokens
-    token_data = {"sub": user.id, "role": user.role}
+    token_data = token_claims(user)
     access_token = create_access_token(data=token_data)
     refresh_token = create_refresh_token(data=token_data)
 
@@ -153,13 +157,12 @@ async def refresh_token(token_data: TokenRefresh):
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    user_id = payload.get("sub")
-    user = get_user_by_id(user_id)
+    user = await get_token_user(payload)
 
     if user is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found"
+            detail="User not found or refresh token revoked"
         )
 
     if not user.is_active:
@@ -169,7 +172,7 @@ async def refresh_token(token_data: TokenRefresh):
         )
 
     # Create new tokens
-    new_token_data = {"sub": user.id, "role": user.role}
+    new_token_data = token_claims(user)
     access_token = create_access_token(data=new_token_data)
     refresh_token = create_refresh_token(data=new_token_data)
 
@@ -212,10 +215,11 @@ async def change_password(
     - **current_password**: User's current password
     - **new_password**: New password (min 8 chars with uppercase, lowercase, digit)
 
-    Requires valid access token.
+    Requires valid access token. All previously issued tokens are revoked;
+    the response carries a new access and refresh token for this client.
     """
     # Verify current password
-    if not verify_password(password_data.current_password, current_user.hashed_password):
+    if not await verify_password_async(password_data.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect"
@@ -228,13 +232,24 @@ async def change_password(
             detail="New password must be different from current password"
         )
 
-    # Update password
-    users = get_users()
-    users.update_one(
-        {"_id": ObjectId(current_user.id)},
-        {"$set": {"hashed_password": get_password_hash(password_data.new_password)}}
+    # Update password and revoke existing tokens
+    user = await run_db(
+        update_user_account,
+        current_user.id,
+        {"hashed_password": await get_password_hash_async(password_data.new_password)},
     )
+    if user is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="User not found"
+        )
 
     logger.info(f"Password changed for user: {current_user.username}")
 
-    return {"message": "Password changed successfully"}
+    token_data = token_claims(user)
+    return {
+        "message": "Password changed successfully",
+        "access_token": create_access_token(data=token_data),
+        "refresh_token": create_refresh_token(data=token_data),
+        "token_type": "bearer",
+    }
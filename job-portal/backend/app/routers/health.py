@@ -2,9 +2,10 @@
 Health check router for monitoring and container orchestration.
 """
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 import logging
 
-from app.db import get_client
+from app.db import get_client, run_db
 from app.config import get_settings
 from app.schemas.responses import HealthResponse, ReadyResponse
 
@@ -43,8 +44,8 @@ async def readiness_check():
 
     # Check MongoDB connection
     try:
-        client = get_client()
-        client.admin.command("ping")
+        client = await run_db(get_client)
+        await run_db(client.admin.command, "ping")
         db_status = "connected"
     except Exception as e:
         logger.error(f"Database connection failed: {e}")
@@ -59,7 +60,7 @@ async def readiness_check():
         try:
             from app.utils.minio_client import get_minio_client
             minio = get_minio_client()
-            minio.list_buckets()
+            await run_in_threadpool(minio.list_buckets)
             storage_status = "connected"
         except Exception as e:
             logger.warning(f"MinIO connection failed (non-critical): {e}")
@@ -2,20 +2,24 @@
 Job ingestion router for receiving job data from scrapers.
 """
 from fastapi import APIRouter, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from datetime import datetime, timezone
 from pymongo.errors import DuplicateKeyError
 import logging
 
-from app.db import get_raw_jobs, get_pending_jobs
+from app.config import get_settings
+from app.db import get_raw_jobs, get_pending_jobs, run_db
 from app.schemas.job import JobCreate, JobBatchCreate
 from app.schemas.responses import SuccessResponse, BatchResult
 from app.utils.processing import (
     parse_posted_date,
     clean_salary,
     normalize_location,
-    tag_source
+    tag_source,
+    review_priority
 )
-from app.utils.hashing import compute_hash
+from app.utils.hashing import compute_hash, compute_title_company_key
+from app.utils.stats import record_ingested
 
 router = APIRouter(prefix="/ingest", tags=["Ingestion"])
 logger = logging.getLogger(__name__)
@@ -27,11 +31,15 @@ def process_job(job_data: JobCreate) -> dict:
 
     Applies the following transformations:
     - Compute deduplication hash
-    - Parse posted date to ISO format
+    - Parse posted date to a UTC datetime
     - Clean and structure salary information
     - Normalize/geocode location
     - Generate tags based on content
     - Add ingestion timestamp
+    - Compute the title/company key used to spot reposts
+
+    The review priority is scored separately (see prepare_job), since it
+    needs a database lookup.
 
     Args:
         job_data: Raw job data from scraper
@@ -49,8 +57,33 @@ def process_job(job_data: JobCreate) -> dict:
     job_dict["salary_parsed"] = clean_salary(job_dict.get("salary"))
     job_dict["location_normalized"] = normalize_location(job_dict.get("location"))
     job_dict["tags"] = tag_source(job_dict)
-    job_dict["ingested_at"] = datetime.now(timezone.utc).isoformat()
+    job_dict["ingested_at"] = datetime.now(timezone.utc)
+
+    job_dict["title_company_key"] = compute_title_company_key(job_dict)
+
+    return job_dict
+
+
+async def prepare_job(job_data: JobCreate) -> dict:
+    """
+    Process a job and score its review priority.
+
+    A job whose title and company match an earlier ingested job is scored
+    as a repost.
+    """
+    # Geocoding is blocking network I/O; keep it off the event loop
+    job_dict = await run_in_threadpool(process_job, job_data)
+    repost = await run_db(
+        get_raw_jobs().find_one, {"title_company_key": job_dict["title_company_key"]}, {"_id": 1}
+    )
 
+    settings = get_settings()
+    job_dict["review_priority"] = review_priority(
+        job_dict,
+        duplicate=repost is not None,
+        source_weights=settings.REVIEW_SOURCE_WEIGHTS,
+        default_source_weight=settings.REVIEW_DEFAULT_SOURCE_WEIGHT,
+    )
     return job_dict
 
 
@@ -68,16 +101,17 @@ async def ingest_job(job: JobCreate):
 
     Returns success response with dedupe_hash for reference.
     """
-    job_dict = process_job(job)
+    job_dict = await prepare_job(job)
     raw_jobs = get_raw_jobs()
     pending_jobs = get_pending_jobs()
 
     try:
         # Insert into raw_jobs (archive) - make a copy since MongoDB modifies the dict
-        raw_jobs.insert_one(job_dict.copy())
+        await run_db(raw_jobs.insert_one, job_dict.copy())
 
         # Insert into pending_jobs (for review)
-        pending_jobs.insert_one(job_dict)
+        await run_db(pending_jobs.insert_one, job_dict)
+        await run_db(record_ingested, [job_dict])
 
         logger.info(f"Job ingested: {job.title} at {job.company}")
 
@@ -120,13 +154,15 @@ async def ingest_jobs_batch(batch: JobBatchCreate):
     pending_jobs = get_pending_jobs()
 
     results = BatchResult()
+    inserted = []
 
     for job in batch.jobs:
-        job_dict = process_job(job)
+        job_dict = await prepare_job(job)
         try:
-            raw_jobs.insert_one(job_dict.copy())
-            pending_jobs.insert_one(job_dict)
+            await run_db(raw_jobs.insert_one, job_dict.copy())
+            await run_db(pending_jobs.insert_one, job_dict)
             results.inserted += 1
+            inserted.append(job_dict)
 
         except DuplicateKeyError:
             results.duplicates += 1
@@ -136,6 +172,8 @@ async def ingest_jobs_batch(batch: JobBatchCreate):
             results.errors += 1
             logger.error(f"Error inserting job {job.title}: {e}")
 
+    await run_db(record_ingested, inserted)
+
     logger.info(
         f"Batch ingest completed: {results.inserted} inserted, "
         f"{results.duplicates} duplicates, {results.errors} errors"
@@ -1,19 +1,122 @@
 """
 Public jobs router for accessing approved job listings.
+
+All reads go to the public_jobs read model (see app/utils/public_jobs.py),
+never to the approved_jobs collection admins write to.
 """
-from fastapi import APIRouter, HTTPException, status, Query
+from fastapi import APIRouter, HTTPException, status, Query, Depends
+from fastapi.responses import StreamingResponse
 from bson import ObjectId
-from typing import Optional
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Optional, Literal
+import asyncio
+import json
 import logging
-
-from app.db import get_approved_jobs
-from app.schemas.responses import PaginatedResponse
+import threading
+
+from app.config import get_settings
+from app.db import get_public_jobs, run_db
+from app.schemas.responses import (
+    PaginatedResponse,
+    FacetedPaginatedResponse,
+    SuggestResponse,
+    ChangeFeedResponse,
+    SimilarJobsResponse,
+)
+from app.schemas.user import UserInDB
+from app.utils.auth import get_current_user
+from app.utils.cache import TTLCache, register_cache
+from app.utils.changes import get_horizon, read_changes
+from app.utils.events import subscribe, JOBS_PUBLISHED, JOBS_UNPUBLISHED
+from app.utils.export import ExportFormat, MEDIA_TYPES, iter_export
 from app.utils.sanitize import sanitize_search_query
+from app.utils.serialization import model_response, document_response, dumps
+from app.utils.similar import similar_jobs_index
+from app.utils.suggest import suggestion_index
 
 router = APIRouter(prefix="/jobs", tags=["Jobs"])
 logger = logging.getLogger(__name__)
 
 
+# Earth's equatorial radius, the value MongoDB's spherical geometry ($geoNear)
+# uses; converts radius_km into radians for $centerSphere so counts agree with it
+EARTH_RADIUS_KM = 6378.1
+
+_settings = get_settings()
+
+# (change log head, facet counts) keyed by normalized filter. An entry is
+# used only while the head is unchanged, so a publication handled by any
+# worker invalidates it; this worker's own publications also clear it
+_facet_cache = register_cache("facets", TTLCache(
+    maxsize=_settings.FACET_CACHE_MAX_ENTRIES,
+    ttl=_settings.FACET_CACHE_TTL_SECONDS,
+))
+# Request counts per filter, used to decide which filtered queries are popular
+_facet_query_counts = TTLCache(
+    maxsize=_settings.FACET_CACHE_MAX_ENTRIES * 4,
+    ttl=_settings.FACET_CACHE_TTL_SECONDS,
+)
+
+
+# Job detail documents keyed by id, bounded by count and serialized size
+_job_cache = register_cache("job_detail", TTLCache(
+    maxsize=_settings.JOB_CACHE_MAX_ENTRIES,
+    ttl=_settings.JOB_CACHE_TTL_SECONDS,
+    max_bytes=_settings.JOB_CACHE_MAX_BYTES,
+    sizeof=lambda doc: len(dumps(doc)),
+))
+# Well-formed ids with no public job, so repeated probes skip MongoDB
+_missing_job_cache = register_cache("job_detail_missing", TTLCache(
+    maxsize=_settings.JOB_NEGATIVE_CACHE_MAX_ENTRIES,
+    ttl=_settings.JOB_NEGATIVE_CACHE_TTL_SECONDS,
+))
+
+
+def _clear_facet_cache(**_) -> None:
+    _facet_cache.clear()
+
+
+def _invalidate_job_cache(jobs: list, **_) -> None:
+    for job in jobs:
+        job_id = str(job.get("_id") or job.get("id"))
+        _job_cache.pop(job_id)
+        _missing_job_cache.pop(job_id)
+
+
+subscribe(JOBS_PUBLISHED, _clear_facet_cache)
+subscribe(JOBS_UNPUBLISHED, _clear_facet_cache)
+subscribe(JOBS_PUBLISHED, _invalidate_job_cache)
+subscribe(JOBS_UNPUBLISHED, _invalidate_job_cache)
+subscribe(JOBS_PUBLISHED, suggestion_index.add_jobs)
+subscribe(JOBS_UNPUBLISHED, suggestion_index.remove_jobs)
+subscribe(JOBS_PUBLISHED, similar_jobs_index.add_jobs)
+subscribe(JOBS_UNPUBLISHED, similar_jobs_index.remove_jobs)
+
+# Neighbor lists (job ids and scores) of viewed jobs; unpublished neighbors
+# are dropped when the documents are fetched
+_similar_cache = register_cache("similar_jobs", TTLCache(
+    maxsize=_settings.SIMILAR_CACHE_MAX_ENTRIES,
+    ttl=_settings.SIMILAR_CACHE_TTL_SECONDS,
+))
+
+_suggest_build_lock = threading.Lock()
+_similar_build_lock = threading.Lock()
+
+
+def _ensure_suggestions_built() -> None:
+    """Build the suggestion index once, on first use."""
+    with _suggest_build_lock:
+        if suggestion_index.built_at is None:
+            suggestion_index.rebuild(get_public_jobs("public"))
+
+
+def _ensure_similar_built() -> None:
+    """Build the similar jobs index once, on first use."""
+    with _similar_build_lock:
+        if similar_jobs_index.built_at is None:
+            similar_jobs_index.rebuild(get_public_jobs("public"))
+
+
 def convert_objectid(doc: dict) -> dict:
     """Convert MongoDB ObjectId to string id."""
     if doc and "_id" in doc:
@@ -21,13 +124,152 @@ def convert_objectid(doc: dict) -> dict:
     return doc
 
 
-@router.get("", response_model=PaginatedResponse)
+def build_job_filter(
+    q: Optional[str] = None,
+    source: Optional[str] = None,
+    location: Optional[str] = None,
+    min_salary: Optional[int] = None,
+    max_salary: Optional[int] = None,
+    posted_after: Optional[date] = None,
+    posted_before: Optional[date] = None,
+) -> dict:
+    """
+    Build the MongoDB filter shared by the public listing endpoints.
+
+    Args:
+        q: Search query (matches title, company or location)
+        source: Exact source name
+        location: Partial location match
+        min_salary: Salary range must reach at least this amount
+        max_salary: Salary range must start at or below this amount
+        posted_after: Earliest posted date (inclusive)
+        posted_before: Latest posted date (inclusive)
+
+    Returns:
+        MongoDB filter dict
+
+    Raises:
+        HTTPException: If a range's lower bound is above its upper bound
+    """
+    if min_salary is not None and max_salary is not None and min_salary > max_salary:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="min_salary cannot be greater than max_salary"
+        )
+    if posted_after and posted_before and posted_after > posted_before:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="posted_after cannot be later than posted_before"
+        )
+
+    filter_q = {}
+
+    if q:
+        # Use text search if available, fallback to regex
+        safe_q = sanitize_search_query(q)
+        filter_q["$or"] = [
+            {"title": {"$regex": safe_q, "$options": "i"}},
+            {"company": {"$regex": safe_q, "$options": "i"}},
+            {"location": {"$regex": safe_q, "$options": "i"}}
+        ]
+
+    if source:
+        filter_q["source"] = source
+
+    if location:
+        safe_loc = sanitize_search_query(location)
+        filter_q["location"] = {"$regex": safe_loc, "$options": "i"}
+
+    # Salary ranges overlap the requested range; jobs without a parsed
+    # salary are excluded once a salary filter is given.
+    if min_salary is not None:
+        filter_q["salary_parsed.max"] = {"$gte": min_salary}
+    if max_salary is not None:
+        filter_q["salary_parsed.min"] = {"$lte": max_salary}
+
+    # posted_date_parsed is stored as midnight UTC of the posted day
+    posted_range = {}
+    if posted_after:
+        posted_range["$gte"] = datetime.combine(posted_after, time.min, tzinfo=timezone.utc)
+    if posted_before:
+        posted_range["$lt"] = datetime.combine(
+            posted_before + timedelta(days=1), time.min, tzinfo=timezone.utc
+        )
+    if posted_range:
+        filter_q["posted_date_parsed"] = posted_range
+
+    return filter_q
+
+
+def build_facet_stages() -> dict:
+    """
+    Build the $facet sub-pipelines for source, city, tag and salary band counts.
+
+    City and salary band are precomputed on each public_jobs document.
+    """
+    limit = _settings.FACET_LIMIT
+    return {
+        "source": [
+            {"$sortByCount": {"$ifNull": ["$source", "unknown"]}},
+            {"$limit": limit},
+        ],
+        "city": [
+            {"$match": {"facets.city": {"$type": "string", "$ne": ""}}},
+            {"$sortByCount": "$facets.city"},
+            {"$limit": limit},
+        ],
+        "tag": [
+            {"$unwind": "$tags"},
+            {"$sortByCount": "$tags"},
+            {"$limit": limit},
+        ],
+        "salary_band": [
+            {"$sortByCount": "$facets.salary_band"},
+        ],
+    }
+
+
+def format_facets(raw: dict) -> dict:
+    """Convert $facet output into {facet: [{value, count}, ...]}."""
+    facets = {}
+    for name in ("source", "city", "tag", "salary_band"):
+        buckets = []
+        for bucket in raw.get(name, []):
+            buckets.append({"value": bucket["_id"], "count": bucket["count"]})
+        facets[name] = buckets
+    return facets
+
+
+def _facet_cache_key(filter_q: dict) -> Optional[str]:
+    """
+    Return the cache key for a filter if its facets should be cached.
+
+    Unfiltered requests are always cached; filtered ones only once they
+    have been requested FACET_CACHE_POPULAR_THRESHOLD times.
+    """
+    key = json.dumps(filter_q, sort_keys=True, default=str)
+    if not filter_q:
+        return key
+
+    seen = _facet_query_counts.get(key, 0) + 1
+    _facet_query_counts.set(key, seen)
+    if seen >= _settings.FACET_CACHE_POPULAR_THRESHOLD:
+        return key
+    return None
+
+
+@router.get("", response_model=FacetedPaginatedResponse)
 async def get_approved_jobs_list(
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(20, ge=1, le=100, description="Items per page"),
     q: Optional[str] = Query(None, max_length=200, description="Search query"),
     source: Optional[str] = Query(None, max_length=50, description="Filter by source"),
     location: Optional[str] = Query(None, max_length=200, description="Filter by location"),
+    min_salary: Optional[int] = Query(None, ge=0, description="Minimum salary"),
+    max_salary: Optional[int] = Query(None, ge=0, description="Maximum salary"),
+    posted_after: Optional[date] = Query(None, description="Posted on or after (YYYY-MM-DD)"),
+    posted_before: Optional[date] = Query(None, description="Posted on or before (YYYY-MM-DD)"),
+    facets: bool = Query(False, description="Include source/city/tag/salary band counts"),
 ):
     """
     Get paginated list of approved jobs.
@@ -39,53 +281,150 @@ async def get_approved_jobs_list(
     - **q**: Optional search query (searches title, company, location)
     - **source**: Optional filter by source
     - **location**: Optional filter by location (partial match)
+    - **min_salary** / **max_salary**: Optional salary range (overlapping jobs match)
+    - **posted_after** / **posted_before**: Optional posted date range (inclusive)
+    - **facets**: Also return counts by source, city, tag and salary band
+      for all jobs matching the filters
     """
-    approved = get_approved_jobs()
+    public = get_public_jobs("public")
     skip = (page - 1) * per_page
 
-    # Build filter
-    filter_q = {}
+    filter_q = build_job_filter(
+        q=q,
+        source=source,
+        location=location,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        posted_after=posted_after,
+        posted_before=posted_before,
+    )
+    # Page and total always come from the indexed find/count path:
+    # $facet sub-pipelines cannot use indexes, so the page sort stays out of it
+    page_query = run_db(
+        lambda: list(
+            public.find(filter_q)
+            .sort("approved_at", -1)
+            .skip(skip)
+            .limit(per_page)
+        )
+    )
+    total_query = run_db(public.count_documents, filter_q)
+    facet_counts = None
+
+    if facets:
+        # Cached facets are simply not recomputed, unless jobs were
+        # (un)published since (the change log head is shared by all workers)
+        cache_key = _facet_cache_key(filter_q)
+        if cache_key:
+            _, head = await run_db(get_horizon)
+            cached = _facet_cache.get(cache_key)
+            if cached is not None and cached[0] == head:
+                facet_counts = cached[1]
+
+    if facets and facet_counts is None:
+        docs, total, raw_facets = await asyncio.gather(
+            page_query,
+            total_query,
+            run_db(lambda: next(public.aggregate([{"$match": filter_q}, {"$facet": build_facet_stages()}]))),
+        )
+        facet_counts = format_facets(raw_facets)
+        if cache_key:
+            _facet_cache.set(cache_key, (head, facet_counts))
+    else:
+        docs, total = await asyncio.gather(page_query, total_query)
 
-    if q:
-        # Use text search if available, fallback to regex
-        safe_q = sanitize_search_query(q)
-        filter_q["$or"] = [
-            {"title": {"$regex": safe_q, "$options": "i"}},
-            {"company": {"$regex": safe_q, "$options": "i"}},
-            {"location": {"$regex": safe_q, "$options": "i"}}
-        ]
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
 
-    if source:
-        filter_q["source"] = source
+    # public_jobs holds only public fields; just convert ObjectId to string
+    clean_docs = [convert_objectid(doc) for doc in docs]
 
-    if location:
-        safe_loc = sanitize_search_query(location)
-        # Add to existing $or or create new location filter
-        if "$or" not in filter_q:
-            filter_q["location"] = {"$regex": safe_loc, "$options": "i"}
-        else:
-            # If we already have a search query, add location to the filters
-            filter_q["location"] = {"$regex": safe_loc, "$options": "i"}
-
-    total = approved.count_documents(filter_q)
-    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
+    return model_response(
+        FacetedPaginatedResponse,
+        page=page,
+        per_page=per_page,
+        total=total,
+        total_pages=total_pages,
+        data=clean_docs,
+        facets=facet_counts
+    )
 
-    docs = list(
-        approved.find(filter_q)
-        .sort("approved_at", -1)
-        .skip(skip)
-        .limit(per_page)
+
+@router.get("/nearby", response_model=PaginatedResponse)
+async def get_nearby_jobs(
+    lat: float = Query(..., ge=-90, le=90, description="Latitude of the search center"),
+    lon: float = Query(..., ge=-180, le=180, description="Longitude of the search center"),
+    radius_km: float = Query(25, gt=0, le=1000, description="Search radius in kilometers"),
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    q: Optional[str] = Query(None, max_length=200, description="Search query"),
+    source: Optional[str] = Query(None, max_length=50, description="Filter by source"),
+    min_salary: Optional[int] = Query(None, ge=0, description="Minimum salary"),
+    max_salary: Optional[int] = Query(None, ge=0, description="Maximum salary"),
+    posted_after: Optional[date] = Query(None, description="Posted on or after (YYYY-MM-DD)"),
+    posted_before: Optional[date] = Query(None, description="Posted on or before (YYYY-MM-DD)"),
+):
+    """
+    Get approved jobs within a radius of a point, nearest first.
+
+    This is a public endpoint - no authentication required.
+
+    - **lat** / **lon**: Search center
+    - **radius_km**: Search radius in kilometers (default 25, max 1000)
+    - **q**: Optional search query (searches title, company, location)
+    - **source**: Optional filter by source
+    - **min_salary** / **max_salary**: Optional salary range (overlapping jobs match)
+    - **posted_after** / **posted_before**: Optional posted date range (inclusive)
+
+    Each job includes a `distance_km` field.
+    """
+    public = get_public_jobs("public")
+    skip = (page - 1) * per_page
+    center = {"type": "Point", "coordinates": [lon, lat]}
+
+    filter_q = build_job_filter(
+        q=q,
+        source=source,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        posted_after=posted_after,
+        posted_before=posted_before,
     )
 
-    # Convert ObjectId to string and remove internal fields
+    # $geoNear returns documents sorted by distance; count with an
+    # equivalent $geoWithin so both queries use the 2dsphere index.
+    total = await run_db(public.count_documents, {
+        **filter_q,
+        "location_normalized.geo": {
+            "$geoWithin": {"$centerSphere": [[lon, lat], radius_km / EARTH_RADIUS_KM]}
+        }
+    })
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
+
+    pipeline = [
+        {
+            "$geoNear": {
+                "near": center,
+                "key": "location_normalized.geo",
+                "distanceField": "distance_m",
+                "maxDistance": radius_km * 1000,
+                "spherical": True,
+                "query": filter_q,
+            }
+        },
+        {"$skip": skip},
+        {"$limit": per_page},
+    ]
+
+    docs = await run_db(lambda: list(public.aggregate(pipeline)))
+
     clean_docs = []
     for doc in docs:
         doc = convert_objectid(doc)
-        # Remove admin-only fields from public response
-        doc.pop("approved_by", None)
+        doc["distance_km"] = round(doc.pop("distance_m") / 1000, 2)
         clean_docs.append(doc)
 
-    return PaginatedResponse(
+    return model_response(
+        PaginatedResponse,
         page=page,
         per_page=per_page,
         total=total,
@@ -94,34 +433,251 @@ async def get_approved_jobs_list(
     )
 
 
+@router.get("/suggest", response_model=SuggestResponse)
+async def get_suggestions(
+    prefix: str = Query(..., min_length=1, max_length=100, description="Text typed so far"),
+    field: Optional[Literal["title", "company", "location"]] = Query(
+        None, description="Restrict suggestions to one field"
+    ),
+    limit: int = Query(10, ge=1, le=25, description="Maximum suggestions"),
+):
+    """
+    Typeahead suggestions for titles, companies and cities.
+
+    This is a public endpoint - no authentication required.
+
+    Served from in-memory prefix indexes (matching the start of any word),
+    weighted by the number of approved jobs using each term.
+    """
+    if suggestion_index.built_at is None:
+        await run_db(_ensure_suggestions_built)
+
+    return SuggestResponse(
+        prefix=prefix,
+        suggestions=suggestion_index.suggest(prefix, field=field, limit=limit)
+    )
+
+
+@router.get("/export")
+async def export_jobs(
+    format: ExportFormat = Query("ndjson", description="ndjson or csv"),
+    gzip: bool = Query(False, description="Gzip-compress the stream"),
+    q: Optional[str] = Query(None, max_length=200, description="Search query"),
+    source: Optional[str] = Query(None, max_length=50, description="Filter by source"),
+    location: Optional[str] = Query(None, max_length=200, description="Filter by location"),
+    min_salary: Optional[int] = Query(None, ge=0, description="Minimum salary"),
+    max_salary: Optional[int] = Query(None, ge=0, description="Maximum salary"),
+    posted_after: Optional[date] = Query(None, description="Posted on or after (YYYY-MM-DD)"),
+    posted_before: Optional[date] = Query(None, description="Posted on or before (YYYY-MM-DD)"),
+    current_user: UserInDB = Depends(get_current_user),
+):
+    """
+    Stream every approved job matching the filters.
+
+    Requires authentication (any role).
+
+    Replaces paging through /jobs for bulk mirroring: rows are streamed
+    from a server-side cursor in _id order, so memory stays constant
+    regardless of result size.
+
+    - **format**: `ndjson` (one JSON object per line) or `csv` (with header row)
+    - **gzip**: Compress the stream (sent with `Content-Encoding: gzip`)
+    - Filters are the same as `GET /jobs`
+    """
+    filter_q = build_job_filter(
+        q=q,
+        source=source,
+        location=location,
+        min_salary=min_salary,
+        max_salary=max_salary,
+        posted_after=posted_after,
+        posted_before=posted_before,
+    )
+
+    logger.info(f"Job export ({format}) requested by {current_user.username}")
+
+    headers = {"Content-Disposition": f'attachment; filename="jobs.{format}"'}
+    if gzip:
+        headers["Content-Encoding"] = "gzip"
+
+    return StreamingResponse(
+        iter_export(
+            get_public_jobs("public"),
+            filter_q,
+            fmt=format,
+            compress=gzip,
+            batch_size=_settings.EXPORT_BATCH_SIZE,
+        ),
+        media_type=MEDIA_TYPES[format],
+        headers=headers,
+    )
+
+
+@router.get("/changes", response_model=ChangeFeedResponse)
+async def get_job_changes(
+    since: Optional[str] = Query(None, max_length=20, description="Token from a previous response"),
+    limit: int = Query(500, ge=1, le=1000, description="Maximum log entries to read"),
+    current_user: UserInDB = Depends(get_current_user),
+):
+    """
+    Incremental feed of published, updated and unpublished jobs.
+
+    Requires authentication (any role).
+
+    - **since**: `next_token` from the previous call. Omit it to get the
+      current token only: take it, run `/jobs/export`, then poll from it.
+    - **limit**: Maximum change log entries read per call
+
+    Each job appears at most once per page with its latest state:
+    `upsert` includes the public job document, `delete` means it was
+    unpublished. Keep calling with `next_token` while `has_more` is true.
+    Returns 410 if the token predates the log's retention window.
+    """
+    horizon, head = await run_db(get_horizon)
+
+    if since is None:
+        return ChangeFeedResponse(changes=[], next_token=str(head), has_more=False)
+
+    if not since.isdigit():
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid change token"
+        )
+    token = int(since)
+    if token < horizon:
+        raise HTTPException(
+            status_code=status.HTTP_410_GONE,
+            detail="Change token expired; resync from /jobs/export"
+        )
+
+    entries, next_token, has_more = await run_db(
+        read_changes, token, limit, _settings.CHANGE_FEED_SETTLE_SECONDS
+    )
+
+    # Attach current public documents; a job unpublished after its upsert
+    # entry was written is reported as deleted. Read from the primary: the
+    # log entries are, and a lagging secondary would turn fresh publishes
+    # into deletes that the token then moves past.
+    upsert_ids = [entry["job_id"] for entry in entries if entry["op"] == "upsert"]
+    docs = {}
+    if upsert_ids:
+        public = get_public_jobs()
+        docs = {
+            doc["_id"]: doc
+            for doc in await run_db(lambda: list(public.find({"_id": {"$in": upsert_ids}})))
+        }
+
+    changes = []
+    for entry in entries:
+        doc = docs.get(entry["job_id"])
+        changes.append({
+            "job_id": str(entry["job_id"]),
+            "op": "upsert" if doc else "delete",
+            "changed_at": entry["changed_at"],
+            "job": convert_objectid(doc) if doc else None,
+        })
+
+    return model_response(
+        ChangeFeedResponse,
+        changes=changes,
+        next_token=str(next_token),
+        has_more=has_more,
+    )
+
+
 @router.get("/{job_id}")
 async def get_job_detail(job_id: str):
     """
     Get a single approved job by ID.
 
     This is a public endpoint - no authentication required.
+    Served from an in-process cache when possible (see JOB_CACHE_*).
     """
-    approved = get_approved_jobs()
-
-    try:
-        job = approved.find_one({"_id": ObjectId(job_id)})
-    except Exception:
+    if not ObjectId.is_valid(job_id):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Invalid job ID format"
         )
 
-    if not job:
+    job = _job_cache.get(job_id)
+    if job is None:
+        if _missing_job_cache.get(job_id):
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+
+        public = get_public_jobs("public")
+        job = await run_db(public.find_one, {"_id": ObjectId(job_id)})
+
+        if not job:
+            _missing_job_cache.set(job_id, True)
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+
+        job = convert_objectid(job)
+        _job_cache.set(job_id, job)
+
+    return document_response(job)
+
+
+@router.get("/{job_id}/similar", response_model=SimilarJobsResponse)
+async def get_similar_jobs(
+    job_id: str,
+    limit: int = Query(10, ge=1, le=50, description="Maximum similar jobs"),
+):
+    """
+    Get jobs similar to a job, most similar first.
+
+    This is a public endpoint - no authentication required.
+
+    Similarity is the cosine of hashed TF-IDF vectors built from title,
+    tags, company and description; each job includes a `similarity` score.
+    """
+    if not ObjectId.is_valid(job_id):
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid job ID format"
         )
 
-    job = convert_objectid(job)
-    # Remove admin-only fields from public response
-    job.pop("approved_by", None)
+    if similar_jobs_index.built_at is None:
+        await run_db(_ensure_similar_built)
+
+    public = get_public_jobs("public")
+
+    if job_id not in similar_jobs_index:
+        # Published by another worker since the last rebuild
+        job = await run_db(public.find_one, {"_id": ObjectId(job_id)})
+        if not job:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Job not found"
+            )
+        await run_db(similar_jobs_index.add_jobs, [job])
+
+    # Cached lists hold the maximum limit so any smaller limit is a slice
+    neighbors = _similar_cache.get(job_id)
+    if neighbors is None:
+        # A full matrix-vector product; numpy releases the GIL, keep it off the loop
+        neighbors = await run_db(similar_jobs_index.neighbors, job_id, 50)
+        _similar_cache.set(job_id, neighbors)
+    neighbors = neighbors[:limit]
+
+    scores = {neighbor_id: score for neighbor_id, score in neighbors}
+    docs = await run_db(
+        lambda: list(public.find({"_id": {"$in": [ObjectId(i) for i in scores]}}))
+    )
+
+    similar = []
+    for doc in docs:
+        doc = convert_objectid(doc)
+        doc["similarity"] = round(scores[doc["id"]], 4)
+        similar.append(doc)
+    similar.sort(key=lambda doc: doc["similarity"], reverse=True)
 
-    return job
+    return model_response(SimilarJobsResponse, job_id=job_id, data=similar)
 
 
 @router.get("/source/{source}")
@@ -137,28 +693,27 @@ async def get_jobs_by_source(
 
     - **source**: Source name (e.g., indeed, zoho, amazon)
     """
-    approved = get_approved_jobs()
+    public = get_public_jobs("public")
     skip = (page - 1) * per_page
 
     filter_q = {"source": source}
 
-    total = approved.count_documents(filter_q)
+    total = await run_db(public.count_documents, filter_q)
     total_pages = (total + per_page - 1) // per_page if total > 0 else 1
 
-    docs = list(
-        approved.find(filter_q)
-        .sort("approved_at", -1)
-        .skip(skip)
-        .limit(per_page)
+    docs = await run_db(
+        lambda: list(
+            public.find(filter_q)
+            .sort("approved_at", -1)
+            .skip(skip)
+            .limit(per_page)
+        )
     )
 
-    clean_docs = []
-    for doc in docs:
-        doc = convert_objectid(doc)
-        doc.pop("approved_by", None)
-        clean_docs.append(doc)
+    clean_docs = [convert_objectid(doc) for doc in docs]
 
-    return PaginatedResponse(
+    return model_response(
+        PaginatedResponse,
         page=page,
         per_page=per_page,
         total=total,
@@ -0,0 +1,154 @@
+"""
+Saved searches router for job alerts.
+
+Newly published jobs are matched against every saved search as they are
+approved (see app/utils/saved_searches.py); users read their matches here.
+"""
+from fastapi import APIRouter, HTTPException, status, Depends, Query
+from datetime import datetime, timezone
+from bson import ObjectId
+from typing import List
+import logging
+
+from app.config import get_settings
+from app.db import get_saved_searches, get_search_matches, run_db
+from app.schemas.responses import SuccessResponse
+from app.schemas.search import SavedSearchCreate, SavedSearchResponse, SearchMatchPage
+from app.schemas.user import UserInDB
+from app.utils.auth import get_current_user
+from app.utils.events import subscribe, JOBS_PUBLISHED
+from app.utils.saved_searches import record_matches, saved_search_index
+
+router = APIRouter(prefix="/searches", tags=["Saved Searches"])
+logger = logging.getLogger(__name__)
+
+_settings = get_settings()
+
+
+def _record_published_matches(jobs: list, **_) -> None:
+    record_matches(
+        jobs,
+        get_saved_searches(),
+        get_search_matches(),
+        batch_size=_settings.SAVED_SEARCH_MATCH_BATCH_SIZE,
+    )
+
+
+subscribe(JOBS_PUBLISHED, _record_published_matches)
+
+
+def convert_objectid(doc: dict) -> dict:
+    """Convert MongoDB ObjectId to string id."""
+    if doc and "_id" in doc:
+        doc["id"] = str(doc.pop("_id"))
+    return doc
+
+
+@router.post("", response_model=SavedSearchResponse, status_code=status.HTTP_201_CREATED)
+async def create_saved_search(
+    search: SavedSearchCreate,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Save a search and get alerted when new jobs match it.
+
+    - **name**: Label for the search
+    - **q**: Words that must start a word in the title, company or location
+    - **source**: Exact source name
+    - **location**: Words that must start a word in the location
+    - **min_salary** / **max_salary**: Salary range (overlapping jobs match)
+
+    At least one of q, source or location is required.
+    """
+    searches = get_saved_searches()
+
+    count = await run_db(searches.count_documents, {"user_id": current_user.id})
+    if count >= _settings.SAVED_SEARCH_MAX_PER_USER:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Saved search limit reached ({_settings.SAVED_SEARCH_MAX_PER_USER})"
+        )
+
+    doc = {
+        **search.model_dump(),
+        "user_id": current_user.id,
+        "created_at": datetime.now(timezone.utc),
+    }
+    result = await run_db(searches.insert_one, doc)
+    doc["_id"] = result.inserted_id
+    saved_search_index.add(doc)
+
+    logger.info(f"Saved search created by {current_user.username}: {search.name}")
+
+    return SavedSearchResponse(**convert_objectid(doc))
+
+
+@router.get("", response_model=List[SavedSearchResponse])
+async def list_saved_searches(current_user: UserInDB = Depends(get_current_user)):
+    """List the current user's saved searches."""
+    searches = get_saved_searches()
+    docs = await run_db(
+        lambda: list(searches.find({"user_id": current_user.id}).sort("created_at", -1))
+    )
+    return [SavedSearchResponse(**convert_objectid(doc)) for doc in docs]
+
+
+@router.get("/matches", response_model=SearchMatchPage)
+async def list_search_matches(
+    page: int = Query(1, ge=1, description="Page number"),
+    per_page: int = Query(20, ge=1, le=100, description="Items per page"),
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """
+    Get jobs matched by the current user's saved searches, newest first.
+    """
+    matches = get_search_matches()
+    skip = (page - 1) * per_page
+    filter_q = {"user_id": current_user.id}
+
+    total = await run_db(matches.count_documents, filter_q)
+    docs = await run_db(
+        lambda: list(
+            matches.find(filter_q, {"user_id": 0, "notified": 0})
+            .sort("matched_at", -1)
+            .skip(skip)
+            .limit(per_page)
+        )
+    )
+    total_pages = (total + per_page - 1) // per_page if total > 0 else 1
+
+    return SearchMatchPage(
+        page=page,
+        per_page=per_page,
+        total=total,
+        total_pages=total_pages,
+        data=[convert_objectid(doc) for doc in docs]
+    )
+
+
+@router.delete("/{search_id}", response_model=SuccessResponse)
+async def delete_saved_search(
+    search_id: str,
+    current_user: UserInDB = Depends(get_current_user)
+):
+    """Delete one of the current user's saved searches and its matches."""
+    if not ObjectId.is_valid(search_id):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid search ID format"
+        )
+
+    searches = get_saved_searches()
+    result = await run_db(
+        searches.delete_one, {"_id": ObjectId(search_id), "user_id": current_user.id}
+    )
+    if result.deleted_count == 0:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Saved search not found"
+        )
+
+    saved_search_index.remove(search_id)
+    await run_db(get_search_matches().delete_many, {"search_id": search_id})
+
+    return SuccessResponse(message="Saved search deleted successfully")
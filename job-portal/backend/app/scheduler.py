@@ -7,8 +7,19 @@ import os
 from datetime import datetime, timedelta
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
+from apscheduler.triggers.interval import IntervalTrigger
 from typing import Optional
 
+from app.config import get_settings
+from app.db import get_public_jobs, get_saved_searches
+from app.utils.automod import get_automod_config, run_automod_backlog
+from app.utils.changes import compact_changes
+from app.utils.public_jobs import expire_approved_jobs
+from app.utils.saved_searches import saved_search_index
+from app.utils.similar import similar_jobs_index
+from app.utils.stats import reconcile_stats
+from app.utils.suggest import suggestion_index
+
 logger = logging.getLogger(__name__)
 
 # Module-level scheduler instance
@@ -48,12 +59,88 @@ def run_daily_scrape():
         logger.exception(f"Scheduled scrape failed: {e}")
 
 
+def refresh_suggestions():
+    """
+    Rebuild the in-memory typeahead indexes from published jobs.
+
+    Approvals made by this process are indexed immediately; the periodic
+    rebuild picks up approvals handled by other workers.
+    """
+    try:
+        suggestion_index.rebuild(get_public_jobs("public"))
+    except Exception as e:
+        logger.exception(f"Suggestion index rebuild failed: {e}")
+
+
+def refresh_similar_jobs():
+    """Re-vectorize published jobs with current IDF weights (only once the index is in use)."""
+    if similar_jobs_index.built_at is None:
+        return
+    try:
+        similar_jobs_index.rebuild(get_public_jobs("public"))
+    except Exception as e:
+        logger.exception(f"Similar jobs index rebuild failed: {e}")
+
+
+def refresh_saved_searches():
+    """Reload the saved search index (drops searches deleted on other workers)."""
+    try:
+        saved_search_index.rebuild(get_saved_searches())
+    except Exception as e:
+        logger.exception(f"Saved search index rebuild failed: {e}")
+
+
+def compact_change_log():
+    """Compact the job change log behind /jobs/changes."""
+    try:
+        compact_changes(get_settings().CHANGE_FEED_RETENTION_DAYS)
+    except Exception as e:
+        logger.exception(f"Change log compaction failed: {e}")
+
+
+def expire_jobs():
+    """Unpublish and delete approved jobs older than APPROVED_JOB_TTL_DAYS."""
+    settings = get_settings()
+    if settings.APPROVED_JOB_TTL_DAYS <= 0:
+        return
+    try:
+        expire_approved_jobs(settings.APPROVED_JOB_TTL_DAYS)
+    except Exception as e:
+        logger.exception(f"Job expiry sweep failed: {e}")
+
+
+def reconcile_job_stats():
+    """Recount the /admin/stats counters to correct drift."""
+    try:
+        reconcile_stats()
+    except Exception as e:
+        logger.exception(f"Job statistics reconciliation failed: {e}")
+
+
+def run_auto_moderation():
+    """Auto-moderate new pending jobs (when AUTOMOD_ENABLED)."""
+    settings = get_settings()
+    if not settings.AUTOMOD_ENABLED:
+        return
+    try:
+        run_automod_backlog(get_automod_config(), settings.AUTOMOD_BATCH_SIZE, settings.AUTOMOD_MAX_BATCHES)
+    except Exception as e:
+        logger.exception(f"Auto-moderation failed: {e}")
+
+
 def start_scheduler():
     """
     Start the background scheduler.
 
     Schedules:
     - Daily scrape at 2:00 AM UTC
+    - Typeahead index rebuild every SUGGEST_REBUILD_MINUTES
+    - Change log compaction every CHANGE_FEED_COMPACT_MINUTES
+    - Saved search index reload every SAVED_SEARCH_REBUILD_MINUTES
+    - Similar jobs index rebuild every SIMILAR_REBUILD_MINUTES
+    - Statistics reconciliation every STATS_RECONCILE_MINUTES
+    - Auto-moderation every AUTOMOD_INTERVAL_MINUTES (if enabled)
+    - Approved job expiry every JOB_EXPIRY_SWEEP_MINUTES (if APPROVED_JOB_TTL_DAYS is set)
     """
     global _scheduler
 
@@ -79,6 +166,70 @@ def start_scheduler():
         replace_existing=True
     )
 
+    # Periodically rebuild typeahead indexes
+    settings = get_settings()
+    _scheduler.add_job(
+        refresh_suggestions,
+        IntervalTrigger(minutes=settings.SUGGEST_REBUILD_MINUTES),
+        id="refresh_suggestions",
+        name="Typeahead Index Rebuild",
+        replace_existing=True
+    )
+
+    # Compact the change feed log
+    _scheduler.add_job(
+        compact_change_log,
+        IntervalTrigger(minutes=settings.CHANGE_FEED_COMPACT_MINUTES),
+        id="compact_change_log",
+        name="Change Log Compaction",
+        replace_existing=True
+    )
+
+    # Reload saved searches for alert matching
+    _scheduler.add_job(
+        refresh_saved_searches,
+        IntervalTrigger(minutes=settings.SAVED_SEARCH_REBUILD_MINUTES),
+        id="refresh_saved_searches",
+        name="Saved Search Index Reload",
+        replace_existing=True
+    )
+
+    # Re-weight similar job vectors
+    _scheduler.add_job(
+        refresh_similar_jobs,
+        IntervalTrigger(minutes=settings.SIMILAR_REBUILD_MINUTES),
+        id="refresh_similar_jobs",
+        name="Similar Jobs Index Rebuild",
+        replace_existing=True
+    )
+
+    # Correct drift in the statistics counters
+    _scheduler.add_job(
+        reconcile_job_stats,
+        IntervalTrigger(minutes=settings.STATS_RECONCILE_MINUTES),
+        id="reconcile_job_stats",
+        name="Job Statistics Reconciliation",
+        replace_existing=True
+    )
+
+    # Auto-moderate new pending jobs
+    _scheduler.add_job(
+        run_auto_moderation,
+        IntervalTrigger(minutes=settings.AUTOMOD_INTERVAL_MINUTES),
+        id="auto_moderation",
+        name="Auto-moderation",
+        replace_existing=True
+    )
+
+    # Expire old approved jobs through the unpublish path
+    _scheduler.add_job(
+        expire_jobs,
+        IntervalTrigger(minutes=settings.JOB_EXPIRY_SWEEP_MINUTES),
+        id="expire_jobs",
+        name="Approved Job Expiry",
+        replace_existing=True
+    )
+
     _scheduler.start()
     logger.info("Background scheduler started - Daily scrape scheduled for 2:00 AM UTC")
 
@@ -1,8 +1,8 @@
 """
 Job schemas for ingestion, storage, and API responses.
 """
-from pydantic import BaseModel, Field, field_validator
-from typing import Optional, List, Dict
+from pydantic import BaseModel, Field, field_validator, model_validator
+from typing import Any, Optional, List, Dict, Literal
 from datetime import datetime
 
 
@@ -12,12 +12,19 @@ class SalaryParsed(BaseModel):
     max: Optional[int] = None
 
 
+class GeoPoint(BaseModel):
+    """Schema for a GeoJSON point (coordinates are [lon, lat])."""
+    type: Literal["Point"] = "Point"
+    coordinates: List[float] = Field(..., min_length=2, max_length=2)
+
+
 class LocationNormalized(BaseModel):
     """Schema for normalized/geocoded location."""
     raw: str
     lat: Optional[float] = None
     lon: Optional[float] = None
     display_name: Optional[str] = None
+    geo: Optional[GeoPoint] = None
 
 
 class JobBase(BaseModel):
@@ -48,18 +55,19 @@ class JobInDB(JobBase):
     """Schema for job as stored in database."""
     id: Optional[str] = None
     dedupe_hash: Optional[str] = None
-    posted_date_parsed: Optional[str] = None
+    posted_date_parsed: Optional[datetime] = None
     salary_parsed: Optional[SalaryParsed] = None
     location_normalized: Optional[LocationNormalized] = None
     tags: List[str] = []
-    ingested_at: Optional[str] = None
+    ingested_at: Optional[datetime] = None
+    review_priority: Optional[int] = None
 
     # Approval fields
-    approved_at: Optional[str] = None
+    approved_at: Optional[datetime] = None
     approved_by: Optional[str] = None
 
     # Rejection fields
-    rejected_at: Optional[str] = None
+    rejected_at: Optional[datetime] = None
     rejected_by: Optional[str] = None
     rejection_reason: Optional[str] = None
 
@@ -85,15 +93,95 @@ class JobRejection(BaseModel):
     reason: str = Field(..., min_length=1, max_length=500)
 
 
+class JobUnpublish(BaseModel):
+    """Schema for taking an approved job off the public site."""
+    job_id: str = Field(..., min_length=1)
+    reason: str = Field(..., min_length=1, max_length=500)
+
+
 class BulkJobApproval(BaseModel):
     """Schema for bulk job approval request."""
     job_ids: List[str] = Field(..., min_length=1, max_length=100)
+    transactional: bool = False  # All-or-nothing (requires a replica set)
 
 
 class BulkJobRejection(BaseModel):
     """Schema for bulk job rejection request."""
     job_ids: List[str] = Field(..., min_length=1, max_length=100)
     reason: str = Field(..., min_length=1, max_length=500)
+    transactional: bool = False  # All-or-nothing (requires a replica set)
+
+
+class JobFilterAction(BaseModel):
+    """Schema for approving pending jobs by filter (same filters as the pending listing)."""
+    q: Optional[str] = Field(None, max_length=200)
+    source: Optional[str] = Field(None, max_length=50)
+    tag: Optional[str] = Field(None, max_length=100)
+
+    @model_validator(mode="after")
+    def require_filter(self):
+        """Refuse an empty filter, which would match every pending job."""
+        if not any(v and v.strip() for v in (self.q, self.source, self.tag)):
+            raise ValueError("At least one of q, source or tag is required")
+        return self
+
+
+class JobFilterRejection(JobFilterAction):
+    """Schema for rejecting pending jobs by filter."""
+    reason: str = Field(..., min_length=1, max_length=500)
+
+
+class ModerationTask(BaseModel):
+    """Schema for the progress of a filter-based approve/reject."""
+    id: str
+    action: Literal["approve", "reject"]
+    criteria: Dict[str, Optional[str]]
+    status: Literal["running", "completed", "failed"]
+    total: int
+    processed: int
+    created_by: str
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    error: Optional[str] = None
+
+
+class QueueRelease(BaseModel):
+    """Schema for releasing review queue leases (all of the caller's when job_ids is omitted)."""
+    job_ids: Optional[List[str]] = Field(None, max_length=100)
+
+
+class AuditEntry(BaseModel):
+    """Schema for one moderation audit log entry."""
+    id: str
+    at: datetime
+    actor: str
+    action: str
+    job_ids: List[str]
+    job_count: int
+    details: Dict[str, Any] = {}
+
+
+class AutomodDecision(BaseModel):
+    """Schema for one auto-moderation decision (dry runs)."""
+    job_id: str
+    decision: Literal["approve", "reject", "hold"]
+    score: int
+    reasons: List[str]
+
+
+class AutomodRun(BaseModel):
+    """Schema for an auto-moderation run summary."""
+    id: str
+    trigger: str
+    dry_run: bool = False
+    started_at: datetime
+    scanned: int
+    approved: int
+    rejected: int
+    held: int
+    duration_seconds: float
+    jobs_per_second: float
+    decisions: Optional[List[AutomodDecision]] = None
 
 
 class JobStats(BaseModel):
@@ -105,3 +193,21 @@ class JobStats(BaseModel):
     jobs_by_source: Dict[str, int]
     jobs_today: int
     jobs_this_week: int
+
+
+class TimeSeriesPoint(BaseModel):
+    """Schema for one point of the ingest/moderation time series."""
+    start: datetime
+    ingested: int = 0
+    approved: int = 0
+    rejected: int = 0
+    unpublished: int = 0
+
+
+class JobTimeSeries(BaseModel):
+    """Schema for ingest/moderation volumes over time (empty points omitted)."""
+    granularity: str
+    start: datetime
+    end: datetime
+    source: Optional[str] = None
+    points: List[TimeSeriesPoint]
@@ -2,6 +2,7 @@
 Standard API response schemas for consistent response formatting.
 """
 from pydantic import BaseModel
+from datetime import datetime
 from typing import Optional, Any, List, Dict
 
 
@@ -33,6 +34,57 @@ class PaginatedResponse(BaseModel):
     data: List[Any]
 
 
+class FacetBucket(BaseModel):
+    """Schema for a single facet value and its count."""
+    value: Any
+    count: int
+
+
+class FacetedPaginatedResponse(PaginatedResponse):
+    """Schema for paginated list responses with optional facet counts."""
+    facets: Optional[Dict[str, List[FacetBucket]]] = None
+
+
+class Suggestion(BaseModel):
+    """Schema for a single typeahead suggestion."""
+    text: str
+    field: str
+    weight: int
+
+
+class SuggestResponse(BaseModel):
+    """Schema for typeahead suggestion responses."""
+    prefix: str
+    suggestions: List[Suggestion]
+
+
+class SimilarJobsResponse(BaseModel):
+    """Schema for similar jobs responses."""
+    job_id: str
+    data: List[Any]
+
+
+class LeasedJobsResponse(BaseModel):
+    """Schema for a batch of review queue jobs leased to the caller."""
+    lease_expires_at: datetime
+    data: List[Any]
+
+
+class JobChange(BaseModel):
+    """Schema for a single change feed entry (job is None for deletes)."""
+    job_id: str
+    op: str
+    changed_at: datetime
+    job: Optional[Dict[str, Any]] = None
+
+
+class ChangeFeedResponse(BaseModel):
+    """Schema for change feed pages."""
+    changes: List[JobChange]
+    next_token: str
+    has_more: bool
+
+
 class HealthResponse(BaseModel):
     """Schema for health check response."""
     status: str
@@ -59,3 +111,16 @@ class BulkOperationResult(BaseModel):
     success: int = 0
     not_found: int = 0
     errors: int = 0
+    # Per job ID: moved, not_found, invalid_id or error
+    outcomes: Dict[str, str] = {}
+
+    @classmethod
+    def from_outcomes(cls, outcomes: Dict[str, str]) -> "BulkOperationResult":
+        """Summarize per-ID outcomes (invalid IDs count as errors)."""
+        values = list(outcomes.values())
+        return cls(
+            success=values.count("moved"),
+            not_found=values.count("not_found"),
+            errors=len(values) - values.count("moved") - values.count("not_found"),
+            outcomes=outcomes,
+        )
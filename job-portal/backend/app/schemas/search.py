@@ -0,0 +1,55 @@
+"""
+Saved search schemas for job alerts.
+"""
+from pydantic import BaseModel, Field, model_validator
+from typing import List, Optional
+from datetime import datetime
+
+from app.schemas.responses import PaginatedResponse
+
+
+class SavedSearchCreate(BaseModel):
+    """Schema for saving a search."""
+    name: str = Field(..., min_length=1, max_length=100)
+    q: Optional[str] = Field(None, max_length=200)
+    source: Optional[str] = Field(None, max_length=50)
+    location: Optional[str] = Field(None, max_length=200)
+    min_salary: Optional[int] = Field(None, ge=0)
+    max_salary: Optional[int] = Field(None, ge=0)
+
+    @model_validator(mode="after")
+    def validate_criteria(self) -> "SavedSearchCreate":
+        """Require a query, source or location, and a valid salary range."""
+        if not any(v and v.strip() for v in (self.q, self.source, self.location)):
+            raise ValueError("At least one of q, source or location is required")
+        if (
+            self.min_salary is not None
+            and self.max_salary is not None
+            and self.min_salary > self.max_salary
+        ):
+            raise ValueError("min_salary cannot be greater than max_salary")
+        return self
+
+
+class SavedSearchResponse(SavedSearchCreate):
+    """Schema for saved search API response."""
+    id: str
+    created_at: datetime
+
+
+class SearchMatchResponse(BaseModel):
+    """Schema for a job matched by a saved search."""
+    id: str
+    search_id: str
+    search_name: str
+    job_id: str
+    title: str
+    company: str
+    location: Optional[str] = None
+    source: Optional[str] = None
+    matched_at: datetime
+
+
+class SearchMatchPage(PaginatedResponse):
+    """Schema for a page of saved search matches."""
+    data: List[SearchMatchResponse]
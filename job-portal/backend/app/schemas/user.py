@@ -79,6 +79,7 @@ class UserInDB(BaseModel):
     is_active: bool = True
     created_at: datetime
     last_login: Optional[datetime] = None
+    token_version: int = 0  # Incremented on password, role or status changes
 
 
 class PasswordChange(BaseModel):
@@ -115,5 +116,6 @@ class TokenPayload(BaseModel):
     """Schema for decoded JWT token payload."""
     sub: str  # User ID
     role: str
+    ver: int = 0  # token_version of the user when issued
     type: str  # "access" or "refresh"
     exp: datetime
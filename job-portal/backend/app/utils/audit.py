@@ -0,0 +1,156 @@
+"""
+Asynchronous, batched moderation audit log.
+
+Moderation endpoints call record() with what happened; it only appends to
+an in-process queue, so no request waits for an audit write. A writer
+thread drains the queue into the audit_log collection with insert_many,
+flushing every AUDIT_FLUSH_SECONDS or as soon as AUDIT_BATCH_SIZE entries
+are waiting, and once more on shutdown.
+
+The queue is bounded (AUDIT_QUEUE_SIZE). If the database falls so far
+behind that it fills up, new entries are dropped and counted rather than
+growing memory or blocking requests; dropped entries are logged.
+"""
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+import logging
+import queue
+import threading
+
+from bson import ObjectId
+
+from app.db import get_audit_log
+
+logger = logging.getLogger(__name__)
+
+# Stored job IDs per entry; bulk actions beyond this keep only the count
+MAX_JOB_IDS = 1000
+
+
+class AuditWriter:
+    """Bounded queue of audit entries drained by a background thread."""
+
+    def __init__(self, queue_size: int, batch_size: int, flush_seconds: float):
+        self._queue: "queue.Queue[dict]" = queue.Queue(maxsize=queue_size)
+        self._batch_size = batch_size
+        self._flush_seconds = flush_seconds
+        self._stop = threading.Event()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        # Guards the counters, updated from request threads and the writer
+        self._lock = threading.Lock()
+        self.written = 0
+        self.dropped = 0
+
+    def submit(self, entry: dict) -> None:
+        """Queue an entry without blocking (dropped if the queue is full)."""
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+            logger.error(f"Audit queue full, dropped entry: {entry['action']} by {entry['actor']}")
+            return
+        if self._queue.qsize() >= self._batch_size:
+            self._wake.set()
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="audit-writer", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the thread after writing everything still queued."""
+        if self._thread is None:
+            return
+        self._stop.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self._thread = None
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self._wake.wait(self._flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def _take(self) -> List[dict]:
+        batch = []
+        while len(batch) < self._batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        return batch
+
+    def flush(self) -> int:
+        """Write queued entries in batches. Returns entries written."""
+        written = 0
+        while True:
+            batch = self._take()
+            if not batch:
+                return written
+            try:
+                get_audit_log().insert_many(batch, ordered=False)
+                written += len(batch)
+                with self._lock:
+                    self.written += len(batch)
+            except Exception as e:
+                with self._lock:
+                    self.dropped += len(batch)
+                logger.error(f"Failed to write {len(batch)} audit entries: {e}")
+
+
+_writer: Optional[AuditWriter] = None
+
+
+def start_audit_writer(queue_size: int, batch_size: int, flush_seconds: float) -> None:
+    """Create and start the process-wide writer (called from the app lifespan)."""
+    global _writer
+    if _writer is None:
+        _writer = AuditWriter(queue_size, batch_size, flush_seconds)
+    _writer.start()
+
+
+def stop_audit_writer() -> None:
+    """Flush and stop the writer."""
+    if _writer is not None:
+        _writer.stop()
+
+
+def record(
+    action: str,
+    actor: str,
+    job_ids: Iterable[Any] = (),
+    **details: Any,
+) -> None:
+    """
+    Queue one audit entry.
+
+    Args:
+        action: e.g. "approve", "bulk_reject", "approve_by_filter", "automod"
+        actor: Username (or "auto")
+        job_ids: Jobs acted on (ObjectIds or strings)
+        **details: Extra fields (reason, counts, task ID, ...)
+    """
+    ids = [ObjectId(job_id) if isinstance(job_id, str) else job_id for job_id in job_ids]
+    entry: Dict[str, Any] = {
+        "at": datetime.now(timezone.utc),
+        "actor": actor,
+        "action": action,
+        "job_ids": ids[:MAX_JOB_IDS],
+        "job_count": len(ids),
+        "details": details,
+    }
+    if _writer is None:
+        # No lifespan (scripts, tests): write through
+        try:
+            get_audit_log().insert_one(entry)
+        except Exception as e:
+            logger.error(f"Failed to write audit entry: {e}")
+        return
+    _writer.submit(entry)
+
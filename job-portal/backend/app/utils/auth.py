@@ -1,27 +1,60 @@
 """
 Authentication utilities for JWT token handling and password management.
+
+Tokens carry the user's token_version ("ver"). Changing a password, role
+or active status goes through update_user_account, which increments it,
+so tokens issued earlier stop being accepted. Authenticated users are
+cached per worker by ID: a request whose token version matches the cached
+user is authorized without a database read. A token newer than the cached
+entry reloads the user; other workers drop their stale entry within
+USER_CACHE_TTL_SECONDS.
+
+bcrypt is deliberately slow (hundreds of milliseconds per hash), so async
+handlers hash and verify passwords on a small dedicated thread pool
+(PASSWORD_HASH_WORKERS) instead of the event loop or the database pool. At
+most PASSWORD_HASH_MAX_PENDING calls may be queued or running; beyond that
+the request is answered 503 at once, so a burst of logins cannot delay
+other traffic on the worker.
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Optional, Literal, Callable
+from typing import Any, Optional, Literal, Callable
+import asyncio
+import functools
+import threading
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from bson import ObjectId
+from pymongo import ReturnDocument
 import logging
 
 from app.config import get_settings
-from app.db import get_users
+from app.db import get_users, run_db
 from app.schemas.user import UserInDB
+from app.utils.cache import TTLCache, register_cache
 
 logger = logging.getLogger(__name__)
 
+_settings = get_settings()
+
+# Authenticated users keyed by ID (see get_token_user)
+_user_cache = register_cache("users", TTLCache(
+    maxsize=_settings.USER_CACHE_MAX_ENTRIES,
+    ttl=_settings.USER_CACHE_TTL_SECONDS,
+))
+
 # Password hashing configuration
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 # OAuth2 scheme for token extraction from Authorization header
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
+_hash_executor: Optional[ThreadPoolExecutor] = None
+_hash_lock = threading.Lock()
+_hash_pending = 0
+
 
 # ===========================================
 # Password Utilities
@@ -37,6 +70,61 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def get_password_executor() -> ThreadPoolExecutor:
+    """Get or create the thread pool used for bcrypt."""
+    global _hash_executor
+    if _hash_executor is None:
+        with _hash_lock:
+            if _hash_executor is None:
+                _hash_executor = ThreadPoolExecutor(
+                    max_workers=_settings.PASSWORD_HASH_WORKERS,
+                    thread_name_prefix="bcrypt",
+                )
+    return _hash_executor
+
+
+def shutdown_password_executor() -> None:
+    """Shut down the bcrypt thread pool (called from the app lifespan)."""
+    global _hash_executor
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=True)
+        _hash_executor = None
+
+
+async def _run_hash(fn: Callable[..., Any], *args: Any) -> Any:
+    """
+    Run a bcrypt call on the password pool.
+
+    Raises:
+        HTTPException: 503 if PASSWORD_HASH_MAX_PENDING calls are already queued or running
+    """
+    global _hash_pending
+    with _hash_lock:
+        if _hash_pending >= _settings.PASSWORD_HASH_MAX_PENDING:
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many password checks in progress, retry shortly",
+                headers={"Retry-After": "1"},
+            )
+        _hash_pending += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(get_password_executor(), functools.partial(fn, *args))
+    finally:
+        with _hash_lock:
+            _hash_pending -= 1
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """verify_password on the password pool."""
+    return await _run_hash(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """get_password_hash on the password pool."""
+    return await _run_hash(get_password_hash, password)
+
+
 # ===========================================
 # JWT Token Utilities
 # ===========================================
@@ -93,6 +181,11 @@ def create_refresh_token(data: dict) -> str:
     return jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
 
 
+def token_claims(user: UserInDB) -> dict:
+    """Payload for a user's access and refresh tokens."""
+    return {"sub": user.id, "role": user.role, "ver": user.token_version}
+
+
 def decode_token(token: str, expected_type: str = "access") -> Optional[dict]:
     """
     Decode and validate a JWT token.
@@ -166,31 +259,107 @@ def get_user_by_id(user_id: str) -> Optional[UserInDB]:
     return None
 
 
-def authenticate_user(username_or_email: str, password: str) -> Optional[UserInDB]:
+def get_user_by_login(username_or_email: str) -> Optional[UserInDB]:
+    """
+    Find a user by username or email with one query.
+
+    Usernames cannot contain "@", so at most one user matches.
+    """
+    value = username_or_email.lower()
+    user_doc = get_users().find_one({"$or": [{"username": value}, {"email": value}]})
+
+    if user_doc:
+        user_doc["id"] = str(user_doc.pop("_id"))
+        return UserInDB(**user_doc)
+
+    return None
+
+
+def update_user_account(user_id: str, changes: Optional[dict] = None) -> Optional[UserInDB]:
+    """
+    Update a user and revoke their existing tokens.
+
+    Use for every change that must take effect on issued tokens (password,
+    role, is_active): token_version is incremented in the same update and
+    the user is dropped from this worker's cache.
+
+    Args:
+        user_id: User ID
+        changes: Fields to $set (None only revokes tokens)
+
+    Returns:
+        The updated user, or None if not found
+    """
+    update = {"$inc": {"token_version": 1}}
+    if changes:
+        update["$set"] = changes
+    user_doc = get_users().find_one_and_update(
+        {"_id": ObjectId(user_id)},
+        update,
+        return_document=ReturnDocument.AFTER,
+    )
+    _user_cache.pop(user_id)
+    if user_doc is None:
+        return None
+    user_doc["id"] = str(user_doc.pop("_id"))
+    return UserInDB(**user_doc)
+
+
+async def authenticate_user(username_or_email: str, password: str) -> Optional[UserInDB]:
     """
     Authenticate a user by username/email and password.
 
+    The lookup runs on the database pool and bcrypt on the password pool,
+    so neither blocks the event loop.
+
     Args:
         username_or_email: Username or email address
         password: Plain text password
 
     Returns:
         UserInDB if authenticated, None otherwise
+
+    Raises:
+        HTTPException: 503 if the password pool is saturated
     """
-    # Try to find user by username first, then email
-    user = get_user_by_username(username_or_email)
-    if not user:
-        user = get_user_by_email(username_or_email)
+    user = await run_db(get_user_by_login, username_or_email)
 
     if not user:
         return None
 
-    if not verify_password(password, user.hashed_password):
+    if not await verify_password_async(password, user.hashed_password):
         return None
 
     return user
 
 
+async def get_token_user(payload: dict) -> Optional[UserInDB]:
+    """
+    Resolve the user a decoded token was issued to.
+
+    Served from the user cache when the cached user has the token's
+    version; a token newer than the cached entry reloads the user.
+
+    Returns:
+        The user, or None if not found or the token was revoked
+    """
+    user_id = payload.get("sub")
+    if user_id is None:
+        return None
+    version = payload.get("ver", 0)
+
+    user = _user_cache.get(user_id)
+    if user is None or user.token_version < version:
+        user = await run_db(get_user_by_id, user_id)
+        if user is None:
+            return None
+        _user_cache.set(user_id, user)
+
+    if user.token_version != version:
+        return None
+    return user
+
+
 # ===========================================
 # FastAPI Dependencies
 # ===========================================
@@ -200,7 +369,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
     FastAPI dependency to get the current authenticated user.
 
     Raises:
-        HTTPException: If token is invalid or user not found
+        HTTPException: If token is invalid or revoked, or user not found
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -212,11 +381,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> UserInDB:
     if payload is None:
         raise credentials_exception
 
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise credentials_exception
-
-    user = get_user_by_id(user_id)
+    user = await get_token_user(payload)
     if user is None:
         raise credentials_exception
 
@@ -0,0 +1,332 @@
+"""
+Rules-based auto-moderation of the pending queue.
+
+Each new pending job gets a score from a small set of rules (source trust,
+spam phrases, placeholder companies, shortened apply links, ...). Jobs
+scoring at or above the approve threshold are approved, jobs at or below
+the reject threshold are rejected, both in bulk with "auto" as the
+moderator; everything in between is held for human review.
+
+Every scored job keeps its decision on an automod field (score, reasons,
+run) that travels with it into approved_jobs / rejected_jobs, and every
+run is recorded in automod_runs with its counts and throughput.
+
+A batch is claimed before scoring (automod.decision "claimed"), so
+scheduler instances in several workers never score the same job twice.
+Decisions are saved before the jobs are moved; jobs still pending with an
+approve or reject decision (a run that stopped in between) are picked up
+again by the next run.
+"""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Literal, Tuple
+from urllib.parse import urlparse
+import logging
+import re
+import time
+
+from bson import ObjectId
+from pymongo import UpdateOne
+
+from app.config import get_settings
+from app.db import get_approved_jobs, get_automod_runs, get_pending_jobs, get_rejected_jobs
+from app.utils import audit
+from app.utils.events import emit, JOBS_PUBLISHED
+from app.utils.moderation import CLAIM_FIELD, MOVE_FIELD, move_jobs
+from app.utils.public_jobs import publish_jobs
+
+logger = logging.getLogger(__name__)
+
+Decision = Literal["approve", "reject", "hold"]
+
+AUTO_MODERATOR = "auto"
+
+# Bump when the rules change, so decisions can be traced to the rules that made them
+RULES_VERSION = 1
+
+SPAM_PHRASES = [
+    "work from home and earn",
+    "earn money",
+    "earn up to",
+    "easy money",
+    "no experience needed",
+    "no investment",
+    "registration fee",
+    "data entry job",
+    "typing job",
+    "part time job for students",
+    "whatsapp",
+    "telegram",
+    "100% guaranteed",
+    "limited seats",
+]
+_SPAM_RE = re.compile("|".join(re.escape(phrase) for phrase in SPAM_PHRASES), re.IGNORECASE)
+
+PLACEHOLDER_COMPANIES = {"", "confidential", "company", "hiring", "n/a", "na", "unknown", "various"}
+
+SHORTENER_HOSTS = {"bit.ly", "tinyurl.com", "t.co", "goo.gl", "ow.ly", "is.gd", "cutt.ly", "rb.gy", "shorturl.at"}
+
+# Rule weights
+TRUSTED_SOURCE = 60
+SPAM_PHRASE = -60
+PLACEHOLDER_COMPANY = -40
+SHORT_TITLE = -30
+SHOUTING_TITLE = -30
+SHORTENED_URL = -40
+NO_APPLY_URL = -20
+HAS_SALARY = 10
+HAS_DESCRIPTION = 10
+
+
+@dataclass(frozen=True)
+class AutomodConfig:
+    """Thresholds and trusted sources for a run."""
+    trusted_sources: Tuple[str, ...]
+    approve_score: int
+    reject_score: int
+
+    def decide(self, score: int) -> Decision:
+        if score >= self.approve_score:
+            return "approve"
+        if score <= self.reject_score:
+            return "reject"
+        return "hold"
+
+
+def get_automod_config() -> AutomodConfig:
+    """Build the run configuration from settings."""
+    settings = get_settings()
+    return AutomodConfig(
+        trusted_sources=tuple(source.lower() for source in settings.AUTOMOD_TRUSTED_SOURCES),
+        approve_score=settings.AUTOMOD_APPROVE_SCORE,
+        reject_score=settings.AUTOMOD_REJECT_SCORE,
+    )
+
+
+def score_job(job: dict, trusted_sources: Iterable[str]) -> Tuple[int, List[str]]:
+    """
+    Score a pending job.
+
+    Returns:
+        (score, human-readable reason per rule that fired)
+    """
+    score = 0
+    reasons: List[str] = []
+
+    def fire(weight: int, reason: str) -> None:
+        nonlocal score
+        score += weight
+        reasons.append(f"{weight:+d} {reason}")
+
+    source = (job.get("source") or "").lower()
+    if source and source in trusted_sources:
+        fire(TRUSTED_SOURCE, f"trusted source {source}")
+
+    title = (job.get("title") or "").strip()
+    text = f"{title}\n{job.get('description') or ''}"
+    spam = sorted({match.group(0).lower() for match in _SPAM_RE.finditer(text)})
+    if spam:
+        fire(SPAM_PHRASE, f"spam phrases: {', '.join(spam)}")
+
+    if (job.get("company") or "").strip().lower() in PLACEHOLDER_COMPANIES:
+        fire(PLACEHOLDER_COMPANY, "placeholder company name")
+
+    letters = [c for c in title if c.isalpha()]
+    if len(letters) < 4:
+        fire(SHORT_TITLE, "title too short")
+    elif "!!" in title or (len(letters) >= 10 and sum(c.isupper() for c in letters) / len(letters) > 0.8):
+        fire(SHOUTING_TITLE, "shouting title")
+
+    apply_url = job.get("apply_url")
+    if not apply_url:
+        fire(NO_APPLY_URL, "no apply URL")
+    else:
+        host = (urlparse(apply_url).hostname or "").lower()
+        if host.startswith("www."):
+            host = host[4:]
+        if host in SHORTENER_HOSTS:
+            fire(SHORTENED_URL, f"shortened apply URL ({host})")
+
+    salary = job.get("salary_parsed") or {}
+    if salary.get("min") or salary.get("max"):
+        fire(HAS_SALARY, "salary stated")
+
+    if len((job.get("description") or "").strip()) >= 200:
+        fire(HAS_DESCRIPTION, "detailed description")
+
+    return score, reasons
+
+
+def _select_filter(rescore: bool) -> dict:
+    """
+    Pending jobs eligible for a run.
+
+    Not scored yet, plus jobs decided approve/reject whose move never ran
+    (a run interrupted between saving decisions and moving); when
+    rescoring, also held ones and claims of crashed runs. Jobs another
+    move has claimed are left to it.
+    """
+    decisions = [None, "approve", "reject"]
+    if rescore:
+        decisions += ["hold", "claimed"]
+    return {
+        "automod.decision": {"$in": decisions},
+        CLAIM_FIELD: {"$exists": False},
+        MOVE_FIELD: {"$exists": False},
+    }
+
+
+def _hold_failed(pending, outcomes: Dict[str, str], decision: Decision) -> int:
+    """
+    Leave jobs whose move failed to human review.
+
+    Covers errors (e.g. a dedupe_hash clash) and jobs another move had
+    claimed that are still pending, so neither is picked up again.
+    """
+    failed = [ObjectId(job_id) for job_id, outcome in outcomes.items() if outcome in ("error", "not_found")]
+    if not failed:
+        return 0
+    return pending.update_many(
+        {"_id": {"$in": failed}},
+        {
+            "$set": {"automod.decision": "hold"},
+            "$push": {"automod.reasons": f"auto-{decision} failed, left for review"},
+        },
+    ).modified_count
+
+
+def run_automod(
+    config: AutomodConfig,
+    batch_size: int,
+    trigger: str,
+    dry_run: bool = False,
+    rescore: bool = False,
+) -> dict:
+    """
+    Score and moderate one batch of pending jobs, oldest first.
+
+    Args:
+        config: Trusted sources and thresholds
+        batch_size: Maximum jobs scored
+        trigger: "scheduler" or the username of the admin who started it
+        dry_run: Score only; nothing is written or moved (and no run is recorded)
+        rescore: Also rescore jobs previously held for human review
+
+    Returns:
+        Run summary (counts, duration, throughput; per-job decisions for dry runs)
+    """
+    started_at = datetime.now(timezone.utc)
+    started = time.perf_counter()
+    run_id = ObjectId()
+    # Stored as a string on jobs: job documents are returned to clients as-is
+    run_ref = str(run_id)
+    pending = get_pending_jobs()
+    selector = _select_filter(rescore)
+
+    if dry_run:
+        jobs = list(pending.find(selector).sort("ingested_at", 1).limit(batch_size))
+    else:
+        ids = [doc["_id"] for doc in pending.find(selector, {"_id": 1}).sort("ingested_at", 1).limit(batch_size)]
+        if ids:
+            pending.update_many(
+                {"_id": {"$in": ids}, **selector},
+                {"$set": {"automod": {"decision": "claimed", "run_id": run_ref}}},
+            )
+        jobs = list(pending.find({"automod.run_id": run_ref, "automod.decision": "claimed"})) if ids else []
+
+    decisions: Dict[Decision, List[dict]] = {"approve": [], "reject": [], "hold": []}
+    updates = []
+    for job in jobs:
+        score, reasons = score_job(job, config.trusted_sources)
+        decision = config.decide(score)
+        job["automod"] = {
+            "decision": decision,
+            "score": score,
+            "reasons": reasons,
+            "rules_version": RULES_VERSION,
+            "run_id": run_ref,
+            "decided_at": started_at,
+        }
+        decisions[decision].append(job)
+        updates.append(UpdateOne({"_id": job["_id"]}, {"$set": {"automod": job["automod"]}}))
+
+    summary = {
+        "id": run_ref,
+        "trigger": trigger,
+        "dry_run": dry_run,
+        "started_at": started_at,
+        "scanned": len(jobs),
+        "approved": len(decisions["approve"]),
+        "rejected": len(decisions["reject"]),
+        "held": len(decisions["hold"]),
+    }
+
+    if dry_run:
+        summary["decisions"] = [
+            {"job_id": str(job["_id"]), **{k: job["automod"][k] for k in ("decision", "score", "reasons")}}
+            for job in jobs
+        ]
+    elif updates:
+        pending.bulk_write(updates, ordered=False)
+
+        if decisions["approve"]:
+            now = datetime.now(timezone.utc)
+            outcomes, moved = move_jobs(
+                pending,
+                get_approved_jobs(),
+                [str(job["_id"]) for job in decisions["approve"]],
+                {"approved_at": now, "approved_by": AUTO_MODERATOR},
+                session=None,
+            )
+            publish_jobs([job["_id"] for job in moved])
+            emit(JOBS_PUBLISHED, jobs=moved)
+            summary["approved"] = len(moved)
+            audit.record("approve", AUTO_MODERATOR, [job["_id"] for job in moved], automod_run=run_ref)
+            summary["held"] += _hold_failed(pending, outcomes, "approve")
+
+        if decisions["reject"]:
+            now = datetime.now(timezone.utc)
+            outcomes, moved = move_jobs(
+                pending,
+                get_rejected_jobs(),
+                [str(job["_id"]) for job in decisions["reject"]],
+                {
+                    "rejected_at": now,
+                    "rejected_by": AUTO_MODERATOR,
+                    "rejection_reason": "Auto-moderation (see automod.reasons)",
+                },
+                session=None,
+            )
+            summary["rejected"] = len(moved)
+            audit.record("reject", AUTO_MODERATOR, [job["_id"] for job in moved], automod_run=run_ref)
+            summary["held"] += _hold_failed(pending, outcomes, "reject")
+
+    duration = time.perf_counter() - started
+    summary["duration_seconds"] = round(duration, 3)
+    summary["jobs_per_second"] = round(len(jobs) / duration, 1) if jobs and duration > 0 else 0.0
+
+    if not dry_run and jobs:
+        get_automod_runs().insert_one({
+            "_id": run_id,
+            **{k: v for k, v in summary.items() if k != "id"},
+            "rules_version": RULES_VERSION,
+            "approve_score": config.approve_score,
+            "reject_score": config.reject_score,
+        })
+        logger.info(
+            f"Auto-moderation run {run_id}: {summary['scanned']} scanned, {summary['approved']} approved, "
+            f"{summary['rejected']} rejected, {summary['held']} held ({summary['jobs_per_second']} jobs/s)"
+        )
+
+    return summary
+
+
+def run_automod_backlog(config: AutomodConfig, batch_size: int, max_batches: int) -> int:
+    """Run batches until the unscored queue is empty or max_batches ran. Returns jobs scanned."""
+    scanned = 0
+    for _ in range(max_batches):
+        summary = run_automod(config, batch_size, trigger="scheduler")
+        scanned += summary["scanned"]
+        if summary["scanned"] < batch_size:
+            break
+    return scanned
@@ -0,0 +1,119 @@
+"""
+Small thread-safe in-process caches.
+"""
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+# Named caches whose stats are exposed to admins (see /admin/cache/stats)
+_registry: Dict[str, "TTLCache"] = {}
+
+
+class TTLCache:
+    """
+    Bounded LRU cache whose entries expire after a time-to-live.
+
+    Safe to share between request handlers and worker threads. Keeps
+    hit/miss counters so callers can expose cache effectiveness.
+
+    When max_bytes is set, sizeof(value) is recorded for every entry and
+    least recently used entries are evicted until the total fits, so a few
+    very large values cannot crowd out memory.
+    """
+
+    def __init__(
+        self,
+        maxsize: int,
+        ttl: float,
+        max_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof
+        self._data: "OrderedDict[Hashable, tuple[float, Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the cached value for key, or default if missing/expired."""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] <= now:
+                if entry is not None:
+                    self._remove(key)
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None) -> None:
+        """Store a value, evicting the least recently used entries if full."""
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        size = self.sizeof(value) if self.max_bytes is not None and self.sizeof else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            self.pop(key)
+            return
+        with self._lock:
+            self._remove(key)
+            self._data[key] = (expires_at, value, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, evicted = self._data.popitem(last=False)
+                self._bytes -= evicted[2]
+                self.evictions += 1
+
+    def pop(self, key: Hashable) -> None:
+        """Remove a single entry if present."""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict:
+        """Return size and hit/miss counters."""
+        lookups = self.hits + self.misses
+        stats = {
+            "entries": len(self._data),
+            "max_entries": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+        if self.max_bytes is not None:
+            stats["bytes"] = self._bytes
+            stats["max_bytes"] = self.max_bytes
+        return stats
+
+
+def register_cache(name: str, cache: TTLCache) -> TTLCache:
+    """Register a cache under a name so its stats are reported; returns the cache."""
+    _registry[name] = cache
+    return cache
+
+
+def cache_stats() -> Dict[str, dict]:
+    """Stats for every registered cache, keyed by name."""
+    return {name: cache.stats() for name, cache in sorted(_registry.items())}
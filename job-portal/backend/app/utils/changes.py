@@ -0,0 +1,147 @@
+"""
+Change log for the public job set, read by /jobs/changes.
+
+Every publish/unpublish appends one entry per job to job_changes with a
+monotonically increasing sequence number taken from the counters
+collection. Consumers resume from the last sequence they saw (the token),
+so a sync only reads what changed since then.
+
+The log is compacted periodically: only the newest entry per job is kept,
+and delete tombstones older than the retention window are dropped. Tokens
+from before the oldest dropped tombstone (the horizon) can no longer be
+resumed and must resync from /jobs/export.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Literal, Optional, Tuple
+import logging
+
+from bson import ObjectId
+from pymongo import DeleteMany, ReturnDocument
+from pymongo.client_session import ClientSession
+
+from app.db import get_counters, get_job_changes
+
+logger = logging.getLogger(__name__)
+
+ChangeOp = Literal["upsert", "delete"]
+
+COUNTER_ID = "job_changes"
+
+
+def _reserve_sequence(count: int, session: Optional[ClientSession] = None) -> int:
+    """Reserve count sequence numbers; returns the first one."""
+    counter = get_counters().find_one_and_update(
+        {"_id": COUNTER_ID},
+        {"$inc": {"seq": count}},
+        upsert=True,
+        return_document=ReturnDocument.AFTER,
+        session=session,
+    )
+    return counter["seq"] - count + 1
+
+
+def record_changes(
+    job_ids: Iterable[ObjectId],
+    op: ChangeOp,
+    session: Optional[ClientSession] = None,
+) -> None:
+    """Append one change entry per job."""
+    ids = list(job_ids)
+    if not ids:
+        return
+    # Timestamp before reserving sequence numbers, so the settle window in
+    # read_changes covers the whole allocate-then-insert gap
+    changed_at = datetime.now(timezone.utc)
+    first = _reserve_sequence(len(ids), session=session)
+    get_job_changes().insert_many(
+        [
+            {"seq": first + i, "job_id": job_id, "op": op, "changed_at": changed_at}
+            for i, job_id in enumerate(ids)
+        ],
+        ordered=False,
+        session=session,
+    )
+
+
+def get_horizon() -> Tuple[int, int]:
+    """Return (horizon, head): oldest resumable token and latest sequence number."""
+    counter = get_counters().find_one({"_id": COUNTER_ID}) or {}
+    return counter.get("horizon", 0), counter.get("seq", 0)
+
+
+def read_changes(since: int, limit: int, settle_seconds: int) -> Tuple[List[dict], int, bool]:
+    """
+    Read change entries after a token.
+
+    Entries younger than settle_seconds are held back: a writer may have
+    reserved a lower sequence number and not inserted it yet, and skipping
+    past it would lose that change for good.
+
+    Returns:
+        (entries, next_token, has_more) - entries keep only the latest
+        change per job, in sequence order
+    """
+    cutoff = datetime.now(timezone.utc) - timedelta(seconds=settle_seconds)
+    cursor = (
+        get_job_changes()
+        .find({"seq": {"$gt": since}}, {"_id": 0})
+        .sort("seq", 1)
+        .limit(limit)
+    )
+
+    latest = {}
+    next_token = since
+    fetched = 0
+    settled = True
+    for entry in cursor:
+        fetched += 1
+        changed_at = entry["changed_at"]
+        if changed_at.tzinfo is None:
+            changed_at = changed_at.replace(tzinfo=timezone.utc)
+        if changed_at > cutoff:
+            settled = False
+            break
+        latest.pop(entry["job_id"], None)
+        latest[entry["job_id"]] = entry
+        next_token = entry["seq"]
+
+    return list(latest.values()), next_token, settled and fetched == limit
+
+
+def compact_changes(retention_days: int) -> dict:
+    """
+    Drop superseded entries and expired delete tombstones.
+
+    Returns:
+        Counts of superseded and expired entries removed
+    """
+    changes = get_job_changes()
+
+    superseded = [
+        DeleteMany({"job_id": group["_id"], "seq": {"$lt": group["latest"]}})
+        for group in changes.aggregate([
+            {"$group": {"_id": "$job_id", "latest": {"$max": "$seq"}, "count": {"$sum": 1}}},
+            {"$match": {"count": {"$gt": 1}}},
+        ], allowDiskUse=True)
+    ]
+    removed_superseded = changes.bulk_write(superseded, ordered=False).deleted_count if superseded else 0
+
+    expired_filter = {
+        "op": "delete",
+        "changed_at": {"$lt": datetime.now(timezone.utc) - timedelta(days=retention_days)},
+    }
+    newest_expired = changes.find_one(expired_filter, {"seq": 1}, sort=[("seq", -1)])
+    removed_expired = 0
+    if newest_expired:
+        # Move the horizon first so no consumer resumes across a dropped tombstone
+        get_counters().update_one(
+            {"_id": COUNTER_ID}, {"$max": {"horizon": newest_expired["seq"]}}, upsert=True
+        )
+        removed_expired = changes.delete_many(
+            {**expired_filter, "seq": {"$lte": newest_expired["seq"]}}
+        ).deleted_count
+
+    logger.info(
+        f"Compacted job change log: {removed_superseded} superseded, {removed_expired} expired"
+    )
+    return {"superseded": removed_superseded, "expired": removed_expired}
@@ -0,0 +1,38 @@
+"""
+In-process publication events.
+
+Code paths that change what is publicly visible (approving or unpublishing
+jobs) emit an event; in-memory caches and indexes subscribe to stay current
+without polling the database.
+"""
+from collections import defaultdict
+from typing import Callable, Dict, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Payload: jobs=<list of published job documents>
+JOBS_PUBLISHED = "jobs_published"
+# Payload: jobs=<list of unpublished job documents>
+JOBS_UNPUBLISHED = "jobs_unpublished"
+
+_subscribers: Dict[str, List[Callable[..., None]]] = defaultdict(list)
+
+
+def subscribe(event: str, handler: Callable[..., None]) -> None:
+    """Register a handler to be called with the event payload as kwargs."""
+    _subscribers[event].append(handler)
+
+
+def emit(event: str, **payload) -> None:
+    """
+    Call every handler subscribed to event.
+
+    Handler failures are logged and never propagate to the caller, so a
+    broken cache cannot fail an approval.
+    """
+    for handler in _subscribers.get(event, []):
+        try:
+            handler(**payload)
+        except Exception as e:
+            logger.exception(f"Event handler {handler.__name__} failed for {event}: {e}")
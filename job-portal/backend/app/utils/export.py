@@ -0,0 +1,127 @@
+"""
+Streaming export of public jobs as NDJSON or CSV.
+
+Rows are read from a server-side cursor in batches and encoded into
+~64 KB chunks as they arrive, optionally gzip-compressed on the fly, so
+memory use stays flat no matter how many jobs match.
+"""
+from datetime import datetime
+from typing import Iterator, Literal
+import csv
+import io
+import logging
+import zlib
+
+from pymongo.collection import Collection
+
+from app.utils.serialization import dumps
+
+logger = logging.getLogger(__name__)
+
+ExportFormat = Literal["ndjson", "csv"]
+
+# Columns exported, in order (id is the job's _id as a string)
+EXPORT_FIELDS = [
+    "id",
+    "title",
+    "company",
+    "location",
+    "description",
+    "apply_url",
+    "posted_date",
+    "posted_date_parsed",
+    "salary",
+    "source",
+    "tags",
+    "approved_at",
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv; charset=utf-8",
+}
+
+CHUNK_SIZE = 64 * 1024
+
+
+def _export_row(doc: dict) -> dict:
+    """Flatten a public job document into the export columns."""
+    row = {field: doc.get(field) for field in EXPORT_FIELDS}
+    row["id"] = str(doc["_id"])
+    return row
+
+
+def _encode_csv(row: dict) -> bytes:
+    buffer = io.StringIO()
+    values = []
+    for field in EXPORT_FIELDS:
+        value = row[field]
+        if isinstance(value, list):
+            value = "|".join(str(v) for v in value)
+        elif isinstance(value, datetime):
+            value = value.isoformat()
+        values.append("" if value is None else value)
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue().encode("utf-8")
+
+
+def iter_export(
+    collection: Collection,
+    filter_q: dict,
+    fmt: ExportFormat = "ndjson",
+    compress: bool = False,
+    batch_size: int = 1000,
+) -> Iterator[bytes]:
+    """
+    Yield encoded export chunks for every job matching filter_q.
+
+    This is a blocking generator (it iterates a pymongo cursor); hand it to
+    StreamingResponse, which runs sync iterators in a worker thread.
+
+    Args:
+        collection: Collection to read from
+        filter_q: MongoDB filter
+        fmt: "ndjson" (one JSON object per line) or "csv" (with header row)
+        compress: Gzip the stream
+        batch_size: Documents fetched per cursor round trip
+    """
+    compressor = zlib.compressobj(wbits=31) if compress else None  # 31 = gzip container
+    projection = {field: 1 for field in EXPORT_FIELDS if field != "id"}
+    pending = []
+    pending_size = 0
+    exported = 0
+
+    def flush() -> bytes:
+        nonlocal pending, pending_size
+        data = b"".join(pending)
+        pending = []
+        pending_size = 0
+        return compressor.compress(data) if compressor else data
+
+    if fmt == "csv":
+        header = io.StringIO()
+        csv.writer(header).writerow(EXPORT_FIELDS)
+        pending.append(header.getvalue().encode("utf-8"))
+
+    cursor = collection.find(filter_q, projection, batch_size=batch_size).sort("_id", 1)
+    try:
+        for doc in cursor:
+            row = _export_row(doc)
+            line = _encode_csv(row) if fmt == "csv" else dumps(row) + b"\n"
+            pending.append(line)
+            pending_size += len(line)
+            exported += 1
+            if pending_size >= CHUNK_SIZE:
+                chunk = flush()
+                if chunk:
+                    yield chunk
+    finally:
+        cursor.close()
+
+    chunk = flush()
+    if compressor:
+        chunk += compressor.flush()
+    if chunk:
+        yield chunk
+
+    logger.info(f"Exported {exported} jobs as {fmt}{' (gzip)' if compress else ''}")
@@ -11,3 +11,13 @@ def compute_hash(job_dict: dict) -> str:
     }
     raw = json.dumps(parts, sort_keys=True, ensure_ascii=False)
     return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def compute_title_company_key(job_dict: dict) -> str:
+    """Key shared by reposts of a job (same title and company, any location or date)."""
+    parts = {
+        "title": " ".join((job_dict.get("title") or "").lower().split()),
+        "company": " ".join((job_dict.get("company") or "").lower().split()),
+    }
+    raw = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
@@ -0,0 +1,357 @@
+"""
+Set-based moves of jobs between moderation collections.
+
+A move claims every requested job with one update_many (a _move field
+carrying a token unique to the call), loads the claimed jobs, inserts them
+into the target with one unordered insert_many and removes the inserted
+ones from the source with one delete_many: four round trips regardless of
+batch size. Concurrent moves of the same jobs claim disjoint sets, so each
+job is moved, counted and published by exactly one of them. Optionally the
+steps run in a multi-document transaction (requires a replica set), making
+the move all-or-nothing.
+
+Single-job moves take the job out of the source with find_one_and_delete
+(so exactly one concurrent reviewer gets it) and write it to the target
+with an upsert keyed on _id: two round trips, and safe to retry (see
+move_job).
+
+Moves by filter never load whole documents into the application: each
+chunk of IDs is claimed with a conditional update_many, copied with an
+aggregation $merge and deleted server-side, with progress recorded on a
+task document (see move_by_filter).
+"""
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Literal, Optional, Tuple
+import logging
+
+from bson import ObjectId
+from pymongo.client_session import ClientSession
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from app.db import get_moderation_tasks
+from app.utils.review_queue import LEASE_FIELDS
+from app.utils.stats import count_sources, record_moved
+
+logger = logging.getLogger(__name__)
+
+MoveOutcome = Literal["moved", "not_found", "invalid_id", "error"]
+SingleMoveOutcome = Literal["moved", "already_moved", "not_found"]
+
+DUPLICATE_KEY = 11000
+
+
+# Marks jobs claimed by a bulk move: {"target": collection name, "stamp": fields, "token": call}
+MOVE_FIELD = "_move"
+
+# Marks pending jobs claimed by a filter move chunk ("<task id>:<chunk>")
+CLAIM_FIELD = "_claim"
+
+
+def _finish_move(source: Collection, job: dict, session: Optional[ClientSession]) -> Tuple[Collection, dict, bool]:
+    """
+    Finish a bulk move interrupted after its claim: copy the job as the claim says, then delete it.
+
+    A job already in the claim's target is not copied again. If the copy is
+    rejected by another unique index the claim is released and
+    DuplicateKeyError raised.
+
+    Returns:
+        (claim target, the document as moved, whether this call deleted it from source)
+    """
+    target = source.database[job[MOVE_FIELD]["target"]]
+    moved = {k: v for k, v in job.items() if k not in LEASE_FIELDS and k != MOVE_FIELD}
+    moved.update(job[MOVE_FIELD]["stamp"])
+    try:
+        target.insert_one(moved, session=session)
+    except DuplicateKeyError as e:
+        if "_id" not in ((e.details or {}).get("keyValue") or {}):
+            source.update_one({"_id": job["_id"]}, {"$unset": {MOVE_FIELD: ""}}, session=session)
+            raise
+    deleted = source.delete_one({"_id": job["_id"], MOVE_FIELD: job[MOVE_FIELD]}, session=session).deleted_count
+    return target, moved, deleted == 1
+
+
+def move_job(
+    source: Collection,
+    target: Collection,
+    job_id: ObjectId,
+    stamp: dict,
+    session: Optional[ClientSession] = None,
+) -> Tuple[SingleMoveOutcome, Optional[dict]]:
+    """
+    Move one job from source to target, applying stamp fields.
+
+    find_one_and_delete is the claim: exactly one concurrent caller gets
+    the document, so only that caller writes and counts it. The job is
+    then written to target with replace_one(upsert=True) on _id (two round
+    trips in total), so a copy left by an earlier attempt is overwritten
+    rather than duplicated. If that write fails (e.g. the job duplicates
+    another in target by dedupe_hash), the job is put back into source
+    and the error re-raised. Jobs a bulk or filter move has claimed are
+    left to that move.
+
+    A retry of a move that already happened finds the job in target and
+    reports "already_moved" with the stored document. A job still claimed
+    by a bulk move that was interrupted after its claim is first moved (and
+    counted) as that claim says.
+
+    Returns:
+        (outcome, moved or existing document; None if not found)
+    """
+    job = source.find_one_and_delete(
+        {"_id": job_id, MOVE_FIELD: {"$exists": False}, CLAIM_FIELD: {"$exists": False}},
+        session=session,
+    )
+    if job is not None:
+        moved = {k: v for k, v in job.items() if k not in LEASE_FIELDS}
+        moved.update(stamp)
+        try:
+            target.replace_one({"_id": job_id}, moved, upsert=True, session=session)
+        except Exception:
+            source.insert_one(job, session=session)
+            raise
+        record_moved(source.name, target.name, count_sources([moved]), session=session)
+        return "moved", moved
+
+    job = source.find_one({"_id": job_id, MOVE_FIELD: {"$exists": True}}, session=session)
+    if job is not None:
+        claim_target, moved, deleted = _finish_move(source, job, session)
+        if deleted:
+            record_moved(source.name, claim_target.name, count_sources([moved]), session=session)
+
+    existing = target.find_one({"_id": job_id}, session=session)
+    if existing is not None:
+        return "already_moved", existing
+    return "not_found", None
+
+
+def _move_batch(
+    source: Collection,
+    target: Collection,
+    ids: List[ObjectId],
+    stamp: dict,
+    session: ClientSession,
+    outcomes: Dict[str, MoveOutcome],
+) -> List[dict]:
+    """
+    Claim, copy and delete one batch; fills outcomes and returns moved documents.
+
+    Jobs another move has claimed are reported not_found. Only jobs this
+    call claimed are returned, so callers count and publish each job once.
+    """
+    token = str(ObjectId())
+    source.update_many(
+        {"_id": {"$in": ids}, MOVE_FIELD: {"$exists": False}, CLAIM_FIELD: {"$exists": False}},
+        {"$set": {MOVE_FIELD: {"target": target.name, "stamp": stamp, "token": token}}},
+        session=session,
+    )
+    jobs = list(source.find({"_id": {"$in": ids}, f"{MOVE_FIELD}.token": token}, session=session))
+    found = {job["_id"] for job in jobs}
+    for oid in ids:
+        if oid not in found:
+            outcomes[str(oid)] = "not_found"
+    if not jobs:
+        return []
+
+    for job in jobs:
+        for field in (*LEASE_FIELDS, MOVE_FIELD):
+            job.pop(field, None)
+        job.update(stamp)
+
+    failed = set()
+    try:
+        target.insert_many(jobs, ordered=False, session=session)
+    except BulkWriteError as e:
+        # Any write error has already aborted the server-side transaction
+        if session is not None and session.in_transaction:
+            raise
+        for error in e.details.get("writeErrors", []):
+            job = jobs[error["index"]]
+            # Already copied by an earlier interrupted move: this claim finishes it
+            if error.get("code") == DUPLICATE_KEY and "_id" in (error.get("keyValue") or {}):
+                continue
+            failed.add(job["_id"])
+            logger.error(f"Failed to move job {job['_id']} to {target.name}: {error.get('errmsg')}")
+
+    if failed:
+        source.update_many({"_id": {"$in": list(failed)}}, {"$unset": {MOVE_FIELD: ""}}, session=session)
+    moved = [job for job in jobs if job["_id"] not in failed]
+    if moved:
+        source.delete_many(
+            {"_id": {"$in": [job["_id"] for job in moved]}, f"{MOVE_FIELD}.token": token},
+            session=session,
+        )
+
+    for job in jobs:
+        outcomes[str(job["_id"])] = "error" if job["_id"] in failed else "moved"
+    return moved
+
+
+def move_jobs(
+    source: Collection,
+    target: Collection,
+    job_ids: List[str],
+    stamp: dict,
+    session: ClientSession,
+    transactional: bool = False,
+) -> Tuple[Dict[str, MoveOutcome], List[dict]]:
+    """
+    Move jobs from source to target, applying stamp fields to each.
+
+    Args:
+        source: Collection the jobs are taken from
+        target: Collection the jobs are inserted into
+        job_ids: Requested job IDs (strings; duplicates are ignored)
+        stamp: Fields set on every moved job (e.g. approved_at, approved_by)
+        session: Session used for every operation
+        transactional: Run in a transaction; on any failure nothing moves
+
+    Returns:
+        (outcome per requested ID, moved documents)
+    """
+    outcomes: Dict[str, MoveOutcome] = {}
+    ids: List[ObjectId] = []
+    for job_id in dict.fromkeys(job_ids):
+        if ObjectId.is_valid(job_id):
+            ids.append(ObjectId(job_id))
+        else:
+            outcomes[job_id] = "invalid_id"
+    if not ids:
+        return outcomes, []
+
+    if not transactional:
+        moved = _move_batch(source, target, ids, stamp, session, outcomes)
+        record_moved(source.name, target.name, count_sources(moved), session=session)
+        return outcomes, moved
+
+    attempt: Dict[str, MoveOutcome] = {}
+
+    def callback(s: ClientSession) -> List[dict]:
+        # with_transaction may retry; start each attempt from a clean slate
+        attempt.clear()
+        return _move_batch(source, target, ids, stamp, s, attempt)
+
+    try:
+        moved = session.with_transaction(callback)
+        outcomes.update(attempt)
+    except Exception as e:
+        logger.error(f"Transactional move to {target.name} aborted: {e}")
+        moved = []
+        for oid in ids:
+            outcomes[str(oid)] = "not_found" if attempt.get(str(oid)) == "not_found" else "error"
+    record_moved(source.name, target.name, count_sources(moved), session=session)
+    return outcomes, moved
+
+
+def create_task(action: str, criteria: dict, total: int, created_by: str) -> ObjectId:
+    """Create the progress document for a filter move (criteria as requested, not the query)."""
+    return get_moderation_tasks().insert_one({
+        "action": action,
+        "criteria": criteria,
+        "status": "running",
+        "total": total,
+        "processed": 0,
+        "created_by": created_by,
+        "created_at": datetime.now(timezone.utc),
+        "finished_at": None,
+        "error": None,
+    }).inserted_id
+
+
+def _undo_chunk(source: Collection, target: Collection, claim: str) -> None:
+    """Remove a failed chunk's copies from target and release its claim on the jobs still in source."""
+    ids = [doc["_id"] for doc in source.find({CLAIM_FIELD: claim}, {"_id": 1})]
+    if ids:
+        target.delete_many({"_id": {"$in": ids}, "moderation_batch": claim})
+        source.update_many({"_id": {"$in": ids}}, {"$unset": {CLAIM_FIELD: ""}})
+
+
+def move_by_filter(
+    task_id: ObjectId,
+    source: Collection,
+    target: Collection,
+    filter_q: dict,
+    stamp: dict,
+    chunk_size: int = 1000,
+    on_chunk: Optional[Callable[[str], None]] = None,
+) -> int:
+    """
+    Move every source job matching filter_q to target, chunk by chunk.
+
+    For each chunk:
+    1. Find up to chunk_size unclaimed matches (IDs only) and claim them
+       with a conditional update_many; jobs another move claimed in
+       between are skipped
+    2. Copy the claimed jobs with stamp applied ($merge into target)
+    3. delete_many the claimed jobs from the source
+
+    If a chunk fails before its jobs are deleted, its copies are removed
+    from target and the claim released, so no job is left in both.
+
+    Args:
+        on_chunk: Called with the chunk token after each chunk is copied,
+            e.g. to publish approved jobs (they carry moderation_batch)
+
+    Returns:
+        Number of jobs moved
+    """
+    tasks = get_moderation_tasks()
+    unclaimed = {CLAIM_FIELD: {"$exists": False}, MOVE_FIELD: {"$exists": False}}
+    moved = 0
+    chunk = 0
+    claim = None
+
+    try:
+        while True:
+            ids = [doc["_id"] for doc in source.find({**filter_q, **unclaimed}, {"_id": 1}).limit(chunk_size)]
+            if not ids:
+                break
+
+            chunk += 1
+            claim = f"{task_id}:{chunk}"
+            source.update_many({"_id": {"$in": ids}, **unclaimed}, {"$set": {CLAIM_FIELD: claim}})
+
+            source.aggregate([
+                {"$match": {CLAIM_FIELD: claim}},
+                {"$project": {CLAIM_FIELD: 0, **{field: 0 for field in LEASE_FIELDS}}},
+                {"$set": {**stamp, "moderation_batch": claim}},
+                {"$merge": {"into": target.name, "on": "_id", "whenMatched": "replace", "whenNotMatched": "insert"}},
+            ])
+
+            by_source = {
+                doc["_id"] or "unknown": doc["count"]
+                for doc in source.aggregate([
+                    {"$match": {CLAIM_FIELD: claim}},
+                    {"$group": {"_id": "$source", "count": {"$sum": 1}}},
+                ])
+            }
+            deleted = source.delete_many({CLAIM_FIELD: claim}).deleted_count
+            if deleted == 0:
+                continue
+
+            moved += deleted
+            record_moved(source.name, target.name, by_source)
+            tasks.update_one({"_id": task_id}, {"$inc": {"processed": deleted}})
+            if on_chunk:
+                on_chunk(claim)
+
+        tasks.update_one(
+            {"_id": task_id},
+            {"$set": {"status": "completed", "finished_at": datetime.now(timezone.utc)}},
+        )
+        logger.info(f"Moderation task {task_id}: moved {moved} jobs to {target.name}")
+
+    except Exception as e:
+        logger.exception(f"Moderation task {task_id} failed: {e}")
+        if claim:
+            try:
+                _undo_chunk(source, target, claim)
+            except Exception as undo_error:
+                logger.error(f"Moderation task {task_id}: could not undo chunk {claim}: {undo_error}")
+        tasks.update_one(
+            {"_id": task_id},
+            {"$set": {"status": "failed", "error": str(e), "finished_at": datetime.now(timezone.utc)}},
+        )
+
+    return moved
@@ -1,11 +1,13 @@
 from dateutil import parser
+from datetime import datetime, timezone
 import re
 from geopy.geocoders import Nominatim
 
 def parse_posted_date(raw_date_str):
+    """Parse a posted date into a BSON-friendly datetime (midnight UTC), or None."""
     try:
         dt = parser.parse(raw_date_str, fuzzy=True, dayfirst=False)
-        return dt.date().isoformat()
+        return datetime(dt.year, dt.month, dt.day, tzinfo=timezone.utc)
     except Exception:
         return None
 
@@ -31,7 +33,14 @@ def normalize_location(loc_str):
     try:
         loc = geolocator.geocode(loc_str, language="en", timeout=10)
         if not loc: return {"raw": loc_str}
-        return {"raw": loc_str, "lat": loc.latitude, "lon": loc.longitude, "display_name": loc.address}
+        return {
+            "raw": loc_str,
+            "lat": loc.latitude,
+            "lon": loc.longitude,
+            "display_name": loc.address,
+            # GeoJSON point (lon, lat order) served by the 2dsphere index
+            "geo": {"type": "Point", "coordinates": [loc.longitude, loc.latitude]},
+        }
     except Exception:
         return {"raw": loc_str}
 
@@ -45,3 +54,31 @@ def tag_source(job):
     if "python" in title or "django" in title: tags.add("skill:python")
     if job.get("source"): tags.add(f"source:{job['source']}")
     return list(tags)
+
+
+def review_priority(job, duplicate, source_weights, default_source_weight, now=None):
+    """
+    Score 0-100 for ordering the review queue (higher is reviewed first).
+
+    Source trust, freshness of posted_date_parsed and a stated salary raise
+    it; a likely repost (duplicate=True: same title and company seen before)
+    lowers it. duplicate=None means unknown and counts as neutral.
+    """
+    now = now or datetime.now(timezone.utc)
+    score = source_weights.get((job.get("source") or "").lower(), default_source_weight)
+
+    posted = job.get("posted_date_parsed")
+    if posted is None:
+        score += 5
+    else:
+        age_days = (now - posted).days
+        if age_days <= 1: score += 30
+        elif age_days <= 3: score += 20
+        elif age_days <= 7: score += 10
+
+    if job.get("salary_parsed"): score += 15
+
+    if duplicate is True: score -= 30
+    elif duplicate is False: score += 15
+
+    return max(0, min(100, score))
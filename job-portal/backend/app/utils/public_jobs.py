@@ -0,0 +1,180 @@
+"""
+Denormalized public read model for approved jobs.
+
+approved_jobs is the moderation system of record; public_jobs holds only the
+fields anonymous users may see, plus values precomputed for the public query
+shapes (description snippet, normalized city and salary band facets). It is
+maintained on the approve and unpublish paths, and public endpoints read
+only from it. Both paths also append to the change log (app/utils/changes.py).
+Approved jobs past APPROVED_JOB_TTL_DAYS are expired by a scheduled sweep
+through the same unpublish path (see expire_approved_jobs), rather than a
+TTL index that would delete them without a trace in the change log.
+
+The projection runs server-side as an aggregation ending in $merge, so one
+definition serves single approvals, bulk approvals and full rebuilds.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional
+import logging
+
+from bson import ObjectId
+from pymongo.client_session import ClientSession
+
+from app.db import get_approved_jobs, get_public_jobs
+from app.utils.changes import record_changes
+from app.utils.events import emit, JOBS_UNPUBLISHED
+from app.utils.moderation import MOVE_FIELD
+from app.utils.stats import record_removed
+
+logger = logging.getLogger(__name__)
+
+# Fields copied from approved_jobs; everything else (approved_by, dedupe_hash,
+# ingestion metadata, snapshot URLs) never reaches the public collection
+PUBLIC_FIELDS = [
+    "title",
+    "company",
+    "location",
+    "description",
+    "apply_url",
+    "posted_date",
+    "posted_date_parsed",
+    "salary",
+    "salary_parsed",
+    "source",
+    "location_normalized",
+    "tags",
+    "approved_at",
+]
+
+SNIPPET_LENGTH = 280
+
+# Salary band boundaries on salary_parsed.max (upper bound exclusive); the last band is open-ended
+SALARY_BANDS = [0, 300000, 600000, 1000000, 2000000, 5000000]
+
+
+def _salary_band_label(i: int) -> str:
+    lower = SALARY_BANDS[i]
+    if i == len(SALARY_BANDS) - 1:
+        return f"{lower}+"
+    return f"{lower}-{SALARY_BANDS[i + 1]}"
+
+
+def _salary_band_expr() -> dict:
+    """Aggregation expression mapping salary_parsed.max to a band label."""
+    branches = [{"case": {"$not": [{"$isNumber": "$salary_parsed.max"}]}, "then": "unspecified"}]
+    for i in range(1, len(SALARY_BANDS)):
+        branches.append({
+            "case": {"$lt": ["$salary_parsed.max", SALARY_BANDS[i]]},
+            "then": _salary_band_label(i - 1),
+        })
+    return {"$switch": {"branches": branches, "default": _salary_band_label(len(SALARY_BANDS) - 1)}}
+
+
+def public_projection_stages() -> List[dict]:
+    """Aggregation stages turning approved_jobs documents into public_jobs documents."""
+    return [
+        {"$project": {field: 1 for field in PUBLIC_FIELDS}},
+        {
+            "$set": {
+                "snippet": {
+                    "$substrCP": [
+                        {"$trim": {"input": {"$ifNull": ["$description", ""]}}},
+                        0,
+                        SNIPPET_LENGTH,
+                    ]
+                },
+                "facets": {
+                    "city": {
+                        "$cond": [
+                            {"$and": [{"$eq": [{"$type": "$location"}, "string"]}, {"$ne": ["$location", ""]}]},
+                            {"$trim": {"input": {"$arrayElemAt": [{"$split": ["$location", ","]}, 0]}}},
+                            None,
+                        ]
+                    },
+                    "salary_band": _salary_band_expr(),
+                },
+            }
+        },
+    ]
+
+
+def sync_public_jobs(match: dict, session: Optional[ClientSession] = None) -> None:
+    """
+    Upsert the public documents for approved jobs matching a filter.
+
+    Args:
+        match: Filter on approved_jobs (e.g. {"_id": {"$in": ids}}, or {} to rebuild all)
+        session: Optional session (not a transaction: $merge cannot run in one)
+    """
+    pipeline = [
+        {"$match": match},
+        *public_projection_stages(),
+        {
+            "$merge": {
+                "into": get_public_jobs().name,
+                "on": "_id",
+                "whenMatched": "replace",
+                "whenNotMatched": "insert",
+            }
+        },
+    ]
+    get_approved_jobs().aggregate(pipeline, session=session)
+
+
+def publish_jobs(job_ids: Iterable[ObjectId], session: Optional[ClientSession] = None) -> None:
+    """Copy newly approved jobs into the public read model."""
+    ids = list(job_ids)
+    if ids:
+        sync_public_jobs({"_id": {"$in": ids}}, session=session)
+        record_changes(ids, "upsert", session=session)
+
+
+def unpublish_jobs(job_ids: Iterable[ObjectId], session: Optional[ClientSession] = None) -> int:
+    """Remove jobs from the public read model. Returns the number removed."""
+    ids = list(job_ids)
+    if not ids:
+        return 0
+    deleted = get_public_jobs().delete_many({"_id": {"$in": ids}}, session=session).deleted_count
+    record_changes(ids, "delete", session=session)
+    return deleted
+
+
+def expire_approved_jobs(ttl_days: int, batch_size: int = 1000) -> int:
+    """
+    Delete approved jobs approved more than ttl_days ago.
+
+    Each batch is unpublished first (public_jobs and a delete entry in the
+    change log), then deleted from approved_jobs, and JOBS_UNPUBLISHED is
+    emitted so in-memory indexes drop the jobs. A batch interrupted halfway
+    is finished by the next sweep. Jobs in the middle of a move are skipped.
+    The approved total in job_stats is decremented by the jobs deleted.
+
+    Returns:
+        Number of jobs expired
+    """
+    if ttl_days <= 0:
+        return 0
+    approved = get_approved_jobs()
+    cutoff = datetime.now(timezone.utc) - timedelta(days=ttl_days)
+    expired = 0
+
+    while True:
+        jobs = list(
+            approved.find({"approved_at": {"$lt": cutoff}, MOVE_FIELD: {"$exists": False}})
+            .sort("approved_at", 1)
+            .limit(batch_size)
+        )
+        if not jobs:
+            break
+        ids = [job["_id"] for job in jobs]
+        unpublish_jobs(ids)
+        deleted = approved.delete_many({"_id": {"$in": ids}, MOVE_FIELD: {"$exists": False}}).deleted_count
+        record_removed(approved.name, deleted)
+        emit(JOBS_UNPUBLISHED, jobs=jobs)
+        expired += len(jobs)
+        if len(jobs) < batch_size:
+            break
+
+    if expired:
+        logger.info(f"Expired {expired} approved jobs older than {ttl_days} days")
+    return expired
@@ -0,0 +1,126 @@
+"""
+Leased review queue over pending_jobs.
+
+Reviewers ask for their next batch instead of paging through the shared
+pending listing. Each job handed out is leased to the reviewer until
+lease_expires_at, and other reviewers' batches skip it; a lease that
+expires (the reviewer went away) makes the job available again without
+any cleanup job. Leases are advisory: approving or rejecting a job does
+not check them, and moves drop the lease fields.
+
+Batches come from the (automod.decision, ingested_at, lease_expires_at)
+index walked newest first, or the (automod.decision, review_priority,
+ingested_at, lease_expires_at) index for priority order. The decision and
+lease checks are answered from the index keys, so finding the next batch
+skips at most the currently leased jobs, however long the queue is.
+
+A batch never exceeds n: leases a reviewer holds beyond it (from an
+earlier, larger batch) are released.
+"""
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Literal, Optional, Tuple
+import logging
+
+from pymongo.collection import Collection
+
+from app.db import get_pending_jobs
+
+logger = logging.getLogger(__name__)
+
+LEASE_OWNER_FIELD = "lease_owner"
+LEASE_EXPIRES_FIELD = "lease_expires_at"
+LEASE_FIELDS = (LEASE_OWNER_FIELD, LEASE_EXPIRES_FIELD)
+
+QueueOrder = Literal["newest", "priority"]
+
+# Sort orders shared by the pending listing and the queue (each backed by an index)
+QUEUE_SORTS: Dict[str, List[Tuple[str, int]]] = {
+    "newest": [("ingested_at", -1)],
+    "priority": [("review_priority", -1), ("ingested_at", -1)],
+}
+
+# Attempts to top up a batch when other reviewers lease the same candidates first
+MAX_LEASE_ATTEMPTS = 3
+
+
+def _available(now: datetime, base_filter: dict) -> dict:
+    """Jobs nobody holds an unexpired lease on (never leased, released or expired)."""
+    return {**base_filter, LEASE_EXPIRES_FIELD: {"$not": {"$gt": now}}}
+
+
+def _held_by(owner: str, now: datetime) -> dict:
+    return {LEASE_OWNER_FIELD: owner, LEASE_EXPIRES_FIELD: {"$gt": now}}
+
+
+def lease_next(
+    owner: str,
+    n: int,
+    lease_seconds: int,
+    base_filter: Optional[dict] = None,
+    order: QueueOrder = "newest",
+) -> Tuple[List[dict], datetime]:
+    """
+    Lease up to n pending jobs to a reviewer.
+
+    The reviewer's unexpired leases are renewed and returned first (so a
+    reload does not hand out new jobs; beyond n they are released), then
+    topped up to n with available jobs in the given order. Candidates are leased with a conditional
+    update_many; ones another reviewer leased in between are replaced.
+
+    Args:
+        owner: Reviewer username
+        n: Batch size
+        lease_seconds: Lease duration
+        base_filter: Extra conditions on eligible jobs
+        order: "newest" or "priority" (review_priority, then newest)
+
+    Returns:
+        (leased jobs in order; lease expiry)
+    """
+    pending = get_pending_jobs()
+    now = datetime.now(timezone.utc)
+    expires = now + timedelta(seconds=lease_seconds)
+    available = _available(now, base_filter or {})
+
+    pending.update_many(_held_by(owner, now), {"$set": {LEASE_EXPIRES_FIELD: expires}})
+    sort = QUEUE_SORTS[order]
+    held = _find_held(pending, owner, now, sort)
+
+    for _ in range(MAX_LEASE_ATTEMPTS):
+        missing = n - len(held)
+        if missing <= 0:
+            break
+        candidates = [
+            doc["_id"]
+            for doc in pending.find(available, {"_id": 1}).sort(sort).limit(missing)
+        ]
+        if not candidates:
+            break
+        pending.update_many(
+            {"_id": {"$in": candidates}, **available},
+            {"$set": {LEASE_OWNER_FIELD: owner, LEASE_EXPIRES_FIELD: expires}},
+        )
+        held = _find_held(pending, owner, now, sort)
+
+    if len(held) > n:
+        release_leases(owner, [job["_id"] for job in held[n:]])
+        held = held[:n]
+    return held, expires
+
+
+def _find_held(pending: Collection, owner: str, now: datetime, sort: List[Tuple[str, int]]) -> List[dict]:
+    return list(pending.find(_held_by(owner, now)).sort(sort))
+
+
+def release_leases(owner: str, job_ids: Optional[list] = None) -> int:
+    """
+    Release a reviewer's leases (all of them, or only job_ids).
+
+    Returns:
+        Number of leases released
+    """
+    query = {LEASE_OWNER_FIELD: owner}
+    if job_ids is not None:
+        query["_id"] = {"$in": job_ids}
+    result = get_pending_jobs().update_many(query, {"$unset": {field: "" for field in LEASE_FIELDS}})
+    return result.modified_count
@@ -0,0 +1,251 @@
+"""
+Matching of newly published jobs against saved searches (percolation).
+
+Instead of running every saved query against the jobs collection, the
+queries themselves are indexed in memory. Each search is filed under one
+anchor: its longest query term, else its longest location term, else its
+source. A published job looks up only the buckets for the word prefixes
+in its own text and its source, so the cost of matching a job depends on
+the job's length and the number of candidates, not the number of saved
+searches. Candidates are then verified against every criterion.
+
+Query and location terms match the start of a word ("dev" matches
+"Developer"); salary bounds overlap the job's parsed salary range, as in
+GET /jobs.
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+import logging
+import re
+import threading
+import time
+
+from bson import ObjectId
+from pymongo.collection import Collection
+from pymongo.errors import BulkWriteError
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[\w+#]+")
+
+# Job fields searched by q (same as GET /jobs)
+TEXT_FIELDS = ("title", "company", "location")
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    """Casefolded words of a text."""
+    if not text:
+        return []
+    return _WORD_RE.findall(text.casefold())
+
+
+def _prefixes(words: Iterable[str]) -> Set[str]:
+    return {word[:i] for word in words for i in range(1, len(word) + 1)}
+
+
+def _has_prefixes(terms: Tuple[str, ...], words: Set[str]) -> bool:
+    return all(any(word.startswith(term) for word in words) for term in terms)
+
+
+@dataclass(frozen=True)
+class SearchSpec:
+    """Compiled form of a saved search."""
+    id: str
+    user_id: str
+    name: str
+    terms: Tuple[str, ...]
+    source: Optional[str]
+    location_terms: Tuple[str, ...]
+    min_salary: Optional[int]
+    max_salary: Optional[int]
+
+    @classmethod
+    def from_doc(cls, doc: dict) -> "SearchSpec":
+        return cls(
+            id=str(doc["_id"]),
+            user_id=doc["user_id"],
+            name=doc["name"],
+            terms=tuple(tokenize(doc.get("q"))),
+            source=doc.get("source") or None,
+            location_terms=tuple(tokenize(doc.get("location"))),
+            min_salary=doc.get("min_salary"),
+            max_salary=doc.get("max_salary"),
+        )
+
+    @property
+    def anchor(self) -> Tuple[str, str]:
+        if self.terms:
+            return ("term", max(self.terms, key=len))
+        if self.location_terms:
+            return ("location", max(self.location_terms, key=len))
+        return ("source", self.source or "")
+
+    def matches(self, job: dict, text_words: Set[str], location_words: Set[str]) -> bool:
+        if self.source and job.get("source") != self.source:
+            return False
+        if not _has_prefixes(self.terms, text_words):
+            return False
+        if not _has_prefixes(self.location_terms, location_words):
+            return False
+        if self.min_salary is not None or self.max_salary is not None:
+            salary = job.get("salary_parsed") or {}
+            if self.min_salary is not None and not (
+                isinstance(salary.get("max"), (int, float)) and salary["max"] >= self.min_salary
+            ):
+                return False
+            if self.max_salary is not None and not (
+                isinstance(salary.get("min"), (int, float)) and salary["min"] <= self.max_salary
+            ):
+                return False
+        return True
+
+
+class SavedSearchIndex:
+    """In-memory index of saved searches, bucketed by anchor."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._specs: Dict[str, SearchSpec] = {}
+        self._buckets: Dict[Tuple[str, str], Set[str]] = defaultdict(set)
+        self._last_id: Optional[ObjectId] = None
+        self.built_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return len(self._specs)
+
+    def _add(self, doc: dict) -> None:
+        spec = SearchSpec.from_doc(doc)
+        self._remove(spec.id)
+        self._specs[spec.id] = spec
+        self._buckets[spec.anchor].add(spec.id)
+        if self._last_id is None or doc["_id"] > self._last_id:
+            self._last_id = doc["_id"]
+
+    def _remove(self, search_id: str) -> None:
+        spec = self._specs.pop(search_id, None)
+        if spec is not None:
+            bucket = self._buckets.get(spec.anchor)
+            if bucket is not None:
+                bucket.discard(search_id)
+                if not bucket:
+                    del self._buckets[spec.anchor]
+
+    def add(self, doc: dict) -> None:
+        """Index a saved search document."""
+        with self._lock:
+            self._add(doc)
+
+    def remove(self, search_id: str) -> None:
+        """Drop a saved search from the index."""
+        with self._lock:
+            self._remove(search_id)
+
+    def rebuild(self, collection: Collection) -> None:
+        """Reload all saved searches (picks up deletions made by other workers)."""
+        started = time.perf_counter()
+        docs = list(collection.find({}))
+        with self._lock:
+            self._specs.clear()
+            self._buckets.clear()
+            self._last_id = None
+            for doc in docs:
+                self._add(doc)
+            self.built_at = time.time()
+        logger.info(
+            f"Saved search index rebuilt: {len(docs)} searches, {len(self._buckets)} buckets "
+            f"in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+    def load_new(self, collection: Collection) -> None:
+        """Index searches created (by any worker) since the last load."""
+        if self.built_at is None:
+            self.rebuild(collection)
+            return
+        query = {"_id": {"$gt": self._last_id}} if self._last_id is not None else {}
+        docs = list(collection.find(query))
+        if docs:
+            with self._lock:
+                for doc in docs:
+                    self._add(doc)
+
+    def match(self, job: dict) -> List[SearchSpec]:
+        """Return saved searches matched by a published job."""
+        text_words = set()
+        for field in TEXT_FIELDS:
+            value = job.get(field)
+            if isinstance(value, str):
+                text_words.update(tokenize(value))
+        location_words = set(tokenize(job.get("location")))
+
+        keys = [("term", p) for p in _prefixes(text_words)]
+        keys += [("location", p) for p in _prefixes(location_words)]
+        keys.append(("source", job.get("source") or ""))
+
+        with self._lock:
+            candidates = set()
+            for key in keys:
+                bucket = self._buckets.get(key)
+                if bucket:
+                    candidates.update(bucket)
+            specs = [self._specs[search_id] for search_id in candidates]
+
+        return [spec for spec in specs if spec.matches(job, text_words, location_words)]
+
+
+def record_matches(
+    jobs: Iterable[dict],
+    searches: Collection,
+    matches: Collection,
+    batch_size: int = 500,
+) -> int:
+    """
+    Match published jobs against saved searches and store the matches.
+
+    Matches are written in unordered batches; a (search, job) pair already
+    recorded is skipped by the unique index.
+
+    Returns:
+        Number of matches recorded
+    """
+    saved_search_index.load_new(searches)
+    matched_at = datetime.now(timezone.utc)
+    batch: List[dict] = []
+    recorded = 0
+
+    def flush() -> int:
+        if not batch:
+            return 0
+        try:
+            inserted = len(matches.insert_many(batch, ordered=False).inserted_ids)
+        except BulkWriteError as e:
+            inserted = e.details.get("nInserted", 0)
+        batch.clear()
+        return inserted
+
+    for job in jobs:
+        for spec in saved_search_index.match(job):
+            batch.append({
+                "search_id": spec.id,
+                "search_name": spec.name,
+                "user_id": spec.user_id,
+                "job_id": str(job["_id"]),
+                "title": job.get("title"),
+                "company": job.get("company"),
+                "location": job.get("location"),
+                "source": job.get("source"),
+                "matched_at": matched_at,
+                "notified": False,
+            })
+            if len(batch) >= batch_size:
+                recorded += flush()
+    recorded += flush()
+
+    if recorded:
+        logger.info(f"Recorded {recorded} saved search matches")
+    return recorded
+
+
+# Shared by the searches router and the scheduler
+saved_search_index = SavedSearchIndex()
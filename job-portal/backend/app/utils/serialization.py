@@ -0,0 +1,69 @@
+"""
+Fast JSON serialization for API responses.
+
+The default FastAPI path validates a returned model against response_model,
+walks it with jsonable_encoder and serializes with the stdlib json module.
+For list endpoints that return up to 100 already-clean Mongo documents this
+is most of the request's CPU time. When FAST_JSON_RESPONSES is enabled,
+handlers return a BSONJSONResponse instead, which skips re-validation and
+serializes BSON types (ObjectId, datetime) directly with orjson.
+"""
+from typing import Any, Type
+
+import orjson
+from bson import ObjectId
+from bson.decimal128 import Decimal128
+from fastapi.responses import Response
+from pydantic import BaseModel
+
+from app.config import get_settings
+
+
+def _bson_default(obj: Any) -> Any:
+    """Serialize BSON types orjson does not handle natively."""
+    if isinstance(obj, ObjectId):
+        return str(obj)
+    if isinstance(obj, Decimal128):
+        return str(obj.to_decimal())
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json")
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(content: Any) -> bytes:
+    """Serialize content (including ObjectId and datetime values) to JSON bytes."""
+    # Dates read from Mongo are already timezone-aware (tz_aware client);
+    # OPT_NAIVE_UTC only covers naive datetimes built in code, which are UTC
+    return orjson.dumps(content, default=_bson_default, option=orjson.OPT_NAIVE_UTC)
+
+
+class BSONJSONResponse(Response):
+    """JSON response rendered with orjson, understanding BSON types."""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+def fast_json_enabled() -> bool:
+    """Whether the opt-in fast serialization path is enabled."""
+    return get_settings().FAST_JSON_RESPONSES
+
+
+def model_response(response_model: Type[BaseModel], **fields) -> Any:
+    """
+    Build a response from already-clean fields.
+
+    Returns a BSONJSONResponse when the fast path is enabled (no pydantic
+    validation, no jsonable_encoder), otherwise the validated model.
+    """
+    if fast_json_enabled():
+        return BSONJSONResponse(fields)
+    return response_model(**fields)
+
+
+def document_response(doc: dict) -> Any:
+    """Return a single document, via the fast path when enabled."""
+    if fast_json_enabled():
+        return BSONJSONResponse(doc)
+    return doc
@@ -0,0 +1,198 @@
+"""
+"Similar jobs" lookups over hashed TF-IDF vectors.
+
+Each published job is turned into a fixed-width float32 vector: words
+from the title, tags, company and description are hashed into
+SIMILAR_DIMENSIONS buckets, weighted by field, log-scaled, multiplied by
+the inverse document frequency of their bucket and L2-normalized. All
+vectors live in one contiguous matrix, so the neighbors of a job are a
+single matrix-vector product (cosine similarity) plus a partial sort.
+
+Approvals are added incrementally using the IDF at that moment; the
+periodic rebuild re-weights every row with the current IDF.
+"""
+from typing import Dict, Iterable, List, Optional, Tuple
+import logging
+import re
+import threading
+import time
+import zlib
+
+import numpy as np
+from pymongo.collection import Collection
+
+from app.config import get_settings
+
+logger = logging.getLogger(__name__)
+
+_WORD_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by for from in is it of on or our the to we will with you your"
+    " this that have has can work team role job experience".split()
+)
+
+# Relative weight of words from each field
+FIELD_WEIGHTS = {
+    "title": 3.0,
+    "tags": 2.0,
+    "company": 1.0,
+    "description": 1.0,
+}
+# Only the start of long descriptions is vectorized
+DESCRIPTION_CHARS = 4000
+
+VECTOR_FIELDS = list(FIELD_WEIGHTS)
+
+
+def _words(text: str) -> List[str]:
+    return [w for w in _WORD_RE.findall(text.casefold()) if len(w) > 1 and w not in _STOPWORDS]
+
+
+def _bucket(word: str, dimensions: int) -> int:
+    # crc32 rather than hash(): stable across processes and restarts
+    return zlib.crc32(word.encode("utf-8")) % dimensions
+
+
+class SimilarJobsIndex:
+    """Matrix of normalized TF-IDF vectors for published jobs."""
+
+    def __init__(self, dimensions: int = 512):
+        self.dimensions = dimensions
+        self._lock = threading.Lock()
+        self._matrix = np.zeros((0, dimensions), dtype=np.float32)
+        self._size = 0
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+        # Sparse term frequencies per job, kept to re-weight on rebuild
+        self._tf: List[Tuple[np.ndarray, np.ndarray]] = []
+        self._doc_freq = np.zeros(dimensions, dtype=np.int32)
+        self.built_at: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self._size
+
+    def _term_frequencies(self, job: dict) -> Tuple[np.ndarray, np.ndarray]:
+        """Weighted, log-scaled bucket frequencies as (buckets, values)."""
+        counts: Dict[int, float] = {}
+        for field, weight in FIELD_WEIGHTS.items():
+            value = job.get(field)
+            if isinstance(value, list):
+                value = " ".join(str(v).split(":", 1)[-1] for v in value)
+            if not isinstance(value, str) or not value:
+                continue
+            if field == "description":
+                value = value[:DESCRIPTION_CHARS]
+            for word in _words(value):
+                bucket = _bucket(word, self.dimensions)
+                counts[bucket] = counts.get(bucket, 0.0) + weight
+        buckets = np.fromiter(counts.keys(), dtype=np.int32, count=len(counts))
+        values = np.log1p(np.fromiter(counts.values(), dtype=np.float32, count=len(counts)))
+        return buckets, values
+
+    def _idf(self) -> np.ndarray:
+        return (np.log((1 + self._size) / (1 + self._doc_freq)) + 1).astype(np.float32)
+
+    def _vector(self, tf: Tuple[np.ndarray, np.ndarray], idf: np.ndarray) -> np.ndarray:
+        buckets, values = tf
+        vector = np.zeros(self.dimensions, dtype=np.float32)
+        vector[buckets] = values * idf[buckets]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _ensure_capacity(self, rows: int) -> None:
+        if rows > self._matrix.shape[0]:
+            capacity = max(rows, self._matrix.shape[0] * 2, 1024)
+            grown = np.zeros((capacity, self.dimensions), dtype=np.float32)
+            grown[:self._size] = self._matrix[:self._size]
+            self._matrix = grown
+
+    def _remove(self, job_id: str) -> None:
+        row = self._rows.pop(job_id, None)
+        if row is None:
+            return
+        self._doc_freq[self._tf[row][0]] -= 1
+        last = self._size - 1
+        if row != last:
+            # Move the last row into the hole to keep the matrix dense
+            self._matrix[row] = self._matrix[last]
+            self._ids[row] = self._ids[last]
+            self._tf[row] = self._tf[last]
+            self._rows[self._ids[row]] = row
+        self._ids.pop()
+        self._tf.pop()
+        self._size = last
+
+    def add_jobs(self, jobs: Iterable[dict], **_) -> None:
+        """Vectorize newly published jobs (no-op until the index is built)."""
+        if self.built_at is None:
+            return
+        with self._lock:
+            for job in jobs:
+                job_id = str(job.get("_id") or job.get("id"))
+                self._remove(job_id)
+                tf = self._term_frequencies(job)
+                self._doc_freq[tf[0]] += 1
+                self._ensure_capacity(self._size + 1)
+                self._matrix[self._size] = self._vector(tf, self._idf())
+                self._rows[job_id] = self._size
+                self._ids.append(job_id)
+                self._tf.append(tf)
+                self._size += 1
+
+    def remove_jobs(self, jobs: Iterable[dict], **_) -> None:
+        """Drop unpublished jobs from the index."""
+        with self._lock:
+            for job in jobs:
+                self._remove(str(job.get("_id") or job.get("id")))
+
+    def rebuild(self, collection: Collection) -> None:
+        """Vectorize all published jobs with fresh IDF weights."""
+        started = time.perf_counter()
+        ids: List[str] = []
+        tfs: List[Tuple[np.ndarray, np.ndarray]] = []
+        doc_freq = np.zeros(self.dimensions, dtype=np.int32)
+        projection = {field: 1 for field in VECTOR_FIELDS}
+        for job in collection.find({}, projection, batch_size=1000):
+            tf = self._term_frequencies(job)
+            doc_freq[tf[0]] += 1
+            ids.append(str(job["_id"]))
+            tfs.append(tf)
+
+        matrix = np.zeros((max(len(ids), 1024), self.dimensions), dtype=np.float32)
+        with self._lock:
+            self._doc_freq = doc_freq
+            self._size = len(ids)
+            idf = self._idf()
+            for row, tf in enumerate(tfs):
+                matrix[row] = self._vector(tf, idf)
+            self._matrix = matrix
+            self._ids = ids
+            self._tf = tfs
+            self._rows = {job_id: row for row, job_id in enumerate(ids)}
+            self.built_at = time.time()
+
+        logger.info(
+            f"Similar jobs index rebuilt: {len(ids)} jobs x {self.dimensions} dims "
+            f"({matrix.nbytes // 1024} KB) in {(time.perf_counter() - started) * 1000:.0f}ms"
+        )
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._rows
+
+    def neighbors(self, job_id: str, k: int) -> List[Tuple[str, float]]:
+        """Top-k most similar jobs as (job_id, cosine similarity), best first."""
+        with self._lock:
+            row = self._rows.get(job_id)
+            if row is None or self._size < 2:
+                return []
+            scores = self._matrix[:self._size] @ self._matrix[row]
+            scores[row] = -1.0
+            k = min(k, self._size - 1)
+            top = np.argpartition(-scores, k - 1)[:k]
+            top = top[np.argsort(-scores[top])]
+            return [(self._ids[i], float(scores[i])) for i in top if scores[i] > 0]
+
+
+# Shared by the jobs router and the scheduler
+similar_jobs_index = SimilarJobsIndex(get_settings().SIMILAR_DIMENSIONS)
@@ -0,0 +1,320 @@
+"""
+Incrementally maintained job statistics behind /admin/stats.
+
+Counting every collection on each dashboard refresh costs time in
+proportion to the whole archive. Instead, the ingest and moderation paths
+$inc a handful of small documents in job_stats:
+
+- "totals": job count per moderation collection (raw, pending, approved, rejected)
+- "source:<name>": raw jobs ingested per source
+- "day:<YYYY-MM-DD>": raw jobs ingested per UTC day
+
+/admin/stats reads them with one query. Writes that bypass these paths
+(rejected-job TTL expiry, manual edits, a failed $inc) make the counters
+drift, so a scheduled reconciliation recounts from the collections and
+overwrites them.
+
+The same paths also $inc hour buckets in job_metrics, one document per
+source per UTC hour with ingested, approved, rejected and unpublished
+volumes, so /admin/stats/timeseries reads only the buckets in range no
+matter how large the archive grows (scripts/backfill_job_metrics.py
+rebuilds them from the job collections).
+"""
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Literal, Optional
+import logging
+
+from pymongo import DeleteMany, UpdateOne
+from pymongo.client_session import ClientSession
+
+from app.db import (
+    get_approved_jobs,
+    get_job_metrics,
+    get_job_stats,
+    get_pending_jobs,
+    get_raw_jobs,
+    get_rejected_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+TOTALS_ID = "totals"
+
+# Collection name -> field on the totals document
+TOTAL_FIELDS = {
+    "raw_jobs": "raw",
+    "pending_jobs": "pending",
+    "approved_jobs": "approved",
+    "rejected_jobs": "rejected",
+}
+
+# (source collection, target collection) -> hourly volume counted for the move
+MOVE_METRICS = {
+    ("pending_jobs", "approved_jobs"): "approved",
+    ("pending_jobs", "rejected_jobs"): "rejected",
+    ("approved_jobs", "rejected_jobs"): "unpublished",
+}
+METRIC_FIELDS = ["ingested", "approved", "rejected", "unpublished"]
+
+Granularity = Literal["hour", "day", "week", "month"]
+
+# Days of per-day counters recounted by reconcile_stats (covers jobs_this_week)
+RECONCILE_DAYS = 8
+
+
+def _day_start(dt: datetime) -> datetime:
+    return dt.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _day_update(day: datetime, count: int, op: str = "$inc") -> UpdateOne:
+    return UpdateOne(
+        {"_id": f"day:{day:%Y-%m-%d}"},
+        {op: {"ingested": count}, "$setOnInsert": {"kind": "day", "day": day}},
+        upsert=True,
+    )
+
+
+def _hour_start(dt: datetime) -> datetime:
+    return dt.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+def _hour_update(source: str, hour: datetime, metric: str, count: int) -> UpdateOne:
+    return UpdateOne(
+        {"_id": f"{source}|{hour:%Y-%m-%dT%H}"},
+        {"$inc": {metric: count}, "$setOnInsert": {"source": source, "hour": hour}},
+        upsert=True,
+    )
+
+
+def count_sources(jobs: Iterable[dict]) -> Dict[str, int]:
+    """Number of jobs per source ("unknown" when missing)."""
+    return dict(Counter(job.get("source") or "unknown" for job in jobs))
+
+
+def _record_metrics(requests: List[UpdateOne], session: Optional[ClientSession]) -> None:
+    try:
+        get_job_metrics().bulk_write(requests, ordered=False, session=session)
+    except Exception as e:
+        logger.error(f"Failed to update hourly job metrics: {e}")
+
+
+def _source_update(source: str, count: int, op: str = "$inc") -> UpdateOne:
+    return UpdateOne(
+        {"_id": f"source:{source}"},
+        {op: {"raw": count}, "$setOnInsert": {"kind": "source", "source": source}},
+        upsert=True,
+    )
+
+
+def record_ingested(jobs: Iterable[dict], session: Optional[ClientSession] = None) -> None:
+    """Count jobs stored in raw_jobs and pending_jobs by the ingest endpoints."""
+    jobs = list(jobs)
+    if not jobs:
+        return
+    now = datetime.now(timezone.utc)
+    by_source = Counter(job.get("source") or "unknown" for job in jobs)
+    by_day = Counter(_day_start(job.get("ingested_at") or now) for job in jobs)
+
+    requests = [
+        UpdateOne(
+            {"_id": TOTALS_ID},
+            {"$inc": {"raw": len(jobs), "pending": len(jobs)}, "$setOnInsert": {"kind": "totals"}},
+            upsert=True,
+        )
+    ]
+    requests += [_source_update(source, count) for source, count in by_source.items()]
+    requests += [_day_update(day, count) for day, count in by_day.items()]
+    try:
+        get_job_stats().bulk_write(requests, ordered=False, session=session)
+    except Exception as e:
+        logger.error(f"Failed to update ingest statistics (reconciliation will correct them): {e}")
+
+    by_hour = Counter(
+        (job.get("source") or "unknown", _hour_start(job.get("ingested_at") or now)) for job in jobs
+    )
+    _record_metrics(
+        [_hour_update(source, hour, "ingested", count) for (source, hour), count in by_hour.items()],
+        session,
+    )
+
+
+def record_moved(
+    source: str,
+    target: str,
+    by_source: Dict[str, int],
+    session: Optional[ClientSession] = None,
+) -> None:
+    """
+    Count jobs moved from the source collection to the target collection.
+
+    Args:
+        source: Source collection name
+        target: Target collection name
+        by_source: Number of moved jobs per job source (see count_sources)
+    """
+    count = sum(by_source.values())
+    if count <= 0:
+        return
+
+    metric = MOVE_METRICS.get((source, target))
+    if metric:
+        hour = _hour_start(datetime.now(timezone.utc))
+        _record_metrics(
+            [_hour_update(job_source, hour, metric, n) for job_source, n in by_source.items() if n],
+            session,
+        )
+
+    try:
+        get_job_stats().update_one(
+            {"_id": TOTALS_ID},
+            {
+                "$inc": {TOTAL_FIELDS[source]: -count, TOTAL_FIELDS[target]: count},
+                "$setOnInsert": {"kind": "totals"},
+            },
+            upsert=True,
+            session=session,
+        )
+    except Exception as e:
+        logger.error(f"Failed to update moderation statistics (reconciliation will correct them): {e}")
+
+
+def record_removed(collection: str, count: int, session: Optional[ClientSession] = None) -> None:
+    """Count jobs deleted from a moderation collection without moving them (e.g. expiry)."""
+    if count <= 0:
+        return
+    try:
+        get_job_stats().update_one(
+            {"_id": TOTALS_ID},
+            {"$inc": {TOTAL_FIELDS[collection]: -count}, "$setOnInsert": {"kind": "totals"}},
+            upsert=True,
+            session=session,
+        )
+    except Exception as e:
+        logger.error(f"Failed to update statistics (reconciliation will correct them): {e}")
+
+
+def reconcile_stats(session: Optional[ClientSession] = None) -> None:
+    """
+    Recount the counters from the job collections and overwrite them.
+
+    This is the expensive computation the counters replace, so it only runs
+    on a schedule (and once if the counters do not exist yet). Increments
+    racing with it may be lost or applied twice; the next run corrects that.
+    """
+    raw = get_raw_jobs()
+    totals = {
+        "raw": raw.count_documents({}, session=session),
+        "pending": get_pending_jobs().count_documents({}, session=session),
+        "approved": get_approved_jobs().count_documents({}, session=session),
+        "rejected": get_rejected_jobs().count_documents({}, session=session),
+    }
+
+    source_counts = {
+        doc["_id"] or "unknown": doc["count"]
+        for doc in raw.aggregate([{"$group": {"_id": "$source", "count": {"$sum": 1}}}], session=session)
+    }
+
+    first_day = _day_start(datetime.now(timezone.utc)) - timedelta(days=RECONCILE_DAYS - 1)
+    # ISO strings left by databases not yet migrated (scripts/migrate_datetimes.py)
+    # are converted here; $dateToString would fail on them
+    day_counts = {
+        doc["_id"]: doc["count"]
+        for doc in raw.aggregate([
+            {"$match": {"$or": [{"ingested_at": {"$gte": first_day}}, {"ingested_at": {"$type": "string"}}]}},
+            {"$project": {"day": {"$cond": [
+                {"$eq": [{"$type": "$ingested_at"}, "string"]},
+                {"$dateFromString": {"dateString": "$ingested_at", "timezone": "UTC", "onError": None}},
+                "$ingested_at",
+            ]}}},
+            {"$match": {"day": {"$gte": first_day}}},
+            {"$group": {
+                "_id": {"$dateToString": {"format": "%Y-%m-%d", "date": "$day"}},
+                "count": {"$sum": 1},
+            }},
+        ], session=session)
+    }
+
+    requests = [
+        UpdateOne({"_id": TOTALS_ID}, {"$set": {**totals, "kind": "totals"}}, upsert=True),
+        DeleteMany({"kind": "source", "source": {"$nin": list(source_counts)}}),
+    ]
+    requests += [_source_update(source, count, "$set") for source, count in source_counts.items()]
+    for i in range(RECONCILE_DAYS):
+        day = first_day + timedelta(days=i)
+        requests.append(_day_update(day, day_counts.get(f"{day:%Y-%m-%d}", 0), "$set"))
+
+    get_job_stats().bulk_write(requests, ordered=True, session=session)
+    logger.info(f"Job statistics reconciled: {totals}")
+
+
+def read_stats(session: Optional[ClientSession] = None) -> dict:
+    """
+    Read the counters in one query.
+
+    Returns:
+        Fields of the JobStats response; jobs_this_week covers the last
+        7 UTC days including today
+    """
+    today = _day_start(datetime.now(timezone.utc))
+    week_start = today - timedelta(days=6)
+    query = {"$or": [
+        {"kind": {"$in": ["totals", "source"]}},
+        {"kind": "day", "day": {"$gte": week_start}},
+    ]}
+
+    docs = list(get_job_stats().find(query, session=session))
+    if not any(doc["_id"] == TOTALS_ID for doc in docs):
+        reconcile_stats(session=session)
+        docs = list(get_job_stats().find(query, session=session))
+
+    totals = next(doc for doc in docs if doc["_id"] == TOTALS_ID)
+    days = [doc for doc in docs if doc.get("kind") == "day"]
+    return {
+        "total_raw": totals.get("raw", 0),
+        "total_pending": totals.get("pending", 0),
+        "total_approved": totals.get("approved", 0),
+        "total_rejected": totals.get("rejected", 0),
+        "jobs_by_source": {
+            doc["source"]: doc["raw"] for doc in docs if doc.get("kind") == "source" and doc.get("raw")
+        },
+        "jobs_today": sum(doc["ingested"] for doc in days if doc["_id"] == f"day:{today:%Y-%m-%d}"),
+        "jobs_this_week": sum(doc["ingested"] for doc in days),
+    }
+
+
+def read_timeseries(
+    start: datetime,
+    end: datetime,
+    granularity: Granularity = "hour",
+    source: Optional[str] = None,
+) -> List[dict]:
+    """
+    Sum the hour buckets in [start, end) into points of the given granularity.
+
+    Weeks start on Monday; all boundaries are UTC.
+
+    Returns:
+        One dict per non-empty point with start and the METRIC_FIELDS volumes
+        (summed over sources unless source is given), oldest first
+    """
+    match = {"hour": {"$gte": _hour_start(start), "$lt": end}}
+    if source:
+        match["source"] = source
+
+    if granularity == "hour":
+        bucket = "$hour"
+    else:
+        bucket = {"$dateTrunc": {"date": "$hour", "unit": granularity}}
+        if granularity == "week":
+            bucket["$dateTrunc"]["startOfWeek"] = "monday"
+
+    pipeline = [
+        {"$match": match},
+        {"$group": {"_id": bucket, **{field: {"$sum": f"${field}"} for field in METRIC_FIELDS}}},
+        {"$sort": {"_id": 1}},
+    ]
+    return [
+        {"start": doc["_id"], **{field: doc[field] for field in METRIC_FIELDS}}
+        for doc in get_job_metrics().aggregate(pipeline)
+    ]
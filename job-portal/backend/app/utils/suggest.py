@@ -0,0 +1,267 @@
+"""
+In-memory prefix indexes for typeahead suggestions.
+
+Distinct job titles, companies and cities are kept in sorted arrays and
+looked up with bisect, so a suggestion request never touches MongoDB.
+Each term is indexed under every word start ("senior python developer"
+is also found by "python" and "dev"), weighted by how many approved jobs
+use it.
+
+Short prefixes match most of the index, so their heaviest terms are kept
+precomputed and adjusted term by term as jobs are published or
+unpublished; only longer (narrow) prefixes scan their bisect range.
+"""
+from bisect import bisect_left, insort
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Tuple
+import heapq
+import logging
+import re
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+# Separates the indexed word-start suffix from the full term inside a key
+_KEY_SEP = "\x00"
+# Upper bound for all keys sharing a prefix
+_PREFIX_END = "\U0010ffff"
+# Prefixes up to this length have their top terms precomputed
+_TOP_PREFIX_LEN = 3
+# Largest suggestion limit served from a precomputed list
+_TOP_K = 25
+# Terms kept per precomputed prefix; the slack above _TOP_K absorbs
+# unpublished terms before the list has to be recomputed
+_TOP_KEEP = 2 * _TOP_K
+
+SUGGEST_FIELDS = ("title", "company", "location")
+
+
+def normalize_term(text: str) -> str:
+    """Casefold and collapse whitespace."""
+    return " ".join(text.casefold().split())
+
+
+def city_from_location(location: Optional[str]) -> Optional[str]:
+    """Return the first comma-separated part of a raw location."""
+    if not location:
+        return None
+    city = location.split(",", 1)[0].strip()
+    return city or None
+
+
+class PrefixIndex:
+    """Weighted terms searchable by the prefix of any of their words."""
+
+    def __init__(self):
+        self._keys: List[str] = []
+        # normalized term -> [display text, weight]
+        self._terms: Dict[str, list] = {}
+        # short prefix -> up to _TOP_KEEP normalized terms, heaviest first;
+        # every term missing from a list weighs at most its last entry
+        self._top: Dict[str, List[str]] = {}
+        # Short prefixes whose list holds every term with that prefix
+        self._complete: set = set()
+
+    def __len__(self) -> int:
+        return len(self._terms)
+
+    @staticmethod
+    def _keys_for(term: str) -> List[str]:
+        starts = [0] + [m.end() for m in re.finditer(r"[\s\-/(,]+", term)]
+        return [term[i:] + _KEY_SEP + term for i in starts if i < len(term)]
+
+    @staticmethod
+    def _short_prefixes(key: str) -> List[str]:
+        suffix = key.split(_KEY_SEP, 1)[0]
+        return [suffix[:n] for n in range(1, min(len(suffix), _TOP_PREFIX_LEN) + 1)]
+
+    def _weight(self, term: str) -> int:
+        return self._terms[term][1]
+
+    def _place(self, prefix: str, top: List[str], term: str) -> None:
+        """Insert term into a top list by weight, trimming it to _TOP_KEEP."""
+        weight = self._weight(term)
+        i = 0
+        while i < len(top) and self._weight(top[i]) >= weight:
+            i += 1
+        top.insert(i, term)
+        if len(top) > _TOP_KEEP:
+            del top[_TOP_KEEP:]
+            self._complete.discard(prefix)
+
+    def _set_top(self, prefix: str, terms: Iterable[str]) -> List[str]:
+        terms = list(terms)
+        top = self._top[prefix] = heapq.nlargest(_TOP_KEEP, terms, key=self._weight)
+        if len(terms) <= _TOP_KEEP:
+            self._complete.add(prefix)
+        else:
+            self._complete.discard(prefix)
+        return top
+
+    def _raise_in_tops(self, term: str) -> None:
+        for prefix in {p for key in self._keys_for(term) for p in self._short_prefixes(key)}:
+            top = self._top.get(prefix)
+            if top is None:
+                continue
+            if term in top:
+                top.remove(term)
+            elif prefix not in self._complete and top and self._weight(term) < self._weight(top[-1]):
+                continue
+            self._place(prefix, top, term)
+
+    def _lower_in_tops(self, term: str, removed: bool) -> None:
+        for prefix in {p for key in self._keys_for(term) for p in self._short_prefixes(key)}:
+            top = self._top.get(prefix)
+            if top is None or term not in top:
+                continue
+            top.remove(term)
+            if prefix in self._complete:
+                if not removed:
+                    self._place(prefix, top, term)
+            elif not removed and top and self._weight(term) >= self._weight(top[-1]):
+                self._place(prefix, top, term)
+            elif len(top) < _TOP_K:
+                # Terms outside the list may now rank in the top; recompute on next use
+                del self._top[prefix]
+
+    def build_tops(self) -> None:
+        """Precompute the top terms of every short prefix in one pass over the keys."""
+        candidates: Dict[str, set] = defaultdict(set)
+        for key in self._keys:
+            term = key.split(_KEY_SEP, 1)[1]
+            for prefix in self._short_prefixes(key):
+                candidates[prefix].add(term)
+        self._top = {}
+        self._complete = set()
+        for prefix, terms in candidates.items():
+            self._set_top(prefix, terms)
+
+    def add(self, text: str, weight: int = 1) -> None:
+        """Add weight to a term, inserting it if new."""
+        term = normalize_term(text)
+        if not term:
+            return
+        entry = self._terms.get(term)
+        if entry is None:
+            self._terms[term] = [text.strip(), weight]
+            for key in self._keys_for(term):
+                insort(self._keys, key)
+        else:
+            entry[1] += weight
+        self._raise_in_tops(term)
+
+    def remove(self, text: str, weight: int = 1) -> None:
+        """Subtract weight from a term, dropping it when it reaches zero."""
+        term = normalize_term(text)
+        entry = self._terms.get(term)
+        if entry is None:
+            return
+        entry[1] -= weight
+        removed = entry[1] <= 0
+        self._lower_in_tops(term, removed)
+        if removed:
+            del self._terms[term]
+            for key in self._keys_for(term):
+                i = bisect_left(self._keys, key)
+                if i < len(self._keys) and self._keys[i] == key:
+                    del self._keys[i]
+
+    def _candidates(self, prefix: str) -> set:
+        lo = bisect_left(self._keys, prefix)
+        hi = bisect_left(self._keys, prefix + _PREFIX_END, lo)
+        return {key.split(_KEY_SEP, 1)[1] for key in self._keys[lo:hi]}
+
+    def top_k(self, prefix: str, k: int) -> List[Tuple[str, int]]:
+        """Return up to k (display text, weight) pairs matching prefix, heaviest first."""
+        prefix = normalize_term(prefix)
+        if not prefix:
+            return []
+
+        if len(prefix) <= _TOP_PREFIX_LEN and k <= _TOP_K:
+            best = self._top.get(prefix)
+            if best is None:
+                best = self._set_top(prefix, self._candidates(prefix))
+            best = best[:k]
+        else:
+            best = heapq.nlargest(k, self._candidates(prefix), key=self._weight)
+        return [(self._terms[term][0], self._terms[term][1]) for term in best]
+
+
+class SuggestionIndex:
+    """Title, company and city prefix indexes built from published jobs."""
+
+    def __init__(self):
+        self._indexes: Dict[str, PrefixIndex] = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+        self._lock = threading.Lock()
+        self.built_at: Optional[float] = None
+
+    @staticmethod
+    def _job_terms(job: dict) -> Iterable[Tuple[str, Optional[str]]]:
+        yield "title", job.get("title")
+        yield "company", job.get("company")
+        yield "location", city_from_location(job.get("location"))
+
+    def rebuild(self, collection) -> None:
+        """Rebuild all indexes from distinct values and their frequencies in public_jobs."""
+        started = time.perf_counter()
+        # One aggregation per field: their results are streamed by cursor,
+        # whereas a single $facet would return every distinct term in one
+        # document (limited to 16MB)
+        sources = {"title": "title", "company": "company", "location": "facets.city"}
+
+        indexes = {field: PrefixIndex() for field in SUGGEST_FIELDS}
+        for field, index in indexes.items():
+            pipeline = [
+                {"$match": {sources[field]: {"$type": "string"}}},
+                {"$group": {"_id": f"${sources[field]}", "n": {"$sum": 1}}},
+            ]
+            for row in collection.aggregate(pipeline, allowDiskUse=True):
+                index.add(row["_id"], row["n"])
+            index.build_tops()
+
+        with self._lock:
+            self._indexes = indexes
+            self.built_at = time.time()
+
+        logger.info(
+            f"Suggestion index rebuilt in {(time.perf_counter() - started) * 1000:.1f}ms: "
+            + ", ".join(f"{len(index)} {field}s" for field, index in indexes.items())
+        )
+
+    def add_jobs(self, jobs: List[dict]) -> None:
+        """Incrementally index newly published jobs."""
+        if self.built_at is None:
+            return
+        with self._lock:
+            for job in jobs:
+                for field, value in self._job_terms(job):
+                    if value:
+                        self._indexes[field].add(value)
+
+    def remove_jobs(self, jobs: List[dict]) -> None:
+        """Remove unpublished jobs' contribution to term weights."""
+        if self.built_at is None:
+            return
+        with self._lock:
+            for job in jobs:
+                for field, value in self._job_terms(job):
+                    if value:
+                        self._indexes[field].remove(value)
+
+    def suggest(self, prefix: str, field: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """Return the top suggestions for prefix across one or all fields."""
+        fields = [field] if field else list(SUGGEST_FIELDS)
+        with self._lock:
+            matches = [
+                {"text": text, "field": f, "weight": weight}
+                for f in fields
+                for text, weight in self._indexes[f].top_k(prefix, limit)
+            ]
+        if len(fields) > 1:
+            matches = heapq.nlargest(limit, matches, key=lambda m: m["weight"])
+        return matches
+
+
+# Module-level index shared by all requests in this process
+suggestion_index = SuggestionIndex()
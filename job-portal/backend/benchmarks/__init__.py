@@ -0,0 +1 @@
+# Micro-benchmarks and load tests (run from the backend directory with `python -m benchmarks.<name>`)
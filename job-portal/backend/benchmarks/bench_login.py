@@ -0,0 +1,119 @@
+"""
+Login throughput benchmark for a running API instance.
+
+At each level, N clients log in repeatedly while a fixed number of clients
+browse /jobs, and the run reports logins per second next to /jobs latency.
+Level 0 is the baseline without logins. With bcrypt on its own bounded
+pool (PASSWORD_HASH_WORKERS), login throughput levels off at what that pool
+can hash, and /jobs latency should stay close to the baseline instead of
+climbing with the number of login clients. Logins shed with 503 once
+PASSWORD_HASH_MAX_PENDING is reached are counted separately.
+
+Usage (from the backend directory, against a running server with an
+existing user):
+    python -m benchmarks.bench_login --username admin --password AdminPass123 \\
+        --login-concurrency 0 1 4 16 64 --jobs-concurrency 4 --duration 10
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+class Results:
+    """Latencies and status counts collected by the client threads."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.errors = 0
+        self.shed = 0
+
+    def add(self, latencies: list, errors: int, shed: int) -> None:
+        with self.lock:
+            self.latencies.extend(latencies)
+            self.errors += errors
+            self.shed += shed
+
+
+def _client(send, deadline: float, results: Results) -> None:
+    session = requests.Session()
+    latencies = []
+    errors = 0
+    shed = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = send(session)
+            if response.status_code == 503:
+                shed += 1
+            elif response.status_code >= 400:
+                errors += 1
+            else:
+                latencies.append(time.perf_counter() - started)
+        except requests.RequestException:
+            errors += 1
+    results.add(latencies, errors, shed)
+
+
+def _percentile_ms(latencies: list, fraction: float) -> float:
+    if len(latencies) < 20:
+        return 0.0
+    return sorted(latencies)[int(len(latencies) * fraction) - 1] * 1000
+
+
+def run_level(args: argparse.Namespace, login_clients: int) -> dict:
+    """Run logins and /jobs browsing side by side for one level."""
+    login_url = f"{args.base_url}/auth/login"
+    jobs_url = f"{args.base_url}/jobs?per_page=20"
+    credentials = {"username": args.username, "password": args.password}
+    logins = Results()
+    jobs = Results()
+    deadline = time.perf_counter() + args.duration
+
+    with ThreadPoolExecutor(max_workers=login_clients + args.jobs_concurrency) as pool:
+        for _ in range(login_clients):
+            pool.submit(_client, lambda s: s.post(login_url, data=credentials, timeout=60), deadline, logins)
+        for _ in range(args.jobs_concurrency):
+            pool.submit(_client, lambda s: s.get(jobs_url, timeout=60), deadline, jobs)
+
+    return {
+        "login_clients": login_clients,
+        "logins_per_second": len(logins.latencies) / args.duration,
+        "login_p50_ms": statistics.median(logins.latencies) * 1000 if logins.latencies else 0.0,
+        "shed": logins.shed,
+        "errors": logins.errors + jobs.errors + jobs.shed,
+        "jobs_per_second": len(jobs.latencies) / args.duration,
+        "jobs_p50_ms": statistics.median(jobs.latencies) * 1000 if jobs.latencies else 0.0,
+        "jobs_p95_ms": _percentile_ms(jobs.latencies, 0.95),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--username", required=True)
+    parser.add_argument("--password", required=True)
+    parser.add_argument("--login-concurrency", type=int, nargs="+", default=[0, 1, 4, 16, 64])
+    parser.add_argument("--jobs-concurrency", type=int, default=4, help="Clients browsing /jobs at every level")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per level")
+    args = parser.parse_args()
+
+    print(
+        f"{'logins':>7} {'login/s':>8} {'p50 ms':>8} {'shed':>6} {'errors':>7} "
+        f"{'jobs/s':>8} {'jobs p50':>9} {'jobs p95':>9}"
+    )
+    for login_clients in args.login_concurrency:
+        r = run_level(args, login_clients)
+        print(
+            f"{r['login_clients']:>7} {r['logins_per_second']:>8.1f} {r['login_p50_ms']:>8.1f} "
+            f"{r['shed']:>6} {r['errors']:>7} {r['jobs_per_second']:>8.1f} "
+            f"{r['jobs_p50_ms']:>9.1f} {r['jobs_p95_ms']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
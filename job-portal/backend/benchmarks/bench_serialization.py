@@ -0,0 +1,110 @@
+"""
+Benchmark response serialization for /jobs and /admin/pending pages.
+
+Compares the default FastAPI path (PaginatedResponse construction, response_model
+validation, JSON-mode dump, stdlib json render) with the opt-in fast path
+(BSONJSONResponse rendered by orjson, no re-validation) on synthetic pages
+shaped like the documents those endpoints return.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_serialization [--per-page 100] [--rounds 200]
+"""
+import argparse
+import json
+import os
+import random
+import string
+import time
+from datetime import datetime, timedelta, timezone
+
+from bson import ObjectId
+
+# Settings are required at import time; the benchmark never connects to Mongo
+os.environ.setdefault("MONGO_URI", "mongodb://localhost:27017")
+os.environ.setdefault("JWT_SECRET_KEY", "benchmark")
+
+from pydantic import TypeAdapter  # noqa: E402
+
+from app.schemas.responses import PaginatedResponse  # noqa: E402
+from app.utils.serialization import BSONJSONResponse  # noqa: E402
+
+
+def _text(n: int) -> str:
+    return "".join(random.choices(string.ascii_letters + "     ", k=n))
+
+
+def make_job(admin_view: bool) -> dict:
+    """Build a document shaped like an approved (or pending) job."""
+    now = datetime.now(timezone.utc)
+    doc = {
+        "id": str(ObjectId()),
+        "title": _text(40),
+        "company": _text(20),
+        "location": "Bangalore, Karnataka, India",
+        "description": _text(4000),
+        "apply_url": "https://example.com/jobs/" + _text(12),
+        "posted_date": "2024-11-20",
+        "posted_date_parsed": now - timedelta(days=3),
+        "salary": "25,00,000 - 35,00,000",
+        "salary_parsed": {"min": 2500000, "max": 3500000},
+        "source": "indeed",
+        "location_normalized": {
+            "raw": "Bangalore, India",
+            "lat": 12.97,
+            "lon": 77.59,
+            "display_name": "Bengaluru, Karnataka, India",
+            "geo": {"type": "Point", "coordinates": [77.59, 12.97]},
+        },
+        "tags": ["seniority:senior", "skill:python", "source:indeed"],
+        "dedupe_hash": _text(64),
+        "ingested_at": now - timedelta(days=1),
+    }
+    if not admin_view:
+        doc["approved_at"] = now
+    return doc
+
+
+def default_path(adapter: TypeAdapter, body: dict) -> bytes:
+    """Mimic FastAPI's handling of a returned model with response_model set."""
+    model = PaginatedResponse(**body)
+    content = model.model_dump()
+    validated = adapter.validate_python(content)
+    serialized = adapter.dump_python(validated, mode="json")
+    return json.dumps(serialized, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+def fast_path(body: dict) -> bytes:
+    """Render through the opt-in orjson response class."""
+    return BSONJSONResponse(body).body
+
+
+def bench(label: str, fn, rounds: int) -> float:
+    fn()  # warm up
+    started = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    per_request_us = (time.perf_counter() - started) / rounds * 1e6
+    print(f"  {label:<10} {per_request_us:10.1f} us/request")
+    return per_request_us
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--per-page", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    adapter = TypeAdapter(PaginatedResponse)
+
+    for endpoint, admin_view in (("/jobs", False), ("/admin/pending", True)):
+        docs = [make_job(admin_view) for _ in range(args.per_page)]
+        body = {"page": 1, "per_page": args.per_page, "total": 5000, "total_pages": 50, "data": docs}
+
+        print(f"{endpoint} ({args.per_page} documents, {len(fast_path(body)) / 1024:.0f} KiB)")
+        slow = bench("default", lambda: default_path(adapter, body), args.rounds)
+        fast = bench("orjson", lambda: fast_path(body), args.rounds)
+        print(f"  saved      {slow - fast:10.1f} us/request ({slow / fast:.1f}x faster)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Concurrency load test for a running API instance.
+
+Fires requests at an endpoint from N concurrent clients for a fixed duration
+at each concurrency level and reports throughput and latency. With database
+calls offloaded from the event loop, throughput should keep rising with
+concurrency (up to the database/thread-pool limits) instead of flatlining at
+the single-request rate.
+
+Usage (from the backend directory, against a running server):
+    python -m benchmarks.load_test --url http://localhost:8000/jobs?per_page=20 \\
+        --concurrency 1 4 16 64 --duration 10
+"""
+import argparse
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+
+def _worker(url: str, headers: dict, deadline: float, latencies: list, errors: list, lock: threading.Lock) -> None:
+    session = requests.Session()
+    local_latencies = []
+    local_errors = 0
+    while time.perf_counter() < deadline:
+        started = time.perf_counter()
+        try:
+            response = session.get(url, headers=headers, timeout=30)
+            if response.status_code >= 400:
+                local_errors += 1
+        except requests.RequestException:
+            local_errors += 1
+        local_latencies.append(time.perf_counter() - started)
+    with lock:
+        latencies.extend(local_latencies)
+        errors.append(local_errors)
+
+
+def run_level(url: str, headers: dict, concurrency: int, duration: float) -> dict:
+    """Run one concurrency level and return throughput/latency figures."""
+    latencies: list = []
+    errors: list = []
+    lock = threading.Lock()
+    deadline = time.perf_counter() + duration
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for _ in range(concurrency):
+            pool.submit(_worker, url, headers, deadline, latencies, errors, lock)
+
+    latencies.sort()
+    count = len(latencies)
+    return {
+        "concurrency": concurrency,
+        "requests": count,
+        "errors": sum(errors),
+        "rps": count / duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(count * 0.95) - 1] * 1000 if count >= 20 else 0.0,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", default="http://localhost:8000/jobs?per_page=20")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds per concurrency level")
+    parser.add_argument("--token", help="Bearer token for authenticated endpoints")
+    args = parser.parse_args()
+
+    headers = {"Authorization": f"Bearer {args.token}"} if args.token else {}
+
+    print(f"{'clients':>8} {'requests':>9} {'errors':>7} {'req/s':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for concurrency in args.concurrency:
+        r = run_level(args.url, headers, concurrency, args.duration)
+        print(
+            f"{r['concurrency']:>8} {r['requests']:>9} {r['errors']:>7} "
+            f"{r['rps']:>9.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
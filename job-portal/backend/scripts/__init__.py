@@ -0,0 +1 @@
+# Maintenance scripts (run from the backend directory with `python -m scripts.<name>`)
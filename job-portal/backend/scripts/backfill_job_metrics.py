@@ -0,0 +1,99 @@
+"""
+Backfill the hourly job_metrics buckets from the job collections.
+
+The ingest and moderation paths only count what happens after deployment;
+this rebuilds history for /admin/stats/timeseries from the timestamps the
+jobs already carry (ingested_at, approved_at, rejected_at). Jobs deleted
+by TTL expiry are gone and cannot be counted.
+
+Each metric is grouped server-side and merged into job_metrics, overwriting
+only that metric in the buckets it finds, so it is safe to re-run. Moves
+that happen while it runs may be counted twice in the current hour.
+
+Usage (from the backend directory):
+    python -m scripts.backfill_job_metrics
+"""
+import logging
+import sys
+
+from app.db import (
+    get_approved_jobs,
+    get_job_metrics,
+    get_raw_jobs,
+    get_rejected_jobs,
+    create_indexes,
+    close_db,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def hourly_counts_stages(date_field: str, metric: str) -> list:
+    """Stages grouping jobs by source and hour of date_field and merging the counts into job_metrics."""
+    source = {"$cond": [{"$gt": [{"$ifNull": ["$source", ""]}, ""]}, "$source", "unknown"]}
+    return [
+        {"$group": {
+            "_id": {"source": source, "hour": {"$dateTrunc": {"date": f"${date_field}", "unit": "hour"}}},
+            "count": {"$sum": 1},
+        }},
+        {"$project": {
+            "_id": {"$concat": [
+                "$_id.source", "|", {"$dateToString": {"format": "%Y-%m-%dT%H", "date": "$_id.hour"}}
+            ]},
+            "source": "$_id.source",
+            "hour": "$_id.hour",
+            metric: "$count",
+        }},
+        {"$merge": {
+            "into": get_job_metrics().name,
+            "on": "_id",
+            "whenMatched": [{"$set": {metric: f"$$new.{metric}"}}],
+            "whenNotMatched": "insert",
+        }},
+    ]
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        create_indexes()
+        rejected = get_rejected_jobs()
+
+        get_raw_jobs().aggregate([
+            {"$match": {"ingested_at": {"$type": "date"}}},
+            *hourly_counts_stages("ingested_at", "ingested"),
+        ])
+        logger.info("job_metrics: backfilled ingested")
+
+        # Unpublished jobs were approved first and keep their approved_at
+        get_approved_jobs().aggregate([
+            {"$match": {"approved_at": {"$type": "date"}}},
+            {"$unionWith": {
+                "coll": rejected.name,
+                "pipeline": [{"$match": {"unpublished": True, "approved_at": {"$type": "date"}}}],
+            }},
+            *hourly_counts_stages("approved_at", "approved"),
+        ])
+        logger.info("job_metrics: backfilled approved")
+
+        rejected.aggregate([
+            {"$match": {"unpublished": {"$ne": True}, "rejected_at": {"$type": "date"}}},
+            *hourly_counts_stages("rejected_at", "rejected"),
+        ])
+        rejected.aggregate([
+            {"$match": {"unpublished": True, "rejected_at": {"$type": "date"}}},
+            *hourly_counts_stages("rejected_at", "unpublished"),
+        ])
+        logger.info("job_metrics: backfilled rejected and unpublished")
+
+        logger.info(f"job_metrics: {get_job_metrics().count_documents({})} hour buckets")
+    except Exception as e:
+        logger.exception(f"Backfill failed: {e}")
+        sys.exit(1)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Set title_company_key and review_priority on jobs ingested before they existed.
+
+New jobs get both at ingest. This adds the repost key to raw_jobs (so later
+reposts of old jobs are recognized) and scores pending jobs without a
+review_priority, counting a job as a repost when another raw job shares
+its key. Freshness is measured from now, as it would have been at ingest.
+
+Safe to re-run: only documents missing the fields are touched.
+
+Usage (from the backend directory):
+    python -m scripts.backfill_review_priority
+"""
+import logging
+import sys
+
+from pymongo import UpdateOne
+
+from app.config import get_settings
+from app.db import get_pending_jobs, get_raw_jobs, create_indexes, close_db
+from app.utils.hashing import compute_title_company_key
+from app.utils.processing import review_priority
+
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 1000
+
+
+def add_keys(collection) -> int:
+    """Set title_company_key where missing. Returns documents updated."""
+    updated = 0
+    batch = []
+    for doc in collection.find({"title_company_key": {"$exists": False}}, {"title": 1, "company": 1}):
+        batch.append(UpdateOne({"_id": doc["_id"]}, {"$set": {"title_company_key": compute_title_company_key(doc)}}))
+        if len(batch) >= BATCH_SIZE:
+            updated += collection.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += collection.bulk_write(batch, ordered=False).modified_count
+    return updated
+
+
+def score_pending() -> int:
+    """Set review_priority on pending jobs without one. Returns documents updated."""
+    settings = get_settings()
+    raw = get_raw_jobs()
+    pending = get_pending_jobs()
+    updated = 0
+    batch = []
+    for job in pending.find({"review_priority": {"$exists": False}}):
+        key = job.get("title_company_key") or compute_title_company_key(job)
+        repost = raw.count_documents({"title_company_key": key}, limit=2) > 1
+        priority = review_priority(
+            job,
+            duplicate=repost,
+            source_weights=settings.REVIEW_SOURCE_WEIGHTS,
+            default_source_weight=settings.REVIEW_DEFAULT_SOURCE_WEIGHT,
+        )
+        batch.append(UpdateOne(
+            {"_id": job["_id"]},
+            {"$set": {"title_company_key": key, "review_priority": priority}},
+        ))
+        if len(batch) >= BATCH_SIZE:
+            updated += pending.bulk_write(batch, ordered=False).modified_count
+            batch = []
+    if batch:
+        updated += pending.bulk_write(batch, ordered=False).modified_count
+    return updated
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        create_indexes()
+        logger.info(f"raw_jobs: added title_company_key to {add_keys(get_raw_jobs())} documents")
+        logger.info(f"pending_jobs: scored {score_pending()} documents")
+    except Exception as e:
+        logger.exception(f"Backfill failed: {e}")
+        sys.exit(1)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Build (or rebuild) the public_jobs read model from approved_jobs.
+
+Copies every approved job into public_jobs through the shared projection,
+removes public documents whose approved job no longer exists, and drops the
+public query indexes that used to live on approved_jobs.
+
+Safe to re-run; run it once when deploying the public_jobs read model and
+whenever PUBLIC_FIELDS or the precomputed facets change.
+
+Usage (from the backend directory):
+    python -m scripts.build_public_jobs
+"""
+import logging
+import sys
+
+from pymongo.errors import OperationFailure
+
+from app.db import get_approved_jobs, get_public_jobs, create_indexes, close_db
+from app.utils.public_jobs import sync_public_jobs
+
+logger = logging.getLogger(__name__)
+
+# Public query indexes now served by public_jobs (see create_indexes)
+OBSOLETE_APPROVED_INDEXES = [
+    "title_text_company_text_location_text",
+    "posted_date_parsed_1",
+    "approved_at_-1_salary_parsed.max_1_salary_parsed.min_1_posted_date_parsed_1",
+    "source_1_approved_at_-1_salary_parsed.max_1_salary_parsed.min_1_posted_date_parsed_1",
+    "location_normalized.geo_2dsphere_source_1",
+]
+
+
+def remove_orphans() -> int:
+    """
+    Delete public documents whose job is no longer in approved_jobs.
+
+    Returns:
+        Number of documents removed
+    """
+    public = get_public_jobs()
+    orphans = public.aggregate([
+        {
+            "$lookup": {
+                "from": get_approved_jobs().name,
+                "localField": "_id",
+                "foreignField": "_id",
+                "as": "approved",
+            }
+        },
+        {"$match": {"approved": {"$size": 0}}},
+        {"$project": {"_id": 1}},
+    ])
+    ids = [doc["_id"] for doc in orphans]
+    if not ids:
+        return 0
+    return public.delete_many({"_id": {"$in": ids}}).deleted_count
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        create_indexes()
+
+        sync_public_jobs({})
+        logger.info(f"public_jobs: synced {get_public_jobs().count_documents({})} documents")
+
+        removed = remove_orphans()
+        logger.info(f"public_jobs: removed {removed} orphaned documents")
+
+        approved = get_approved_jobs()
+        for name in OBSOLETE_APPROVED_INDEXES:
+            try:
+                approved.drop_index(name)
+                logger.info(f"Dropped obsolete index {name} from approved_jobs")
+            except OperationFailure:
+                logger.info(f"Index {name} not present on approved_jobs, nothing to drop")
+    except Exception as e:
+        logger.exception(f"Build failed: {e}")
+        sys.exit(1)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+Convert ISO-string timestamps to native BSON dates.
+
+ingested_at, approved_at, rejected_at and posted_date_parsed used to be
+stored as ISO strings, which compare only lexically, cannot drive TTL
+indexes and take more index space. This migration converts them in place
+with server-side $dateFromString updates (strings that do not parse become
+null) and then rebuilds the indexes, including the configured TTL indexes.
+
+Safe to re-run: only string values are touched.
+
+Usage (from the backend directory):
+    python -m scripts.migrate_datetimes
+"""
+import logging
+import sys
+
+from app.db import (
+    get_raw_jobs,
+    get_pending_jobs,
+    get_approved_jobs,
+    get_public_jobs,
+    get_rejected_jobs,
+    create_indexes,
+    close_db,
+)
+
+logger = logging.getLogger(__name__)
+
+DATETIME_FIELDS = ["ingested_at", "approved_at", "rejected_at", "posted_date_parsed"]
+
+
+def convert_field(collection, field: str) -> int:
+    """
+    Convert string values of one field to dates.
+
+    Returns:
+        Number of documents modified
+    """
+    result = collection.update_many(
+        {field: {"$type": "string"}},
+        [
+            {
+                "$set": {
+                    field: {
+                        "$dateFromString": {
+                            "dateString": f"${field}",
+                            "timezone": "UTC",
+                            "onError": None,
+                        }
+                    }
+                }
+            }
+        ],
+    )
+    return result.modified_count
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        collections = (
+            get_raw_jobs(),
+            get_pending_jobs(),
+            get_approved_jobs(),
+            get_public_jobs(),
+            get_rejected_jobs(),
+        )
+        for collection in collections:
+            for field in DATETIME_FIELDS:
+                modified = convert_field(collection, field)
+                if modified:
+                    logger.info(f"{collection.name}.{field}: converted {modified} documents")
+
+        create_indexes()
+    except Exception as e:
+        logger.exception(f"Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()
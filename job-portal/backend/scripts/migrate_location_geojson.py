@@ -0,0 +1,91 @@
+"""
+Backfill GeoJSON points on location_normalized.
+
+Older documents store geocoded coordinates only as location_normalized.lat/lon,
+which the 2dsphere index cannot serve. This migration adds
+location_normalized.geo = {"type": "Point", "coordinates": [lon, lat]} to every
+geocoded job and drops the legacy lat/lon compound index.
+
+Usage (from the backend directory):
+    python -m scripts.migrate_location_geojson
+"""
+import logging
+import sys
+
+from pymongo.errors import OperationFailure
+
+from app.db import (
+    get_raw_jobs,
+    get_pending_jobs,
+    get_approved_jobs,
+    get_public_jobs,
+    get_rejected_jobs,
+    create_indexes,
+    close_db,
+)
+
+logger = logging.getLogger(__name__)
+
+LEGACY_GEO_INDEX = "location_normalized.lat_1_location_normalized.lon_1"
+
+
+def backfill_geo_points(collection) -> int:
+    """
+    Add a GeoJSON point to geocoded documents that do not have one yet.
+
+    Runs as a single server-side update using an aggregation pipeline.
+
+    Returns:
+        Number of documents modified
+    """
+    result = collection.update_many(
+        {
+            "location_normalized.lat": {"$type": "number"},
+            "location_normalized.lon": {"$type": "number"},
+            "location_normalized.geo": {"$exists": False},
+        },
+        [
+            {
+                "$set": {
+                    "location_normalized.geo": {
+                        "type": "Point",
+                        "coordinates": ["$location_normalized.lon", "$location_normalized.lat"],
+                    }
+                }
+            }
+        ],
+    )
+    return result.modified_count
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+
+    try:
+        collections = (
+            get_raw_jobs(),
+            get_pending_jobs(),
+            get_approved_jobs(),
+            get_public_jobs(),
+            get_rejected_jobs(),
+        )
+        for collection in collections:
+            modified = backfill_geo_points(collection)
+            logger.info(f"{collection.name}: added GeoJSON points to {modified} documents")
+
+        try:
+            get_approved_jobs().drop_index(LEGACY_GEO_INDEX)
+            logger.info(f"Dropped legacy index {LEGACY_GEO_INDEX}")
+        except OperationFailure:
+            logger.info("Legacy lat/lon index not present, nothing to drop")
+
+        create_indexes()
+    except Exception as e:
+        logger.exception(f"Migration failed: {e}")
+        sys.exit(1)
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()
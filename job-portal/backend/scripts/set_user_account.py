@@ -0,0 +1,65 @@
+"""
+Change a user's role or active status, or revoke their tokens.
+
+Changes go through update_user_account, which increments the user's
+token_version, so tokens issued before the change stop working (within
+USER_CACHE_TTL_SECONDS on workers that cached the user). Editing role or
+is_active directly in MongoDB leaves existing tokens valid; if you do,
+also $inc token_version.
+
+Usage (from the backend directory):
+    python -m scripts.set_user_account admin --role admin
+    python -m scripts.set_user_account someone --deactivate
+    python -m scripts.set_user_account someone --revoke-tokens
+"""
+import argparse
+import logging
+import sys
+
+from app.db import close_db
+from app.utils.auth import get_user_by_email, get_user_by_username, update_user_account
+
+logger = logging.getLogger(__name__)
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("user", help="Username or email")
+    parser.add_argument("--role", choices=["admin", "viewer"])
+    status = parser.add_mutually_exclusive_group()
+    status.add_argument("--activate", action="store_true")
+    status.add_argument("--deactivate", action="store_true")
+    parser.add_argument("--revoke-tokens", action="store_true", help="Only revoke existing tokens")
+    return parser.parse_args()
+
+
+def main() -> None:
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(message)s")
+    args = parse_args()
+
+    changes = {}
+    if args.role:
+        changes["role"] = args.role
+    if args.activate or args.deactivate:
+        changes["is_active"] = args.activate
+    if not changes and not args.revoke_tokens:
+        logger.error("Nothing to change (use --role, --activate, --deactivate or --revoke-tokens)")
+        sys.exit(2)
+
+    try:
+        user = get_user_by_username(args.user) or get_user_by_email(args.user)
+        if user is None:
+            logger.error(f"User not found: {args.user}")
+            sys.exit(1)
+
+        user = update_user_account(user.id, changes)
+        logger.info(
+            f"{user.username}: role={user.role}, is_active={user.is_active}, "
+            f"token_version={user.token_version} (earlier tokens revoked)"
+        )
+    finally:
+        close_db()
+
+
+if __name__ == "__main__":
+    main()